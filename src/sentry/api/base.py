@@ -326,6 +326,7 @@ class Endpoint(APIView):
         default_per_page=100,
         max_per_page=100,
         cursor_cls=Cursor,
+        count_hits=None,
         **paginator_kwargs,
     ):
         assert (paginator and not paginator_kwargs) or (paginator_cls and paginator_kwargs)
@@ -343,7 +344,13 @@ class Endpoint(APIView):
                 description=type(self).__name__,
             ) as span:
                 span.set_data("Limit", per_page)
-                cursor_result = paginator.get_result(limit=per_page, cursor=input_cursor)
+                # Only passed when requested, not every paginator accepts it.
+                if count_hits is not None:
+                    cursor_result = paginator.get_result(
+                        limit=per_page, cursor=input_cursor, count_hits=count_hits
+                    )
+                else:
+                    cursor_result = paginator.get_result(limit=per_page, cursor=input_cursor)
         except BadPaginationError as e:
             raise ParseError(detail=str(e))
 
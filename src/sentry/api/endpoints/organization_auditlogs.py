@@ -4,7 +4,7 @@ from rest_framework.response import Response
 
 from sentry.api.bases import OrganizationEndpoint
 from sentry.api.bases.organization import OrganizationAuditPermission
-from sentry.api.paginator import DateTimePaginator
+from sentry.api.paginator import KeysetPaginator
 from sentry.api.serializers import serialize
 from sentry.db.models.fields.bounded import BoundedIntegerField
 from sentry.models import AuditLogEntry
@@ -45,7 +45,8 @@ class OrganizationAuditLogsEndpoint(OrganizationEndpoint):
         return self.paginate(
             request=request,
             queryset=queryset,
-            paginator_cls=DateTimePaginator,
+            paginator_cls=KeysetPaginator,
             order_by="-datetime",
             on_results=lambda x: serialize(x, request.user),
+            count_hits=True,
         )
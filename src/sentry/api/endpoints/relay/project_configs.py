@@ -11,6 +11,7 @@ from sentry.api.base import Endpoint
 from sentry.api.permissions import RelayPermission
 from sentry.models import Organization, OrganizationOption, Project, ProjectKey, ProjectKeyStatus
 from sentry.relay import config, projectconfig_cache
+from sentry.relay.projectconfig_cache.base import get_config_revision
 from sentry.utils import metrics
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,23 @@ class RelayProjectConfigsEndpoint(Endpoint):
         public_keys = request.relay_request_data.get("publicKeys")
         public_keys = set(public_keys or ())
 
+        # Relays may send the revisions of the configs they already have, in
+        # which case configs whose revision still matches are reported as
+        # unchanged instead of being sent again.
+        known_revisions = request.relay_request_data.get("revisions")
+        if known_revisions is not None and not isinstance(known_revisions, dict):
+            return Response("Invalid revisions, expected a mapping of public keys.", 400)
+
+        # The cache holds full configs, so its revisions can only be used to
+        # skip generating configs for relays which receive full configs.
+        if known_revisions and full_config_requested:
+            with start_span(op="relay_fetch_revisions"):
+                cached_revisions = projectconfig_cache.get_revisions(
+                    [pk for pk in public_keys if pk in known_revisions]
+                )
+        else:
+            cached_revisions = {}
+
         project_keys = {}  # type: dict[str, ProjectKey]
         project_ids = set()  # type: set[int]
 
@@ -105,6 +123,7 @@ class RelayProjectConfigsEndpoint(Endpoint):
         metrics.timing("relay_project_configs.orgs_fetched", len(orgs))
 
         configs = {}
+        unchanged = []
         for public_key in public_keys:
             configs[public_key] = {"disabled": True}
 
@@ -120,6 +139,14 @@ class RelayProjectConfigsEndpoint(Endpoint):
             if organization is None:
                 continue
 
+            if (
+                public_key in cached_revisions
+                and cached_revisions[public_key] == known_revisions[public_key]
+            ):
+                del configs[public_key]
+                unchanged.append(public_key)
+                continue
+
             # Prevent organization from being fetched again in quotas.
             project.set_cached_field_value("organization", organization)
 
@@ -136,7 +163,25 @@ class RelayProjectConfigsEndpoint(Endpoint):
         if full_config_requested:
             projectconfig_cache.set_many(configs)
 
-        return Response({"configs": configs}, status=200)
+        if known_revisions is None:
+            return Response({"configs": configs}, status=200)
+
+        # Revisions are computed from the configs as returned, which for
+        # external relays is the restricted config.
+        revisions = {}
+        for public_key, cfg in list(configs.items()):
+            revision = get_config_revision(cfg)
+            if known_revisions.get(public_key) == revision:
+                del configs[public_key]
+                unchanged.append(public_key)
+            else:
+                revisions[public_key] = revision
+
+        metrics.incr("relay_project_configs.unchanged", amount=len(unchanged))
+        return Response(
+            {"configs": configs, "revisions": revisions, "unchanged": sorted(unchanged)},
+            status=200,
+        )
 
     def _post_by_project(self, request: Request, full_config_requested):
         project_ids = set(request.relay_request_data.get("projects") or ())
@@ -1,14 +1,15 @@
 import bisect
 import functools
 import math
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import connections
+from django.db import connections, models
 from django.db.models.functions import Lower
 from django.db.models.sql.datastructures import EmptyResultSet
 from django.utils import timezone
 
+from sentry.utils import json
 from sentry.utils.compat import map, zip
 from sentry.utils.cursors import Cursor, CursorResult, build_cursor
 
@@ -218,6 +219,144 @@ class DateTimePaginator(BasePaginator):
         )
 
 
+def estimate_hits(queryset):
+    """
+    Returns the query planner's estimate of the number of rows matched by
+    `queryset`. Unlike `BasePaginator.count_hits` this does not scan the
+    matching rows, so its cost does not grow with the size of the result set.
+    """
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    cursor = connections[queryset.using_replica().db].cursor()
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPaginator:
+    """
+    Paginates on the composite ``(key, id)`` so that every page is fetched
+    with a range condition on an index instead of an OFFSET scan. The cost of
+    fetching a page therefore does not depend on how deep into the result set
+    it is. The key must be an integer or datetime column, ideally backed by an
+    index together with the queryset's filters.
+
+    The cursor value holds the key of the boundary row (in microseconds for
+    datetimes) and the cursor offset holds its id, so cursors stay compatible
+    with the numeric `Cursor` format. Hits are estimated by the query planner
+    rather than counted.
+
+    Cursors issued by `DateTimePaginator` (milliseconds and a row offset) are
+    recognized by their value and keep being served by it, so endpoints can
+    switch over without breaking cursors clients already hold.
+    """
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    # Any datetime after 1973 exceeds this in microseconds, while millisecond
+    # values of `DateTimePaginator` cursors stay below it until the year 5138.
+    legacy_datetime_cursor_limit = 10 ** 14
+
+    def __init__(self, queryset, order_by="-id", max_limit=MAX_LIMIT, on_results=None):
+        self.order_by = order_by
+        if order_by.startswith("-"):
+            self.key, self.desc = order_by[1:], True
+        else:
+            self.key, self.desc = order_by, False
+        self.queryset = queryset
+        self.max_limit = max_limit
+        self.on_results = on_results
+        self.is_datetime = isinstance(
+            queryset.model._meta.get_field(self.key), models.DateTimeField
+        )
+
+    def get_item_key(self, item):
+        value = getattr(item, self.key)
+        if self.is_datetime:
+            return (value - self.epoch) // timedelta(microseconds=1)
+        return value
+
+    def value_from_cursor(self, cursor):
+        if self.is_datetime:
+            return self.epoch + timedelta(microseconds=cursor.value)
+        return cursor.value
+
+    def build_cursor(self, item, is_prev, has_results):
+        offset = 0 if self.key == "id" else item.id
+        return Cursor(self.get_item_key(item), offset, is_prev, has_results)
+
+    def build_queryset(self, cursor):
+        # Paging backwards walks the index in the opposite direction, the
+        # results are reversed back into the requested order afterwards.
+        desc = self.desc != cursor.is_prev
+        lookup = "lt" if desc else "gt"
+        queryset = self.queryset
+
+        if cursor.value or cursor.offset:
+            value = self.value_from_cursor(cursor)
+            if self.key == "id":
+                queryset = queryset.filter(**{f"id__{lookup}": value})
+            else:
+                # A row comparison, unlike the equivalent OR, can be answered
+                # with a single range scan on a (key, id) index.
+                table = quote_name(queryset.model._meta.db_table)
+                column = quote_name(queryset.model._meta.get_field(self.key).column)
+                operator = "<" if desc else ">"
+                queryset = queryset.extra(
+                    where=[f"({table}.{column}, {table}.id) {operator} (%s, %s)"],
+                    params=[value, cursor.offset],
+                )
+
+        order_by = [self.key] if self.key == "id" else [self.key, "id"]
+        if desc:
+            order_by = [f"-{field}" for field in order_by]
+        return queryset.order_by(*order_by)
+
+    def is_legacy_cursor(self, cursor):
+        return self.is_datetime and 0 < cursor.value < self.legacy_datetime_cursor_limit
+
+    def get_result(self, limit=100, cursor=None, count_hits=False):
+        if cursor is None:
+            cursor = Cursor(0, 0, 0)
+
+        if self.is_legacy_cursor(cursor):
+            paginator = DateTimePaginator(
+                self.queryset, self.order_by, max_limit=self.max_limit, on_results=self.on_results
+            )
+            return paginator.get_result(limit, cursor, count_hits=count_hits)
+
+        limit = min(limit, self.max_limit)
+        has_boundary = bool(cursor.value or cursor.offset)
+
+        results = list(self.build_queryset(cursor)[: limit + 1])
+        has_more = len(results) > limit
+        results = results[:limit]
+
+        if cursor.is_prev:
+            results.reverse()
+            has_prev, has_next = has_more, has_boundary
+        else:
+            has_prev, has_next = has_boundary, has_more
+
+        if results:
+            prev_cursor = self.build_cursor(results[0], True, has_prev)
+            next_cursor = self.build_cursor(results[-1], False, has_next)
+        else:
+            prev_cursor = Cursor(cursor.value, cursor.offset, True, has_prev)
+            next_cursor = Cursor(cursor.value, cursor.offset, False, has_next)
+
+        hits = estimate_hits(self.queryset) if count_hits else None
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(results=results, next=next_cursor, prev=prev_cursor, hits=hits)
+
+
 # TODO(dcramer): previous cursors are too complex at the moment for many things
 # and are only useful for polling situations. The OffsetPaginator ignores them
 # entirely and uses standard paging
@@ -2,14 +2,14 @@ from sentry.api.serializers import Serializer, register, serialize
 from sentry.data_export.base import ExportQueryType
 from sentry.data_export.models import ExportedData
 from sentry.models import User
+from sentry.utils.request_cache import get_loader
 
 
 @register(ExportedData)
 class ExportedDataSerializer(Serializer):
     def get_attrs(self, item_list, user, **kwargs):
         attrs = {}
-        users = User.objects.filter(id__in={item.user_id for item in item_list})
-        user_lookup = {user.id: user for user in users}
+        user_lookup = get_loader(User).load_many(item.user_id for item in item_list)
         for item in item_list:
             user = user_lookup[item.user_id]
             serialized_user = serialize(user)
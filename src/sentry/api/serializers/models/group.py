@@ -62,6 +62,7 @@ from sentry.utils.cache import cache
 from sentry.utils.compat import zip
 from sentry.utils.hashlib import hash_values
 from sentry.utils.json import JSONData
+from sentry.utils.request_cache import get_loader
 from sentry.utils.safe import safe_execute
 from sentry.utils.snuba import Dataset, aliased_query, raw_query
 
@@ -269,10 +270,9 @@ class GroupSerializerBase(Serializer):
             )
         )
         query_groups = get_groups_for_query(groups_by_project, notification_settings_by_scope, user)
-        subscriptions = GroupSubscription.objects.filter(group__in=query_groups, user=user)
-        subscriptions_by_group_id = {
-            subscription.group_id: subscription for subscription in subscriptions
-        }
+        subscriptions_by_group_id = get_loader(
+            GroupSubscription, "group_id", user_id=user.id
+        ).load_many(group.id for group in query_groups)
 
         return get_user_subscriptions_for_groups(
             groups_by_project,
@@ -353,7 +353,7 @@ class GroupSerializerBase(Serializer):
         actor_ids = {r[-1] for r in release_resolutions.values()}
         actor_ids.update(r.actor_id for r in ignore_items.values())
         if actor_ids:
-            users = list(User.objects.filter(id__in=actor_ids, is_active=True))
+            users = [u for u in get_loader(User).load_many(actor_ids).values() if u.is_active]
             actors = {u.id: d for u, d in zip(users, serialize(users, user))}
         else:
             actors = {}
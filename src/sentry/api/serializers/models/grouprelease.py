@@ -7,6 +7,7 @@ from sentry.api.serializers import Serializer, register, serialize
 from sentry.app import tsdb
 from sentry.models import GroupRelease, Release
 from sentry.utils.compat import zip
+from sentry.utils.request_cache import get_loader
 
 StatsPeriod = namedtuple("StatsPeriod", ("segments", "interval"))
 
@@ -14,7 +15,7 @@ StatsPeriod = namedtuple("StatsPeriod", ("segments", "interval"))
 @register(GroupRelease)
 class GroupReleaseSerializer(Serializer):
     def get_attrs(self, item_list, user):
-        release_list = list(Release.objects.filter(id__in=[i.release_id for i in item_list]))
+        release_list = list(get_loader(Release).load_many(i.release_id for i in item_list).values())
         releases = {r.id: d for r, d in zip(release_list, serialize(release_list, user))}
 
         result = {}
@@ -2,12 +2,13 @@ from sentry.api.serializers import Serializer, register, serialize
 from sentry.constants import LOG_LEVELS
 from sentry.models import GroupTombstone, User
 from sentry.utils.compat import zip
+from sentry.utils.request_cache import get_loader
 
 
 @register(GroupTombstone)
 class GroupTombstoneSerializer(Serializer):
     def get_attrs(self, item_list, user):
-        user_list = list(User.objects.filter(id__in=[item.actor_id for item in item_list]))
+        user_list = list(get_loader(User).load_many(item.actor_id for item in item_list).values())
         users = {u.id: d for u, d in zip(user_list, serialize(user_list, user))}
 
         attrs = {}
@@ -1,5 +1,6 @@
 from sentry.api.serializers import Serializer, register, serialize
 from sentry.models import Monitor, Project
+from sentry.utils.request_cache import get_loader
 
 
 @register(Monitor)
@@ -9,7 +10,7 @@ class MonitorSerializer(Serializer):
         projects = {
             d["id"]: d
             for d in serialize(
-                list(Project.objects.filter(id__in=[i.project_id for i in item_list])), user
+                list(get_loader(Project).load_many(i.project_id for i in item_list).values()), user
             )
         }
 
@@ -3,6 +3,7 @@ from typing import List, Mapping, Sequence, Set
 
 from sentry.api.serializers import serialize
 from sentry.models import OrganizationMember, OrganizationMemberTeam, Team, TeamStatus, User
+from sentry.utils.request_cache import get_loader
 
 
 def get_serialized_users_by_id(users_set: Set[User], user: User) -> Mapping[str, User]:
@@ -20,8 +21,7 @@ def get_team_slugs_by_organization_member_id(
         ).values_list("organizationmember_id", "team_id")
     )
     team_ids = {team_id for (_organization_member_id, team_id) in organization_member_tuples}
-    teams = Team.objects.filter(id__in=team_ids)
-    teams_by_id = {team.id: team for team in teams}
+    teams_by_id = get_loader(Team).load_many(team_ids)
 
     results = defaultdict(list)
     for member_id, team_id in organization_member_tuples:
@@ -1,3 +1,4 @@
+import io
 import zlib
 
 from sentry.utils import metrics
@@ -9,11 +10,42 @@ ATTACHMENT_DATA_CHUNK_KEY = "{key}:a:{id}:{chunk_index}"
 
 UNINITIALIZED_DATA = object()
 
+# Number of chunks fetched in a single request when streaming attachment data
+ATTACHMENT_CHUNK_BATCH_SIZE = 8
+
 
 class MissingAttachmentChunks(Exception):
     pass
 
 
+class AttachmentReader(io.RawIOBase):
+    """
+    A read-only file object over a sequence of data chunks.
+
+    Chunks are only pulled from the iterator as they are read, so that at most one chunk is held
+    in memory at a time in addition to the data returned from ``read``.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
 class CachedAttachment:
     def __init__(
         self,
@@ -63,6 +95,19 @@ class CachedAttachment:
         assert self._data is not UNINITIALIZED_DATA
         return self._data
 
+    def open(self):
+        """
+        Returns a file object with the attachment's data.
+
+        Unlike ``data``, this does not load the entire attachment into memory if it is still in
+        the cache, but streams it chunk by chunk.  Reading raises ``MissingAttachmentChunks`` if
+        a chunk is no longer in the cache.
+        """
+        if self._data is UNINITIALIZED_DATA and self._cache is not None:
+            return io.BufferedReader(AttachmentReader(self._cache.iter_data(self)))
+
+        return io.BytesIO(self.data)
+
     def delete(self):
         for key in self.chunk_keys:
             self._cache.inner.delete(key)
@@ -144,23 +189,41 @@ class BaseAttachmentCache:
         return CachedAttachment(key=key, cache=self, **attachment)
 
     def get(self, key):
-        result = self.inner.get(ATTACHMENT_META_KEY.format(key=key), raw=False)
+        return self.get_many([key])[key]
 
-        for id, attachment in enumerate(result or ()):
-            attachment.setdefault("id", id)
-            attachment.setdefault("key", key)
-            yield CachedAttachment(cache=self, **attachment)
+    def get_many(self, keys):
+        """
+        Returns the attachments stored at each of the given cache keys.
 
-    def get_data(self, attachment):
-        data = []
+        The metadata of all keys is fetched at once.
+        """
+        results = self.inner.get_many(
+            [ATTACHMENT_META_KEY.format(key=key) for key in keys], raw=False
+        )
 
-        for key in attachment.chunk_keys:
-            raw_data = self.inner.get(key, raw=True)
+        rv = {}
+        for key, result in zip(keys, results):
+            attachments = rv[key] = []
+            for id, attachment in enumerate(result or ()):
+                attachment.setdefault("id", id)
+                attachment.setdefault("key", key)
+                attachments.append(CachedAttachment(cache=self, **attachment))
+
+        return rv
+
+    def _get_chunks(self, keys):
+        for raw_data in self.inner.get_many(keys, raw=True):
             if raw_data is None:
                 raise MissingAttachmentChunks()
-            data.append(zlib.decompress(raw_data))
+            yield zlib.decompress(raw_data)
 
-        return b"".join(data)
+    def iter_data(self, attachment):
+        chunk_keys = list(attachment.chunk_keys)
+        for i in range(0, len(chunk_keys), ATTACHMENT_CHUNK_BATCH_SIZE):
+            yield from self._get_chunks(chunk_keys[i : i + ATTACHMENT_CHUNK_BATCH_SIZE])
+
+    def get_data(self, attachment):
+        return b"".join(self._get_chunks(list(attachment.chunk_keys)))
 
     def delete(self, key):
         for attachment in self.get(key):
@@ -38,6 +38,12 @@ class BaseCache(local):
     def get(self, key, version=None, raw=False):
         raise NotImplementedError
 
+    def get_many(self, keys, version=None, raw=False):
+        """
+        Returns the values for all given keys in order, with ``None`` for missing keys.
+        """
+        return [self.get(key, version=version, raw=raw) for key in keys]
+
     def _mark_transaction(self, op):
         """
         Mark transaction with a tag so we can identify system components that rely
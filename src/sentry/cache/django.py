@@ -15,3 +15,8 @@ class DjangoCache(BaseCache):
     def get(self, key, version=None, raw=False):
         return cache.get(key, version=version or self.version)
         self._mark_transaction("get")
+
+    def get_many(self, keys, version=None, raw=False):
+        values = cache.get_many(keys, version=version or self.version)
+        self._mark_transaction("get_many")
+        return [values.get(key) for key in keys]
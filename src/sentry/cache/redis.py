@@ -44,6 +44,22 @@ class CommonRedisCache(BaseCache):
 
         return result
 
+    def get_many(self, keys, version=None, raw=False):
+        results = self._get_many([self.make_key(key, version=version) for key in keys])
+        if not raw:
+            results = [json.loads(result) if result is not None else None for result in results]
+
+        self._mark_transaction("get_many")
+
+        return results
+
+    def _get_many(self, keys):
+        # Clustered clients split a pipeline into one request per node.
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.get(key)
+            return pipeline.execute()
+
 
 class RbCache(CommonRedisCache):
     def __init__(self, **options):
@@ -51,6 +67,12 @@ class RbCache(CommonRedisCache):
         client = cluster.get_routing_client()
         CommonRedisCache.__init__(self, client, **options)
 
+    def _get_many(self, keys):
+        # The routing client batches the reads into one MGET per host.
+        with self.client.map() as client:
+            promises = [client.get(key) for key in keys]
+        return [promise.value for promise in promises]
+
 
 # Confusing legacy name for RbCache.  We don't actually have a pure redis cache
 RedisCache = RbCache
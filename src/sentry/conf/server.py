@@ -1358,6 +1358,9 @@ SENTRY_RATELIMITER = "sentry.ratelimits.base.RateLimiter"
 SENTRY_RATELIMITER_ENABLED = True
 SENTRY_RATELIMITER_OPTIONS = {}
 
+# Number of sorted sets the requests of a concurrent rate limit are spread over
+SENTRY_CONCURRENT_RATE_LIMIT_SHARDS = 1
+
 # The default value for project-level quotas
 SENTRY_DEFAULT_MAX_EVENTS_PER_MINUTE = "90%"
 
@@ -1699,6 +1702,12 @@ SENTRY_TEAM_ROLES = (
 SENTRY_OPTIONS = {}
 SENTRY_DEFAULT_OPTIONS = {}
 
+# When set, every process keeps a snapshot of all options stored in the
+# database and serves reads from it. The snapshot is reloaded when the options
+# version in the cache changes, which is checked at most once per this many
+# seconds.
+SENTRY_OPTIONS_SNAPSHOT_INTERVAL = None
+
 # You should not change this setting after your database has been created
 # unless you have altered all schemas first
 SENTRY_USE_BIG_INTS = False
@@ -2533,6 +2542,12 @@ SENTRY_REALTIME_METRICS_OPTIONS = {
     # This backoff is only applied to automatic changes to project eligibility, and has zero effect
     # on any manually-triggered changes to a project's presence in the LPQ.
     "backoff_timer": 5 * 60,
+    # Number of increments each process buffers in memory before writing them to redis in a
+    # single pipeline.  0 writes every increment immediately.
+    "buffer_size": 0,
+    # Maximum number of seconds increments are buffered before being written to redis,
+    # regardless of "buffer_size".  Only applies while buffering is enabled.
+    "flush_interval": 5,
 }
 
 # XXX(meredith): Temporary metrics indexer
@@ -1,4 +1,5 @@
 import itertools
+import time
 from datetime import timedelta
 from uuid import uuid4
 
@@ -17,10 +18,10 @@ class BulkDeleteQuery:
         self.order_by = order_by
         self.using = router.db_for_write(model)
 
-    def execute(self, chunk_size=10000):
+    def _get_where_clause(self, extra=()):
         quote_name = connections[self.using].ops.quote_name
 
-        where = []
+        where = list(extra)
         if self.dtfield and self.days is not None:
             where.append(
                 "{} < '{}'::timestamptz".format(
@@ -32,9 +33,13 @@ class BulkDeleteQuery:
             where.append(f"project_id = {self.project_id}")
 
         if where:
-            where_clause = "where {}".format(" and ".join(where))
-        else:
-            where_clause = ""
+            return "where {}".format(" and ".join(where))
+        return ""
+
+    def execute(self, chunk_size=10000):
+        quote_name = connections[self.using].ops.quote_name
+
+        where_clause = self._get_where_clause()
 
         if self.order_by:
             if self.order_by[0] == "-":
@@ -67,10 +72,87 @@ class BulkDeleteQuery:
 
     def _continuous_query(self, query):
         results = True
+        deleted = 0
         cursor = connections[self.using].cursor()
         while results:
             cursor.execute(query)
             results = cursor.rowcount > 0
+            deleted += max(cursor.rowcount, 0)
+        return deleted
+
+    def get_id_ranges(self, num_ranges):
+        """
+        Split the matching rows into up to ``num_ranges`` contiguous primary
+        key ranges of equal width, as ``(min_id, max_id)`` pairs where
+        ``max_id`` is exclusive. Only the id span of rows matching the query
+        is split, so that the ranges are not spent on rows that are kept.
+        """
+        cursor = connections[self.using].cursor()
+        cursor.execute(
+            "select min(id), max(id) from {table} {where}".format(
+                table=self.model._meta.db_table, where=self._get_where_clause()
+            )
+        )
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return []
+
+        max_id += 1
+        width = max(-(-(max_id - min_id) // num_ranges), 1)
+        return [(lo, min(lo + width, max_id)) for lo in range(min_id, max_id, width)]
+
+    def execute_range(
+        self,
+        min_id,
+        max_id,
+        chunk_size=10000,
+        target_duration=None,
+        min_chunk_size=100,
+        max_chunk_size=100000,
+    ):
+        """
+        Delete all matching rows with a primary key in ``[min_id, max_id)``.
+        Restricting each query to a range keeps them on the primary key index
+        and lets several ranges of a table be deleted concurrently.
+
+        If ``target_duration`` (in seconds) is given, the chunk size is
+        adjusted after each query to approach that duration. Returns the
+        number of deleted rows.
+        """
+        where_clause = self._get_where_clause(extra=[f"id >= {int(min_id)}", f"id < {int(max_id)}"])
+
+        query = """
+            delete from {table}
+            where id = any(array(
+                select id
+                from {table}
+                {where}
+                limit %s
+            ));
+        """.format(
+            table=self.model._meta.db_table,
+            where=where_clause,
+        )
+
+        deleted = 0
+        cursor = connections[self.using].cursor()
+        while True:
+            start = time.time()
+            cursor.execute(query, [chunk_size])
+            duration = time.time() - start
+
+            if cursor.rowcount <= 0:
+                break
+
+            deleted += cursor.rowcount
+
+            if target_duration:
+                if duration > target_duration:
+                    chunk_size = max(chunk_size // 2, min_chunk_size)
+                elif duration < target_duration / 2:
+                    chunk_size = min(chunk_size * 2, max_chunk_size)
+
+        return deleted
 
     def iterator(self, chunk_size=100, batch_size=100000):
         assert self.days is not None
@@ -1,5 +1,7 @@
 import logging
+import pickle
 import threading
+import time
 import weakref
 from contextlib import contextmanager
 from typing import Any, Generator, Generic, Mapping, MutableMapping, Optional, Sequence, Tuple
@@ -16,6 +18,7 @@ from sentry.db.models.query import create_or_update
 from sentry.utils.cache import cache
 from sentry.utils.compat import zip
 from sentry.utils.hashlib import md5_text
+from sentry.utils.lru import LRUCache
 
 logger = logging.getLogger("sentry")
 
@@ -23,6 +26,11 @@ _local_cache = threading.local()
 _local_cache_generation = 0
 _local_cache_enabled = False
 
+# How long a process that finds another one already loading a value into the
+# model cache waits for it before going to the database itself.
+FILL_WAIT = 0.05
+FILL_LOCK_TIMEOUT = 5
+
 
 class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  # type: ignore
     lookup_handlers = {"iexact": lambda x: x.upper()}
@@ -40,9 +48,37 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         self.cache_fields = kwargs.pop("cache_fields", [])
         self.cache_ttl = kwargs.pop("cache_ttl", 60 * 5)
         self._cache_version: Optional[str] = kwargs.pop("cache_version", None)
+        #: Seconds instances looked up via ``get_from_cache`` are also kept in
+        #: process memory, in front of the shared cache. Saves and deletes in
+        #: the same process invalidate them right away, changes made elsewhere
+        #: become visible after at most this long. Disabled if ``0``, and
+        #: unless the ``model-cache.process-cache-enabled`` option is set.
+        self.local_cache_ttl = kwargs.pop("local_cache_ttl", 0)
+        self.local_cache_size = kwargs.pop("local_cache_size", 1000)
         self.__local_cache = threading.local()
+        self.__process_cache = self.__make_process_cache()
         super().__init__(*args, **kwargs)
 
+    def __make_process_cache(self) -> Optional[LRUCache]:
+        if not self.local_cache_ttl:
+            return None
+        return LRUCache(self.local_cache_size, self.local_cache_ttl, jitter=0.2)
+
+    def __get_enabled_process_cache(self) -> Optional[LRUCache]:
+        if self.__process_cache is None:
+            return None
+
+        from sentry import options
+
+        if not options.get("model-cache.process-cache-enabled"):
+            return None
+        return self.__process_cache
+
+    def clear_process_cache(self) -> None:
+        """Drops all instances kept in process memory by ``local_cache_ttl``."""
+        if self.__process_cache is not None:
+            self.__process_cache.clear()
+
     @staticmethod
     @contextmanager
     def local_cache() -> Generator[None, None, None]:
@@ -98,12 +134,14 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         # we can't serialize weakrefs
         d.pop("_BaseManager__cache", None)
         d.pop("_BaseManager__local_cache", None)
+        d.pop("_BaseManager__process_cache", None)
         return d
 
     def __setstate__(self, state: Mapping[str, Any]) -> None:
         self.__dict__.update(state)
         # TODO(typing): Basically everywhere else we set this to `threading.local()`.
         self.__local_cache = weakref.WeakKeyDictionary()  # type: ignore
+        self.__process_cache = self.__make_process_cache()
 
     def __class_prepared(self, sender: Any, **kwargs: Any) -> None:
         """
@@ -142,6 +180,7 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         pk_name = instance._meta.pk.name
         pk_names = ("pk", pk_name)
         pk_val = instance.pk
+        self.__uncache_process(instance)
         for key in self.cache_fields:
             if key in pk_names:
                 continue
@@ -188,6 +227,7 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         Drops instance from all cache storages.
         """
         pk_name = instance._meta.pk.name
+        self.__uncache_process(instance)
         for key in self.cache_fields:
             if key in ("pk", pk_name):
                 continue
@@ -204,6 +244,58 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
     def __get_lookup_cache_key(self, **kwargs: Any) -> str:
         return make_key(self.model, "modelcache", kwargs)
 
+    def __uncache_process(self, instance: M) -> None:
+        """
+        Drops all lookups of an instance, including those by values it had
+        when it was loaded, from the process cache.
+        """
+        if self.__process_cache is None:
+            return
+
+        pk_name = instance._meta.pk.name
+        cache_keys = [self.__get_lookup_cache_key(**{pk_name: instance.pk})]
+        previous = self.__cache.get(instance, {})
+        for key in self.cache_fields:
+            if key in ("pk", pk_name):
+                continue
+            cache_keys.append(
+                self.__get_lookup_cache_key(**{key: self.__value_for_field(instance, key)})
+            )
+            if key in previous:
+                cache_keys.append(self.__get_lookup_cache_key(**{key: previous[key]}))
+        self.__process_cache.delete_many(cache_keys)
+
+    def __set_process_cache(self, cache_key: str, instance: M) -> None:
+        # Instances are kept pickled so that every caller gets its own copy.
+        db = instance._state.db
+        instance._state.db = None
+        try:
+            self.__process_cache.set(cache_key, pickle.dumps(instance))  # type: ignore
+        finally:
+            instance._state.db = db
+
+    def __get_process_cache(self, cache_key: str, **kwargs: Any) -> Optional[M]:
+        value = self.__process_cache.get(cache_key)  # type: ignore
+        if value is None:
+            return None
+        instance: M = pickle.loads(value)
+        instance._state.db = router.db_for_read(self.model, **kwargs)
+        return instance
+
+    def __wait_for_fill(self, cache_key: str) -> Tuple[Any, Optional[str]]:
+        """
+        Claims loading a missing value into the cache for this process.
+
+        Returns the lock to release once the cache was populated, or the value
+        from the cache if another process was already loading it.
+        """
+        lock_key = f"{cache_key}:fill"
+        if cache.add(lock_key, 1, timeout=FILL_LOCK_TIMEOUT, version=self.cache_version):
+            return None, lock_key
+
+        time.sleep(FILL_WAIT)
+        return cache.get(cache_key, version=self.cache_version), None
+
     def __value_for_field(self, instance: M, key: str) -> Any:
         """
         Return the cacheable value for a field.
@@ -232,6 +324,9 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         intermediate value.  Callee is responsible for making sure
         the cache key is cleared on save.
         """
+        return self.__get_from_cache(self.__get_enabled_process_cache(), **kwargs)
+
+    def __get_from_cache(self, process_cache: Optional[LRUCache], **kwargs: Any) -> M:
         if not self.cache_fields or len(kwargs) > 1:
             raise ValueError("We cannot cache this query. Just hit the database.")
 
@@ -256,19 +351,47 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
                 if result is not None:
                     return result
 
+            if process_cache is not None:
+                if key == pk_name:
+                    result = self.__get_process_cache(cache_key, **kwargs)
+                    if result is not None:
+                        if local_cache is not None:
+                            local_cache[cache_key] = result
+                        return result
+                else:
+                    pk_val = process_cache.get(cache_key)
+                    if pk_val is not None:
+                        return self.__get_from_cache(process_cache, **{pk_name: pk_val})
+
             retval = cache.get(cache_key, version=self.cache_version)
+            fill_lock = None
+            if retval is None and process_cache is not None:
+                retval, fill_lock = self.__wait_for_fill(cache_key)
+
             if retval is None:
-                result = self.get(**kwargs)
-                # Ensure we're pushing it into the cache
-                self.__post_save(instance=result)
+                try:
+                    result = self.get(**kwargs)
+                    # Ensure we're pushing it into the cache
+                    self.__post_save(instance=result)
+                finally:
+                    if fill_lock is not None:
+                        cache.delete(fill_lock, version=self.cache_version)
                 if local_cache is not None:
                     local_cache[cache_key] = result
+                if process_cache is not None:
+                    if key != pk_name:
+                        process_cache.set(cache_key, result.pk)
+                    self.__set_process_cache(
+                        self.__get_lookup_cache_key(**{pk_name: result.pk}), result
+                    )
                 return result
 
             # If we didn't look up by pk we need to hit the reffed
             # key
             if key != pk_name:
-                result = self.get_from_cache(**{pk_name: retval})
+                if process_cache is not None:
+                    process_cache.set(cache_key, retval)
+                result = self.__get_from_cache(process_cache, **{pk_name: retval})
                 if local_cache is not None:
                     local_cache[cache_key] = result
                 return result
@@ -285,6 +408,9 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
                 logger.error("Cache response returned invalid value %r", retval)
                 return self.get(**kwargs)
 
+            if process_cache is not None:
+                self.__set_process_cache(cache_key, retval)
+
             retval._state.db = router.db_for_read(self.model, **kwargs)
 
             # Explicitly typing to satisfy mypy.
@@ -417,6 +543,8 @@ class BaseManager(DjangoBaseManager.from_queryset(BaseQuerySet), Generic[M]):  #
         pk_name = self.model._meta.pk.name
         cache_key = self.__get_lookup_cache_key(**{pk_name: instance_id})
         cache.delete(cache_key, version=self.cache_version)
+        if self.__process_cache is not None:
+            self.__process_cache.delete(cache_key)
 
     def post_save(self, instance: M, **kwargs: Any) -> None:
         """
@@ -39,6 +39,12 @@ The deletions system provides two base classes to cover common scenarios:
 - ``BulkModelDeletionTask`` Deletes records in bulk using a single query. This strategy is well
   suited to removing records that don't have any relations.
 
+Bulk deletions have no child relations of their own. The ``deletions.bulk-concurrency`` option
+allows deleting consecutive bulk children concurrently, as long as their models have no foreign keys
+between them, so the order of the relations still holds. The
+``deletions.bulk-chunk-target-duration`` option tunes the chunk size of each table towards a
+target duration per query.
+
 If your model has child relations that need to be cleaned up you should implement a custom
 deletion task. Doing so requires a few steps:
 
@@ -1,6 +1,12 @@
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from django.core.cache import cache
+from django.db import connections
+
+from sentry import options
 from sentry.constants import ObjectStatus
 from sentry.utils import metrics
 from sentry.utils.query import bulk_delete_objects
@@ -28,6 +34,60 @@ class ModelRelation(BaseRelation):
         super().__init__(params=params, task=task)
 
 
+def _run_task(task):
+    # If we want smaller tasks then this also has to return when has_more is true.
+    # This could significant increase the number of tasks we spawn. Get better estimates
+    # by collecting metrics.
+    has_more = True
+    while has_more:
+        has_more = task.chunk()
+        if has_more:
+            metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
+
+
+def _run_task_in_thread(task):
+    try:
+        _run_task(task)
+    finally:
+        # Connections are per thread, close the ones opened by this thread.
+        connections.close_all()
+
+
+def _references(model, other):
+    return any(
+        field.is_relation and field.related_model is other for field in model._meta.get_fields()
+    )
+
+
+def _group_concurrent_tasks(tasks):
+    """
+    Splits ``tasks`` into consecutive groups that can be run concurrently,
+    keeping their order. Only bulk deletions of models without foreign keys
+    between them share a group.
+    """
+    groups = []
+    models = set()
+    for task in tasks:
+        if (
+            groups
+            and isinstance(task, BulkModelDeletionTask)
+            and isinstance(groups[-1][-1], BulkModelDeletionTask)
+            and not any(
+                task.model is model
+                or _references(task.model, model)
+                or _references(model, task.model)
+                for model in models
+            )
+        ):
+            groups[-1].append(task)
+        else:
+            groups.append([task])
+            models = set()
+        if isinstance(task, BulkModelDeletionTask):
+            models.add(task.model)
+    return groups
+
+
 class BaseDeletionTask:
     logger = logging.getLogger("sentry.deletions.async")
 
@@ -127,22 +187,35 @@ class BaseDeletionTask:
 
     def delete_children(self, relations):
         # Ideally this runs through the deletion manager
-        for relation in relations:
-            task = self.manager.get(
+        tasks = [
+            self.manager.get(
                 transaction_id=self.transaction_id,
                 actor_id=self.actor_id,
                 task=relation.task,
                 **relation.params,
             )
+            for relation in relations
+        ]
+
+        concurrency = options.get("deletions.bulk-concurrency")
+        if concurrency <= 1:
+            for task in tasks:
+                _run_task(task)
+            return False
+
+        # Bulk deletions do not have child relations of their own, so
+        # consecutive ones can run concurrently as long as none of their
+        # models reference each other. Relations are otherwise deleted in the
+        # order they were given, which callers rely on for foreign keys.
+        for group in _group_concurrent_tasks(tasks):
+            if len(group) == 1:
+                _run_task(group[0])
+                continue
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for _ in executor.map(_run_task_in_thread, group):
+                    pass
 
-            # If we want smaller tasks then this also has to return when has_more is true.
-            # This could significant increase the number of tasks we spawn. Get better estimates
-            # by collecting metrics.
-            has_more = True
-            while has_more:
-                has_more = task.chunk()
-                if has_more:
-                    metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
         return False
 
     def mark_deletion_in_progress(self, instance_list):
@@ -259,14 +332,59 @@ class BulkModelDeletionTask(ModelDeletionTask):
     """
 
     DEFAULT_CHUNK_SIZE = 10000
+    MIN_CHUNK_SIZE = 100
+    MAX_CHUNK_SIZE = 100000
 
     def __init__(self, manager, model, query, partition_key=None, **kwargs):
+        # Only tune the chunk size if the relation did not ask for a specific one.
+        self.tune_chunk_size = kwargs.get("chunk_size") is None
+
         super().__init__(manager, model, query, **kwargs)
 
         self.partition_key = partition_key
 
+        if self.tune_chunk_size and options.get("deletions.bulk-chunk-target-duration"):
+            self.chunk_size = cache.get(self.get_chunk_size_cache_key(), self.chunk_size)
+
+    def get_chunk_size_cache_key(self):
+        return f"deletions:chunk-size:{self.model._meta.db_table}"
+
     def chunk(self):
-        return self.delete_instance_bulk()
+        target_duration = options.get("deletions.bulk-chunk-target-duration")
+        if not target_duration or not self.tune_chunk_size:
+            return self.delete_instance_bulk()
+
+        start = time.time()
+        has_more = self.delete_instance_bulk()
+        duration = time.time() - start
+
+        # The final, empty chunk says nothing about how long a chunk takes.
+        if has_more:
+            self.update_chunk_size(duration, target_duration)
+
+        return has_more
+
+    def update_chunk_size(self, duration, target_duration):
+        """
+        Adjust the chunk size so that deleting a chunk of this table takes
+        about ``target_duration`` seconds. The tuned size is shared with later
+        tasks deleting from the same table.
+        """
+        if duration > target_duration:
+            chunk_size = max(self.chunk_size // 2, self.MIN_CHUNK_SIZE)
+        elif duration < target_duration / 2:
+            chunk_size = min(self.chunk_size * 2, self.MAX_CHUNK_SIZE)
+        else:
+            return
+
+        if chunk_size != self.chunk_size:
+            self.chunk_size = chunk_size
+            cache.set(self.get_chunk_size_cache_key(), chunk_size, 3600)
+            metrics.timing(
+                "deletions.bulk_chunk_size",
+                chunk_size,
+                tags={"model": self.model.__name__},
+            )
 
     def delete_instance_bulk(self):
         try:
@@ -4,7 +4,6 @@ import logging
 import random
 import time
 from datetime import datetime, timedelta
-from io import BytesIO
 
 import sentry_sdk
 from django.conf import settings
@@ -1417,14 +1416,6 @@ def discard_event(job, attachments):
 
     project = job["event"].project
 
-    quotas.refund(
-        project,
-        key=job["project_key"],
-        timestamp=job["start_time"],
-        category=job["category"],
-        quantity=1,
-    )
-
     track_outcome(
         org_id=project.organization_id,
         project_id=job["project_id"],
@@ -1453,14 +1444,10 @@ def discard_event(job, attachments):
             quantity=attachment.size,
         )
 
+    refunds = [(project, job["project_key"], job["category"], 1)]
     if attachment_quantity:
-        quotas.refund(
-            project,
-            key=job["project_key"],
-            timestamp=job["start_time"],
-            category=DataCategory.ATTACHMENT,
-            quantity=attachment_quantity,
-        )
+        refunds.append((project, job["project_key"], DataCategory.ATTACHMENT, attachment_quantity))
+    quotas.refund_many(refunds, timestamp=job["start_time"])
 
     metrics.incr(
         "events.discarded",
@@ -1613,9 +1600,19 @@ def save_attachment(
     else:
         timestamp = datetime.utcnow().replace(tzinfo=UTC)
 
+    file = File.objects.create(
+        name=attachment.name,
+        type=attachment.type,
+        headers={"Content-Type": attachment.content_type},
+    )
+
     try:
-        data = attachment.data
+        # Stream the attachment from the cache so that only a single blob needs to be held in
+        # memory at a time.
+        file.putfile(attachment.open(), blob_size=settings.SENTRY_ATTACHMENT_BLOB_SIZE)
     except MissingAttachmentChunks:
+        file.delete()
+
         track_outcome(
             org_id=project.organization_id,
             project_id=project.id,
@@ -1630,13 +1627,6 @@ def save_attachment(
         logger.exception("Missing chunks for cache_key=%s", cache_key)
         return
 
-    file = File.objects.create(
-        name=attachment.name,
-        type=attachment.type,
-        headers={"Content-Type": attachment.content_type},
-    )
-    file.putfile(BytesIO(data), blob_size=settings.SENTRY_ATTACHMENT_BLOB_SIZE)
-
     EventAttachment.objects.create(
         event_id=event_id,
         project_id=project.id,
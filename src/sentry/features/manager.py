@@ -12,13 +12,14 @@ from typing import (
     MutableSet,
     Optional,
     Sequence,
+    Tuple,
     Type,
 )
 
 import sentry_sdk
 from django.conf import settings
 
-from .base import Feature
+from .base import Feature, ProjectFeature
 from .exceptions import FeatureNotRegistered
 
 if TYPE_CHECKING:
@@ -64,35 +65,19 @@ class RegisteredFeatureManager:
         """
         raise NotImplementedError
 
-    def has_for_batch(
+    def _resolve_batch(
         self,
         name: str,
         organization: "Organization",
-        objects: Sequence["Project"],
+        objects: Iterable["Project"],
         actor: Optional["User"] = None,
-    ) -> Mapping["Project", bool]:
+    ) -> Tuple[MutableMapping["Project", bool], MutableSet["Project"]]:
         """
-        Determine in a batch if a feature is enabled.
-
-        This applies the same procedure as ``FeatureManager.has``, but with a
-        performance benefit where the objects being checked all belong to the
-        same organization. The objects are entities (e.g., projects) with the
-        common parent organization, as would be passed individually to ``has``.
-
-        Feature handlers that depend only on organization attributes, and not
-        on attributes of the individual objects being checked, will generally
-        perform faster if this method is used in preference to ``has``.
-
-        The return value is a dictionary with the objects as keys. Each value
-        is what would be returned if the key were passed to ``has``.
-
-        The entity handler can handle both batch project/organization
-        contexts so it'll likely have an entirely different implementation
-        of this functionality.
+        Run the registered handlers of a feature over a batch of objects.
 
-        >>> FeatureManager.has_for_batch('projects:feature', organization, [project1, project2], actor=request.user)
+        Returns the flags the handlers resolved along with the objects none of
+        them had an opinion on.
         """
-
         result = dict()
         remaining = set(objects)
 
@@ -118,6 +103,39 @@ class RegisteredFeatureManager:
                         result[obj] = flag
                 span.set_data("Flags Found", batch_size - len(remaining))
 
+        return result, remaining
+
+    def has_for_batch(
+        self,
+        name: str,
+        organization: "Organization",
+        objects: Sequence["Project"],
+        actor: Optional["User"] = None,
+    ) -> Mapping["Project", bool]:
+        """
+        Determine in a batch if a feature is enabled.
+
+        This applies the same procedure as ``FeatureManager.has``, but with a
+        performance benefit where the objects being checked all belong to the
+        same organization. The objects are entities (e.g., projects) with the
+        common parent organization, as would be passed individually to ``has``.
+
+        Feature handlers that depend only on organization attributes, and not
+        on attributes of the individual objects being checked, will generally
+        perform faster if this method is used in preference to ``has``.
+
+        The return value is a dictionary with the objects as keys. Each value
+        is what would be returned if the key were passed to ``has``.
+
+        The entity handler can handle both batch project/organization
+        contexts so it'll likely have an entirely different implementation
+        of this functionality.
+
+        >>> FeatureManager.has_for_batch('projects:feature', organization, [project1, project2], actor=request.user)
+        """
+
+        result, remaining = self._resolve_batch(name, organization, objects, actor)
+
         default_flag = settings.SENTRY_FEATURES.get(name, False)
         for obj in remaining:
             result[obj] = default_flag
@@ -206,14 +224,39 @@ class FeatureManager(RegisteredFeatureManager):
 
         >>> FeatureManager.has('organizations:feature', organization, actor=request.user)
 
+        Within a request or task the result is memoized per feature, entity
+        and actor.
         """
         actor = kwargs.pop("actor", None)
-        feature = self.get(name, *args, **kwargs)
+        memo = self._get_memo()
+        cache_key = None
+        if memo is not None:
+            cache_key = _make_cache_key(name, args, kwargs, actor, skip_entity)
+            if cache_key is not None and cache_key in memo:
+                return memo[cache_key]
+
+        rv = self._has(self.get(name, *args, **kwargs), actor, skip_entity=skip_entity)
+        if cache_key is not None:
+            memo[cache_key] = rv
+        return rv
+
+    def _get_memo(self) -> Optional[MutableMapping[Any, bool]]:
+        from sentry.utils.request_cache import get_scoped_cache
 
+        return get_scoped_cache((FeatureManager, id(self)))
+
+    def _has(
+        self,
+        feature: Feature,
+        actor: Optional["User"],
+        skip_entity: Optional[bool] = False,
+        skip_handlers: bool = False,
+    ) -> bool:
         # Check registered feature handlers
-        rv = self._get_handler(feature, actor)
-        if rv is not None:
-            return rv
+        if not skip_handlers:
+            rv = self._get_handler(feature, actor)
+            if rv is not None:
+                return rv
 
         if self._entity_handler and not skip_entity:
             rv = self._entity_handler.has(feature, actor)
@@ -227,6 +270,50 @@ class FeatureManager(RegisteredFeatureManager):
         # Features are by default disabled if no plugin or default enables them
         return False
 
+    def has_many(
+        self,
+        checks: Iterable[Tuple[str, Any]],
+        actor: Optional["User"] = None,
+    ) -> Mapping[Tuple[str, Any], bool]:
+        """
+        Determine if features are enabled for many (feature name, entity)
+        pairs at once.
+
+        Project features for projects of the same organization are resolved
+        with a single pass over the registered handlers, see
+        ``has_for_batch``. Unlike ``has_for_batch``, the entity handler is
+        consulted for anything the registered handlers leave undecided.
+        Results are shared with the memoization of ``has``.
+
+        >>> FeatureManager.has_many([('projects:feature', project1), ('organizations:feature', organization)], actor=request.user)
+        """
+        memo = self._get_memo()
+        result = {}
+        batches: MutableMapping[Tuple[str, int], List[Any]] = defaultdict(list)
+        for name, obj in checks:
+            cache_key = _make_cache_key(name, (obj,), {}, actor, False)
+            if memo is not None and cache_key is not None and cache_key in memo:
+                result[(name, obj)] = memo[cache_key]
+            elif self._get_feature_class(name) is ProjectFeature:
+                batches[(name, obj.organization_id)].append(obj)
+            else:
+                result[(name, obj)] = self.has(name, obj, actor=actor)
+
+        for (name, _), projects in batches.items():
+            resolved, remaining = self._resolve_batch(
+                name, projects[0].organization, projects, actor
+            )
+            for project in remaining:
+                resolved[project] = self._has(self.get(name, project), actor, skip_handlers=True)
+
+            for project, flag in resolved.items():
+                result[(name, project)] = flag
+                cache_key = _make_cache_key(name, (project,), {}, actor, False)
+                if memo is not None and cache_key is not None:
+                    memo[cache_key] = flag
+
+        return result
+
     def batch_has(
         self,
         feature_names: Sequence[str],
@@ -249,6 +336,39 @@ class FeatureManager(RegisteredFeatureManager):
             return None
 
 
+def _make_cache_key(
+    name: str,
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+    actor: Optional["User"],
+    skip_entity: Optional[bool],
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Build the memoization key of a feature check, or None if one of the
+    arguments cannot be identified reliably.
+    """
+
+    def identify(value: Any) -> Optional[Tuple[str, Any]]:
+        if value is None or isinstance(value, (str, int)):
+            return ("", value)
+        if hasattr(value, "_meta") and value.pk is not None:
+            return (value._meta.label, value.pk)
+        if hasattr(value, "slug") and isinstance(value.slug, str):
+            return (type(value).__name__, value.slug)
+        return None
+
+    parts = [identify(v) for v in args]
+    parts.extend(identify(v) for v in kwargs.values())
+    if getattr(actor, "is_anonymous", False):
+        actor_part: Optional[Tuple[str, Any]] = ("anonymous", None)
+    else:
+        actor_part = identify(actor)
+    if actor_part is None or any(part is None for part in parts):
+        return None
+
+    return (name, tuple(parts), tuple(kwargs), actor_part, bool(skip_entity))
+
+
 class FeatureCheckBatch:
     """
     A batch of objects to be checked for a feature flag.
@@ -2,8 +2,10 @@ import logging
 import posixpath
 from typing import Set
 
+from django.core.cache import cache
 from symbolic import ParseDebugIdError, normalize_debug_id
 
+from sentry import options
 from sentry.lang.native.error import SymbolicationFailed, write_error
 from sentry.lang.native.symbolicator import Symbolicator
 from sentry.lang.native.utils import (
@@ -18,9 +20,12 @@ from sentry.lang.native.utils import (
     signal_from_data,
 )
 from sentry.models import EventError, Project
+from sentry.reprocessing import get_reprocessing_revision
 from sentry.stacktraces.functions import trim_function_name
 from sentry.stacktraces.processing import find_stacktraces_in_data
+from sentry.utils import metrics
 from sentry.utils.compat import zip
+from sentry.utils.hashlib import md5_text
 from sentry.utils.in_app import is_known_third_party, is_optional_package
 from sentry.utils.safe import get_path, set_path, setdefault_path, trim
 
@@ -29,6 +34,18 @@ logger = logging.getLogger(__name__)
 
 IMAGE_STATUS_FIELDS = frozenset(("unwind_status", "debug_status"))
 
+# Image fields which differ between events for the same image, and therefore are never served from
+# the frame cache
+IMAGE_EVENT_FIELDS = frozenset(("image_addr", "image_size", "image_vmaddr", "code_file"))
+
+# Registers holding the instruction pointer on the supported architectures. Symbolicator only looks at
+# the registers to tell whether the first frame's address is the crashing instruction itself.
+IP_REGISTERS = ("pc", "rip", "eip", "ip")
+
+# Image statuses which are kept in the frame cache. Anything else, e.g. missing debug files or
+# failed downloads, may change with the next attempt and is always sent to symbolicator.
+CACHEABLE_IMAGE_STATUSES = frozenset(("found", "unused"))
+
 # Attachment type used for minidump files
 MINIDUMP_ATTACHMENT_TYPE = "event.minidump"
 
@@ -337,6 +354,163 @@ def get_frames_for_symbolication(frames, data, modules):
     return rv
 
 
+def _parse_addr(value):
+    try:
+        if isinstance(value, str):
+            return int(value, 16) if value[:2].lower() == "0x" else int(value)
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _find_module(frame, modules):
+    """Returns the index of the module a frame sent to symbolicator belongs to, and the offset
+    of the frame within that module."""
+    addr = _parse_addr(frame.get("instruction_addr"))
+    if addr is None:
+        return None, None
+
+    addr_mode = frame.get("addr_mode")
+    if addr_mode is not None:
+        idx = int(addr_mode[4:])
+        return (idx, addr) if idx < len(modules) else (None, None)
+
+    for idx, module in enumerate(modules):
+        image_addr = _parse_addr(module.get("image_addr"))
+        image_size = module.get("image_size")
+        if image_addr is not None and image_size and image_addr <= addr < image_addr + image_size:
+            return idx, addr - image_addr
+
+    return None, None
+
+
+def _get_frame_cache_keys(cache_scope, stacktraces, modules, signal):
+    """
+    Computes the frame cache keys for all frames about to be sent to symbolicator, and the image
+    cache keys of all modules referenced by those frames.
+
+    Frames are identified by the debug id of their image, their offset within it and their trust,
+    so that addresses are shared between processes with different load addresses.  Since
+    symbolicator treats the first frame of a stacktrace differently, that frame gets a separate
+    key which also covers the signal and whether the instruction pointer register points at it.
+    Other registers differ between every crash and are left out.  Frames which cannot be
+    attributed to an image get no key.
+    """
+    frame_keys = []
+    image_keys = {}
+
+    for stacktrace in stacktraces:
+        keys = []
+        registers = stacktrace.get("registers") or {}
+        ip_addr = next(
+            (_parse_addr(registers[name]) for name in IP_REGISTERS if name in registers), None
+        )
+        for frame_idx, frame in enumerate(stacktrace["frames"]):
+            idx, offset = _find_module(frame, modules)
+            debug_id = modules[idx].get("debug_id") if idx is not None else None
+            if not debug_id:
+                keys.append(None)
+                continue
+
+            if frame_idx == 0:
+                is_ip = ip_addr is not None and ip_addr == _parse_addr(
+                    frame.get("instruction_addr")
+                )
+                position = f"first:{signal}:{is_ip}"
+            else:
+                position = "-"
+            trust = frame.get("trust")
+            keys.append(
+                "symbolicator:frame:%s"
+                % md5_text(f"{cache_scope}:{debug_id}:{offset}:{trust}:{position}").hexdigest()
+            )
+            image_keys[idx] = (
+                "symbolicator:image:%s" % md5_text(f"{cache_scope}:{debug_id}").hexdigest()
+            )
+        frame_keys.append(keys)
+
+    return frame_keys, image_keys
+
+
+def _get_cached_response(stacktraces, modules, frame_keys, image_keys):
+    """
+    Builds a symbolicator response from the frame cache.
+
+    Returns `None` unless every frame and every image referenced by a frame is cached, since
+    symbolicator needs to see complete stacktraces to produce the same results.
+    """
+    if not all(key for keys in frame_keys for key in keys):
+        return None
+
+    keys = [key for keys in frame_keys for key in keys]
+    keys.extend(image_keys.values())
+    cached = cache.get_many(keys)
+    if len(cached) < len(set(keys)):
+        return None
+
+    complete_modules = []
+    for idx, module in enumerate(modules):
+        if idx in image_keys:
+            complete_image = dict(cached[image_keys[idx]])
+        else:
+            # Symbolicator does not look at images without frames
+            complete_image = dict.fromkeys(IMAGE_STATUS_FIELDS, "unused")
+        complete_image.update((k, v) for k, v in module.items() if k in IMAGE_EVENT_FIELDS)
+        complete_modules.append(complete_image)
+
+    complete_stacktraces = []
+    for stacktrace, keys in zip(stacktraces, frame_keys):
+        complete_frames = []
+        for frame_idx, (frame, key) in enumerate(zip(stacktrace["frames"], keys)):
+            for complete_frame in cached[key]:
+                complete_frame = dict(complete_frame)
+                complete_frame["original_index"] = frame_idx
+                complete_frame["instruction_addr"] = frame["instruction_addr"]
+                if frame.get("addr_mode") is not None:
+                    complete_frame["addr_mode"] = frame["addr_mode"]
+                complete_frames.append(complete_frame)
+        complete_stacktraces.append({"frames": complete_frames})
+
+    return {"status": "completed", "modules": complete_modules, "stacktraces": complete_stacktraces}
+
+
+def _cache_response(response, frame_keys, image_keys, timeout):
+    values = {}
+
+    for idx, key in image_keys.items():
+        complete_image = response["modules"][idx]
+        # An unused image was not looked at, which says nothing about other events
+        if complete_image.get("debug_status") == "unused":
+            continue
+        if any(
+            complete_image.get(field, "unused") not in CACHEABLE_IMAGE_STATUSES
+            for field in IMAGE_STATUS_FIELDS
+        ):
+            continue
+        values[key] = {k: v for k, v in complete_image.items() if k not in IMAGE_EVENT_FIELDS}
+
+    for complete_stacktrace, keys in zip(response["stacktraces"], frame_keys):
+        complete_frames_by_idx = {}
+        for complete_frame in complete_stacktrace.get("frames") or ():
+            complete_frames_by_idx.setdefault(complete_frame["original_index"], []).append(
+                {
+                    k: v
+                    for k, v in complete_frame.items()
+                    if k not in ("original_index", "instruction_addr", "addr_mode")
+                }
+            )
+
+        for idx, complete_frames in complete_frames_by_idx.items():
+            if keys[idx] is None:
+                continue
+            # Frames that could not be symbolicated may be once debug files show up
+            if any(frame.get("status") != "symbolicated" for frame in complete_frames):
+                continue
+            values[keys[idx]] = complete_frames
+
+    cache.set_many(values, timeout)
+
+
 def process_payload(data):
     project = Project.objects.get_from_cache(id=data["project"])
 
@@ -365,7 +539,24 @@ def process_payload(data):
 
     signal = signal_from_data(data)
 
-    response = symbolicator.process_payload(stacktraces=stacktraces, modules=modules, signal=signal)
+    response = None
+    fill_frame_cache = False
+    frame_cache_ttl = options.get("symbolicator.frame-cache-ttl")
+    if frame_cache_ttl:
+        # Uploading debug files bumps the reprocessing revision, which keeps
+        # results from before the upload from being served.
+        cache_scope = f"{symbolicator.config_hash}:{get_reprocessing_revision(project)}"
+        frame_keys, image_keys = _get_frame_cache_keys(cache_scope, stacktraces, modules, signal)
+        response = _get_cached_response(stacktraces, modules, frame_keys, image_keys)
+        metrics.incr(
+            "symbolicator.frame_cache", tags={"result": "miss" if response is None else "hit"}
+        )
+
+    if response is None:
+        response = symbolicator.process_payload(
+            stacktraces=stacktraces, modules=modules, signal=signal
+        )
+        fill_frame_cache = bool(frame_cache_ttl)
 
     if not _handle_response_status(data, response):
         return data
@@ -379,6 +570,9 @@ def process_payload(data):
 
     assert len(stacktraces) == len(response["stacktraces"]), (stacktraces, response)
 
+    if fill_frame_cache:
+        _cache_response(response, frame_keys, image_keys, frame_cache_ttl)
+
     for sinfo, complete_stacktrace in zip(stacktrace_infos, response["stacktraces"]):
         complete_frames_by_idx = {}
         for complete_frame in complete_stacktrace.get("frames") or ():
@@ -19,6 +19,7 @@ from sentry.models import Organization
 from sentry.net.http import Session
 from sentry.tasks.symbolication import RetrySymbolication
 from sentry.utils import json, metrics, safe
+from sentry.utils.hashlib import md5_text
 
 MAX_ATTEMPTS = 3
 REQUEST_CACHE_TIMEOUT = 3600
@@ -153,6 +154,14 @@ class Symbolicator:
 
         self.task_id_cache_key = _task_id_cache_key_for_event(project.id, event_id)
 
+    @property
+    def config_hash(self):
+        """
+        A hash of the sources and options sent along with every request, which identifies the
+        configuration that symbolication results depend on.
+        """
+        return md5_text(json.dumps([self.sess.sources, self.sess.options])).hexdigest()
+
     def _process(self, create_task, task_name):
         task_id = default_cache.get(self.task_id_cache_key)
         json_response = None
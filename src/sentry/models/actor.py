@@ -138,15 +138,15 @@ class ActorTuple(namedtuple("Actor", "id type")):
 
     @classmethod
     def resolve_dict(cls, actor_dict: Mapping[int, "Actor"]) -> Mapping[int, Union["Team", "User"]]:
+        from sentry.utils.request_cache import get_loader
+
         actors_by_type = defaultdict(list)
         for actor in actor_dict.values():
             actors_by_type[actor.type].append(actor)
 
         resolved_actors = {}
         for type, actors in actors_by_type.items():
-            resolved_actors[type] = {
-                actor.id: actor for actor in type.objects.filter(id__in=[a.id for a in actors])
-            }
+            resolved_actors[type] = get_loader(type).load_many(a.id for a in actors)
 
         return {key: resolved_actors[value.type][value.id] for key, value in actor_dict.items()}
 
@@ -1,3 +1,4 @@
+import pickle
 import re
 
 from django.db import IntegrityError, models, transaction
@@ -8,9 +9,23 @@ from sentry.db.models import BoundedPositiveIntegerField, FlexibleForeignKey, Mo
 from sentry.utils import metrics
 from sentry.utils.cache import cache
 from sentry.utils.hashlib import md5_text
+from sentry.utils.lru import LRUCache
 
 OK_NAME_PATTERN = re.compile(ENVIRONMENT_NAME_PATTERN)
 
+# Environments are never renamed, so lookups are also kept in process memory
+# for a little while in front of the shared cache, unless the
+# ``model-cache.process-cache-enabled`` option is turned off.
+_process_cache = LRUCache(max_size=1000, ttl=60, jitter=0.2)
+
+
+def _get_enabled_process_cache():
+    from sentry import options
+
+    if not options.get("model-cache.process-cache-enabled"):
+        return None
+    return _process_cache
+
 
 class EnvironmentProject(Model):
     __include_in_export__ = False
@@ -60,17 +75,40 @@ class Environment(Model):
     def get_name_or_default(cls, name):
         return name or ""
 
+    @classmethod
+    def clear_process_cache(cls):
+        _process_cache.clear()
+
+    @classmethod
+    def _get_from_process_cache(cls, process_cache, cache_key):
+        if process_cache is None:
+            return None
+        # Instances are kept pickled so that every caller gets its own copy.
+        value = process_cache.get(cache_key)
+        return pickle.loads(value) if value is not None else None
+
+    @classmethod
+    def _set_process_cache(cls, process_cache, cache_key, env):
+        if process_cache is not None:
+            process_cache.set(cache_key, pickle.dumps(env))
+
     @classmethod
     def get_for_organization_id(cls, organization_id, name):
         name = cls.get_name_or_default(name)
 
         cache_key = cls.get_cache_key(organization_id, name)
 
+        process_cache = _get_enabled_process_cache()
+        env = cls._get_from_process_cache(process_cache, cache_key)
+        if env is not None:
+            return env
+
         env = cache.get(cache_key)
         if env is None:
             env = cls.objects.get(name=name, organization_id=organization_id)
             cache.set(cache_key, env, 3600)
 
+        cls._set_process_cache(process_cache, cache_key, env)
         return env
 
     @classmethod
@@ -80,22 +118,33 @@ class Environment(Model):
 
             cache_key = cls.get_cache_key(project.organization_id, name)
 
-            env = cache.get(cache_key)
-            if env is None:
-                metrics_tags["cache_hit"] = "false"
-                env = cls.objects.get_or_create(name=name, organization_id=project.organization_id)[
-                    0
-                ]
-                cache.set(cache_key, env, 3600)
+            process_cache = _get_enabled_process_cache()
+            env = cls._get_from_process_cache(process_cache, cache_key)
+            if env is not None:
+                metrics_tags["cache_hit"] = "local"
             else:
-                metrics_tags["cache_hit"] = "true"
-
-            env.add_project(project)
+                env = cache.get(cache_key)
+                if env is None:
+                    metrics_tags["cache_hit"] = "false"
+                    env = cls.objects.get_or_create(
+                        name=name, organization_id=project.organization_id
+                    )[0]
+                    cache.set(cache_key, env, 3600)
+                else:
+                    metrics_tags["cache_hit"] = "true"
+                cls._set_process_cache(process_cache, cache_key, env)
+
+            env._add_project(project, process_cache=process_cache)
 
             return env
 
     def add_project(self, project, is_hidden=None):
+        self._add_project(project, is_hidden, process_cache=_get_enabled_process_cache())
+
+    def _add_project(self, project, is_hidden=None, process_cache=None):
         cache_key = f"envproj:c:{self.id}:{project.id}"
+        if process_cache is not None and process_cache.get(cache_key) is not None:
+            return
 
         if cache.get(cache_key) is None:
             try:
@@ -108,6 +157,9 @@ class Environment(Model):
                 # We've already created the object, should still cache the action.
                 cache.set(cache_key, 1, 3600)
 
+        if process_cache is not None:
+            process_cache.set(cache_key, 1)
+
     @staticmethod
     def get_name_from_path_segment(segment):
         # In cases where the environment name is passed as a URL path segment,
@@ -71,6 +71,32 @@ class ProjectOptionManager(OptionManager["Project"]):
         values: Mapping[str, Value] = self._option_cache.get(cache_key, {})
         return values
 
+    def get_all_values_bulk(self, projects: Sequence[Project]) -> Mapping[int, Mapping[str, Value]]:
+        """
+        Bulk variant of `get_all_values`. Options that are not cached yet are
+        loaded with a single query, and the results are kept in the local cache
+        so that subsequent `get_value` calls for these projects are served from
+        memory.
+        """
+        keys = {self._make_key(project.id): project.id for project in projects}
+        missing = {
+            key: project_id for key, project_id in keys.items() if key not in self._option_cache
+        }
+
+        if missing:
+            cached = cache.get_many(list(missing))
+            self._option_cache.update(cached)
+
+            uncached = {key: project_id for key, project_id in missing.items() if key not in cached}
+            if uncached:
+                results: dict[str, dict[str, Value]] = {key: {} for key in uncached}
+                for option in self.filter(project__in=list(uncached.values())):
+                    results[self._make_key(option.project_id)][option.key] = option.value
+                cache.set_many(results)
+                self._option_cache.update(results)
+
+        return {project_id: self._option_cache.get(key, {}) for key, project_id in keys.items()}
+
     def reload_cache(self, project_id: int, update_reason: str) -> Mapping[str, Value]:
         if update_reason != "projectoption.get_all_values":
             schedule_update_config_cache(
@@ -77,6 +77,7 @@ class ProjectKey(Model):
         # store projectkeys in memcached for longer than other models,
         # specifically to make the relay_projectconfig endpoint faster.
         cache_ttl=60 * 30,
+        local_cache_ttl=10,
     )
 
     data = JSONField()
@@ -122,6 +122,11 @@ register(
 # it break everywhere.
 register("symbolicator.ignored_sources", type=Sequence, default=(), flags=FLAG_ALLOW_EMPTY)
 
+# Number of seconds symbolicated frames and image statuses are cached for, keyed by the image, the
+# offset of the frame within the image and the symbolication config.  Events whose frames are all
+# cached are not sent to symbolicator at all.  0 disables the cache.
+register("symbolicator.frame-cache-ttl", default=0)
+
 # Backend chart rendering via chartcuterie
 register("chart-rendering.enabled", default=False, flags=FLAG_ALLOW_EMPTY | FLAG_PRIORITIZE_DISK)
 register(
@@ -219,6 +224,14 @@ register("snuba.track-outcomes-sample-rate", default=0.0)
 
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
 register("snuba.tagstore.cache-tagkeys-rate", default=0.0, flags=FLAG_PRIORITIZE_DISK)
+# How long (in seconds) the tag keys and top values of a group are cached for. The cache is
+# invalidated implicitly when the group's last_seen changes. <=0 disables the cache.
+register("snuba.tagstore.group-tag-values-cache-ttl", default=0, flags=FLAG_PRIORITIZE_DISK)
+
+# Release health stats buckets that ended longer ago than this (in seconds) are considered
+# immutable and are served from cache. Sessions are bucketed by their start, and Relay accepts
+# updates for sessions started up to 5 days ago, so buckets only close after that.
+register("release-health.closed-bucket-grace-seconds", default=5 * 24 * 3600)
 
 # Kafka Publisher
 register("kafka-publisher.raw-event-sample-rate", default=0.0)
@@ -373,6 +386,10 @@ register("subscriptions-query.sample-rate", default=0.01)
 # removed once it is fully rolled out.
 register("symbolicate-event.low-priority.metrics.submission-rate", default=0.0)
 
+# Whether symbolicate_event tasks waiting on symbolicator are rescheduled instead of sleeping in
+# the worker until symbolicator is done.
+register("symbolicate-event.defer-retries", default=False)
+
 # This is to enable the ingestion of suspect spans by project ids.
 register("performance.suspect-spans-ingestion-projects", default={})
 # This is to enable the ingestion of suspect spans by project groups.
@@ -389,3 +406,16 @@ register("reprocessing2.drop-delete-old-primary-hash", default=[])
 # contents are a list of project IDs to message types to be randomly assigned
 # e.g. [{"project_id": 2, "message_type": "error"}, {"project_id": 3, "message_type": "transaction"}]
 register("kafka.send-project-events-to-random-partitions", default=[])
+
+# Maximum number of independent bulk deletions (tables without child relations)
+# that a deletion task runs concurrently. 1 deletes them one after another.
+register("deletions.bulk-concurrency", default=1)
+
+# Target duration in seconds of a single bulk deletion chunk. Chunk sizes are
+# tuned per table towards this target; 0 disables tuning.
+register("deletions.bulk-chunk-target-duration", default=0.0)
+
+# Keeps instances of models with a ``local_cache_ttl`` in process memory, in
+# front of the shared cache. Changes made in other processes only become
+# visible once the local entry expires, so this is disabled by default.
+register("model-cache.process-cache-enabled", default=False)
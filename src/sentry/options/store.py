@@ -2,6 +2,7 @@ import logging
 from collections import namedtuple
 from random import random
 from time import time
+from uuid import uuid4
 
 from django.db.utils import OperationalError, ProgrammingError
 from django.utils import timezone
@@ -14,6 +15,10 @@ Key = namedtuple("Key", ("name", "default", "type", "flags", "ttl", "grace", "ca
 CACHE_FETCH_ERR = "Unable to fetch option cache for %s"
 CACHE_UPDATE_ERR = "Unable to update option cache for %s"
 
+# Changed whenever any option is written, so that processes holding a
+# snapshot of all options know when to reload it.
+VERSION_CACHE_KEY = "o:version"
+
 logger = logging.getLogger("sentry")
 
 
@@ -38,9 +43,10 @@ class OptionsStore:
     OptionsManager instead, unless you need raw access to something.
     """
 
-    def __init__(self, cache=None, ttl=None):
+    def __init__(self, cache=None, ttl=None, snapshot_interval=None):
         self.cache = cache
         self.ttl = ttl
+        self.snapshot_interval = snapshot_interval
         self.flush_local_cache()
 
     @cached_property
@@ -56,6 +62,10 @@ class OptionsStore:
         """
         Fetches a value from the options store.
         """
+        snapshot = self.get_snapshot(silent=silent)
+        if snapshot is not None:
+            return snapshot.get(key.name)
+
         result = self.get_cache(key, silent=silent)
         if result is not None:
             return result
@@ -138,6 +148,63 @@ class OptionsStore:
         # in grace, too bad. The value is considered bad.
         return None
 
+    def get_snapshot(self, silent=False):
+        """
+        Returns a mapping of all stored option values, or None if snapshots
+        are disabled or could not be loaded.
+        """
+        if not self.snapshot_interval or self.cache is None:
+            return None
+
+        now = time()
+        snapshot = self._snapshot
+        if snapshot is not None and now < self._snapshot_checked_at + self.snapshot_interval:
+            return snapshot
+
+        try:
+            version = self.cache.get(VERSION_CACHE_KEY)
+            if version is None:
+                version = uuid4().hex
+                self.cache.add(VERSION_CACHE_KEY, version, None)
+        except Exception:
+            if not silent:
+                logger.warning(
+                    CACHE_FETCH_ERR,
+                    VERSION_CACHE_KEY,
+                    extra={"key": VERSION_CACHE_KEY},
+                    exc_info=True,
+                )
+            # Keep serving the snapshot we have rather than hammering the
+            # database while the cache is unavailable.
+            return snapshot
+
+        if snapshot is None or version != self._snapshot_version:
+            try:
+                snapshot = dict(self.model.objects.values_list("key", "value"))
+            except Exception:
+                if not silent:
+                    logger.exception("option.failed-snapshot")
+                return self._snapshot
+
+            self._snapshot = snapshot
+            self._snapshot_version = version
+
+        self._snapshot_checked_at = now
+        return snapshot
+
+    def bump_version(self):
+        """
+        Signal to every process holding a snapshot that options changed.
+        """
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(VERSION_CACHE_KEY, uuid4().hex, None)
+        except Exception:
+            logger.warning(
+                CACHE_UPDATE_ERR, VERSION_CACHE_KEY, extra={"key": VERSION_CACHE_KEY}, exc_info=True
+            )
+
     def get_store(self, key, silent=False):
         """
         Attempt to fetch value from the database. If successful,
@@ -191,6 +258,10 @@ class OptionsStore:
             model=self.model, key=key.name, values={"value": value, "last_updated": timezone.now()}
         )
 
+        if self._snapshot is not None:
+            self._snapshot = {**self._snapshot, key.name: value}
+        self.bump_version()
+
     def set_cache(self, key, value):
         if self.cache is None:
             return None
@@ -222,6 +293,10 @@ class OptionsStore:
     def delete_store(self, key):
         self.model.objects.filter(key=key.name).delete()
 
+        if self._snapshot is not None:
+            self._snapshot = {k: v for k, v in self._snapshot.items() if k != key.name}
+        self.bump_version()
+
     def delete_cache(self, key):
         cache_key = key.cache_key
         try:
@@ -269,6 +344,9 @@ class OptionsStore:
         Empty store's local in-process cache.
         """
         self._local_cache = {}
+        self._snapshot = None
+        self._snapshot_version = None
+        self._snapshot_checked_at = 0
 
     def maybe_clean_local_cache(self, **kwargs):
         # Periodically force an expire on the local cache.
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
     projects = __realtime_metrics_store__.projects
     get_counts_for_project = __realtime_metrics_store__.get_counts_for_project
     get_durations_for_project = __realtime_metrics_store__.get_durations_for_project
+    get_counts_for_projects = __realtime_metrics_store__.get_counts_for_projects
+    get_durations_for_projects = __realtime_metrics_store__.get_durations_for_projects
     get_lpq_projects = __realtime_metrics_store__.get_lpq_projects
     is_lpq_project = __realtime_metrics_store__.is_lpq_project
     add_project_to_lpq = __realtime_metrics_store__.add_project_to_lpq
@@ -1,7 +1,7 @@
 import collections
 import dataclasses
 import enum
-from typing import ClassVar, DefaultDict, Iterable, List, Set, Union
+from typing import ClassVar, DefaultDict, Dict, Iterable, List, Set, Union
 
 from sentry.utils.services import Service
 
@@ -140,6 +140,8 @@ class RealtimeMetricsStore(Service):
         "projects",
         "get_counts_for_project",
         "get_durations_for_project",
+        "get_counts_for_projects",
+        "get_durations_for_projects",
         "get_lpq_projects",
         "add_project_to_lpq",
         "remove_projects_from_lpq",
@@ -197,6 +199,24 @@ class RealtimeMetricsStore(Service):
         """
         raise NotImplementedError
 
+    def get_counts_for_projects(
+        self, project_ids: Iterable[int], timestamp: int
+    ) -> Dict[int, BucketedCounts]:
+        """
+        Returns the bucketed counts of symbolicator requests for each of the given projects, in
+        the same shape as returned by `get_counts_for_project`.
+        """
+        raise NotImplementedError
+
+    def get_durations_for_projects(
+        self, project_ids: Iterable[int], timestamp: int
+    ) -> Dict[int, BucketedDurationsHistograms]:
+        """
+        Returns the bucketed symbolication duration histograms for each of the given projects, in
+        the same shape as returned by `get_durations_for_project`.
+        """
+        raise NotImplementedError
+
     def get_lpq_projects(self) -> Set[int]:
         """
         Fetches the list of projects that are currently using the low priority queue.
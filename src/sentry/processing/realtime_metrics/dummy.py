@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Iterable, Set
+from typing import Any, Dict, Iterable, Set
 
 from . import base
 
@@ -29,6 +29,22 @@ class DummyRealtimeMetricsStore(base.RealtimeMetricsStore):
     ) -> base.BucketedDurationsHistograms:
         return base.BucketedDurationsHistograms(timestamp=-1, width=0, histograms=[])
 
+    def get_counts_for_projects(
+        self, project_ids: Iterable[int], timestamp: int
+    ) -> Dict[int, base.BucketedCounts]:
+        return {
+            project_id: self.get_counts_for_project(project_id, timestamp)
+            for project_id in project_ids
+        }
+
+    def get_durations_for_projects(
+        self, project_ids: Iterable[int], timestamp: int
+    ) -> Dict[int, base.BucketedDurationsHistograms]:
+        return {
+            project_id: self.get_durations_for_project(project_id, timestamp)
+            for project_id in project_ids
+        }
+
     def get_lpq_projects(self) -> Set[int]:
         return set()
 
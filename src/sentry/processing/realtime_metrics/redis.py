@@ -1,15 +1,24 @@
+import atexit
 import logging
+import os
+import threading
+import time
+from collections import defaultdict
 from itertools import chain
-from typing import Iterable, Sequence, Set
+from typing import DefaultDict, Dict, Iterable, Optional, Sequence, Set, Tuple
 
 from sentry.exceptions import InvalidConfiguration
 from sentry.utils import redis
+from sentry.utils.iterators import chunked
 
 from . import base
 
 # redis key for entry storing current list of LPQ members
 LPQ_MEMBERS_KEY = "store.symbolicate-event-lpq-selected"
 
+# number of projects whose metrics are fetched in a single round trip
+BULK_READ_CHUNK_SIZE = 500
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +33,8 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
         duration_bucket_size: int,
         duration_time_window: int,
         backoff_timer: int,
+        buffer_size: int = 0,
+        flush_interval: float = 0,
     ) -> None:
         """Creates a RedisRealtimeMetricsStore.
 
@@ -34,6 +45,12 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
 
         "duration_bucket_size" and "duration_time_window" function like their "counter*" siblings,
         but for processing duration metrics.
+
+        "buffer_size" and "flush_interval" enable local buffering of increments: they are
+        aggregated in memory and written in a single pipeline once "buffer_size" increments are
+        pending, and by a background thread every "flush_interval" seconds. Pending increments
+        are also flushed when the process exits. A "buffer_size" of 0, the default, writes every
+        increment immediately, while a "flush_interval" of 0 only flushes once the buffer is full.
         """
 
         self.cluster = redis.redis_clusters.get(cluster)
@@ -43,9 +60,21 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
         self._duration_time_window = duration_time_window
         self._prefix = "symbolicate_event_low_priority"
         self._backoff_timer = backoff_timer
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._pending_counts: DefaultDict[Tuple[int, int], int] = defaultdict(int)
+        self._pending_durations: DefaultDict[Tuple[int, int, int], int] = defaultdict(int)
+        self._pending_projects: Dict[int, int] = {}
+        self._pending = 0
+        self._flusher_pid: Optional[int] = None
 
         self.validate()
 
+        if self._buffer_size:
+            atexit.register(self._flush_at_exit)
+
     def validate(self) -> None:
         if not 0 < self._counter_bucket_size <= 60:
             raise InvalidConfiguration("counter bucket size must be 1-60 seconds")
@@ -59,6 +88,9 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
         if self._duration_time_window < 60:
             raise InvalidConfiguration("duration time window must be at least a minute")
 
+        if self._buffer_size < 0 or self._flush_interval < 0:
+            raise InvalidConfiguration("buffer size and flush interval must not be negative")
+
     def _counter_key_prefix(self) -> str:
         return f"{self._prefix}:counter:{self._counter_bucket_size}"
 
@@ -68,6 +100,99 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
     def _backoff_key_prefix(self) -> str:
         return f"{self._prefix}:backoff"
 
+    def _projects_key(self) -> str:
+        return f"{self._prefix}:projects:{self._counter_bucket_size}:{self._duration_bucket_size}"
+
+    def _projects_ttl(self) -> int:
+        return max(
+            self._counter_time_window + self._counter_bucket_size,
+            self._duration_time_window + self._duration_bucket_size,
+        )
+
+    def _buckets(self, bucket_size: int, time_window: int, timestamp: int) -> range:
+        now_bucket = timestamp - timestamp % bucket_size
+
+        first_bucket = timestamp - time_window
+        first_bucket = first_bucket - first_bucket % bucket_size
+
+        return range(first_bucket, now_bucket + bucket_size, bucket_size)
+
+    def _record(self, project_id: int, timestamp: int) -> bool:
+        """Marks the project as active at ``timestamp`` after buffering an increment for it.
+
+        Must be called while holding the lock.  Returns whether the buffer is due for a flush.
+        """
+        self._ensure_flusher()
+        if timestamp > self._pending_projects.get(project_id, timestamp - 1):
+            self._pending_projects[project_id] = timestamp
+        self._pending += 1
+        return self._pending >= self._buffer_size
+
+    def _ensure_flusher(self) -> None:
+        """Starts the thread flushing the buffer every "flush_interval" seconds.
+
+        Must be called while holding the lock.  Threads do not survive a fork, so the thread is
+        started lazily by the process that actually buffers increments.
+        """
+        if not self._flush_interval or self._flusher_pid == os.getpid():
+            return
+
+        self._flusher_pid = os.getpid()
+        threading.Thread(
+            target=self._run_flusher, name="realtime-metrics-flusher", daemon=True
+        ).start()
+
+    def _run_flusher(self) -> None:
+        while True:
+            time.sleep(self._flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush realtime metrics")
+
+    def _flush_at_exit(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush realtime metrics on exit")
+
+    def flush(self) -> None:
+        """Writes all buffered increments to redis.
+
+        Increments are aggregated per key, so a flush issues one command per touched bucket
+        rather than one per increment, and all of them share a single pipeline.  Clustered
+        clients split the pipeline per shard.
+        """
+        with self._lock:
+            counts, self._pending_counts = self._pending_counts, defaultdict(int)
+            durations, self._pending_durations = self._pending_durations, defaultdict(int)
+            projects, self._pending_projects = self._pending_projects, {}
+            self._pending = 0
+
+        if not projects:
+            return
+
+        with self.cluster.pipeline(transaction=False) as pipeline:
+            for (project_id, timestamp), count in counts.items():
+                key = f"{self._counter_key_prefix()}:{project_id}:{timestamp}"
+                pipeline.incrby(key, count)
+                pipeline.expire(key, self._counter_time_window + self._counter_bucket_size)
+
+            for (project_id, timestamp, duration), count in durations.items():
+                key = f"{self._duration_key_prefix()}:{project_id}:{timestamp}"
+                pipeline.hincrby(key, duration, count)
+                pipeline.expire(key, self._duration_time_window + self._duration_bucket_size)
+
+            # Maintain an index of recently active projects so that `projects()` does not need
+            # to scan the keyspace.  Scores are the most recent bucket a project reported into,
+            # which allows dropping projects that have fallen out of both time windows.
+            projects_key = self._projects_key()
+            projects_ttl = self._projects_ttl()
+            pipeline.zadd(projects_key, projects)
+            pipeline.zremrangebyscore(projects_key, "-inf", max(projects.values()) - projects_ttl)
+            pipeline.expire(projects_key, projects_ttl)
+            pipeline.execute()
+
     def _register_backoffs(self, project_ids: Sequence[int]) -> None:
         if len(project_ids) == 0 or self._backoff_timer == 0:
             return
@@ -99,12 +224,21 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
 
         timestamp -= timestamp % self._counter_bucket_size
 
-        key = f"{self._counter_key_prefix()}:{project_id}:{timestamp}"
+        if not self._buffer_size:
+            key = f"{self._counter_key_prefix()}:{project_id}:{timestamp}"
 
-        with self.cluster.pipeline() as pipeline:
-            pipeline.incr(key)
-            pipeline.expire(key, self._counter_time_window + self._counter_bucket_size)
-            pipeline.execute()
+            with self.cluster.pipeline() as pipeline:
+                pipeline.incr(key)
+                pipeline.expire(key, self._counter_time_window + self._counter_bucket_size)
+                pipeline.execute()
+            return
+
+        with self._lock:
+            self._pending_counts[(project_id, timestamp)] += 1
+            flush = self._record(project_id, timestamp)
+
+        if flush:
+            self.flush()
 
     def increment_project_duration_counter(
         self, project_id: int, timestamp: int, duration: int
@@ -116,23 +250,44 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
         the time of the event in seconds since the UNIX epoch and "duration" the processing time in seconds.
         """
         timestamp -= timestamp % self._duration_bucket_size
-
-        key = f"{self._duration_key_prefix()}:{project_id}:{timestamp}"
         duration -= duration % 10
 
-        with self.cluster.pipeline() as pipeline:
-            pipeline.hincrby(key, duration, 1)
-            pipeline.expire(key, self._duration_time_window + self._duration_bucket_size)
-            pipeline.execute()
+        if not self._buffer_size:
+            key = f"{self._duration_key_prefix()}:{project_id}:{timestamp}"
+
+            with self.cluster.pipeline() as pipeline:
+                pipeline.hincrby(key, duration, 1)
+                pipeline.expire(key, self._duration_time_window + self._duration_bucket_size)
+                pipeline.execute()
+            return
+
+        with self._lock:
+            self._pending_durations[(project_id, timestamp, duration)] += 1
+            flush = self._record(project_id, timestamp)
+
+        if flush:
+            self.flush()
 
     def projects(self) -> Iterable[int]:
         """
         Returns IDs of all projects for which metrics have been recorded in the store.
 
-        This may throw an exception if there is some sort of issue scanning the redis store for
-        projects.
+        Projects are read from the index maintained when flushing buffered increments.  Only if
+        that index does not exist, e.g. when buffering is disabled, this falls back to scanning
+        the store.
+
+        This may throw an exception if there is some sort of issue reading the projects from the
+        redis store.
         """
+        project_ids = self.cluster.zrange(self._projects_key(), 0, -1)
+        if project_ids:
+            for project_id in project_ids:
+                yield int(project_id)
+            return
+
+        yield from self._scan_projects()
 
+    def _scan_projects(self) -> Iterable[int]:
         already_seen = set()
         # Normally if there's a duration entry for a project then there should be a counter
         # entry for it as well, but double check both to be safe
@@ -164,18 +319,34 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
         This may throw an exception if there is some sort of issue fetching counts from the redis
         store.
         """
-        bucket_size = self._counter_bucket_size
-        now_bucket = timestamp - timestamp % bucket_size
+        return self.get_counts_for_projects([project_id], timestamp)[project_id]
 
-        first_bucket = timestamp - self._counter_time_window
-        first_bucket = first_bucket - first_bucket % bucket_size
+    def get_counts_for_projects(
+        self, project_ids: Iterable[int], timestamp: int
+    ) -> Dict[int, base.BucketedCounts]:
+        """Returns the bucketed counts of symbolicator requests for all given projects.
 
-        buckets = range(first_bucket, now_bucket + bucket_size, bucket_size)
-        keys = [f"{self._counter_key_prefix()}:{project_id}:{ts}" for ts in buckets]
-        counts = self.cluster.mget(keys)
-        return base.BucketedCounts(
-            timestamp=buckets[0], width=bucket_size, counts=[int(c) if c else 0 for c in counts]
-        )
+        This behaves like calling `get_counts_for_project` for every project, but fetches the
+        counts in bulk.
+        """
+        bucket_size = self._counter_bucket_size
+        buckets = self._buckets(bucket_size, self._counter_time_window, timestamp)
+
+        result = {}
+        for chunk in chunked(project_ids, BULK_READ_CHUNK_SIZE):
+            keys = [
+                f"{self._counter_key_prefix()}:{project_id}:{ts}"
+                for project_id in chunk
+                for ts in buckets
+            ]
+            counts = [int(c) if c else 0 for c in self.cluster.mget(keys)]
+            for i, project_id in enumerate(chunk):
+                result[project_id] = base.BucketedCounts(
+                    timestamp=buckets[0],
+                    width=bucket_size,
+                    counts=counts[i * len(buckets) : (i + 1) * len(buckets)],
+                )
+        return result
 
     def get_durations_for_project(
         self, project_id: int, timestamp: int
@@ -198,31 +369,41 @@ class RedisRealtimeMetricsStore(base.RealtimeMetricsStore):
         This may throw an exception if there is some sort of issue fetching durations from the redis
         store.
         """
-        bucket_size = self._duration_bucket_size
-        now_bucket = timestamp - timestamp % bucket_size
+        return self.get_durations_for_projects([project_id], timestamp)[project_id]
 
-        first_bucket = timestamp - self._duration_time_window
-        first_bucket = first_bucket - first_bucket % bucket_size
-
-        buckets = range(first_bucket, now_bucket + bucket_size, bucket_size)
-
-        with self.cluster.pipeline() as pipeline:
-            for ts in buckets:
-                pipeline.hgetall(f"{self._duration_key_prefix()}:{project_id}:{ts}")
-            histograms = pipeline.execute()
-
-        all_histograms = []
-        for ts, histogram_redis in zip(buckets, histograms):
-            histogram = base.DurationsHistogram(bucket_size=10)
-            for duration, count in histogram_redis.items():
-                histogram.incr(int(duration), int(count))
-            all_histograms.append(histogram)
+    def get_durations_for_projects(
+        self, project_ids: Iterable[int], timestamp: int
+    ) -> Dict[int, base.BucketedDurationsHistograms]:
+        """Returns the bucketed symbolication duration histograms for all given projects.
 
-        return base.BucketedDurationsHistograms(
-            timestamp=first_bucket,
-            width=bucket_size,
-            histograms=all_histograms,
-        )
+        This behaves like calling `get_durations_for_project` for every project, but fetches the
+        histograms in bulk.
+        """
+        bucket_size = self._duration_bucket_size
+        buckets = self._buckets(bucket_size, self._duration_time_window, timestamp)
+
+        result = {}
+        for chunk in chunked(project_ids, BULK_READ_CHUNK_SIZE):
+            with self.cluster.pipeline(transaction=False) as pipeline:
+                for project_id in chunk:
+                    for ts in buckets:
+                        pipeline.hgetall(f"{self._duration_key_prefix()}:{project_id}:{ts}")
+                histograms = iter(pipeline.execute())
+
+            for project_id in chunk:
+                all_histograms = []
+                for _ts, histogram_redis in zip(buckets, histograms):
+                    histogram = base.DurationsHistogram(bucket_size=10)
+                    for duration, count in histogram_redis.items():
+                        histogram.incr(int(duration), int(count))
+                    all_histograms.append(histogram)
+
+                result[project_id] = base.BucketedDurationsHistograms(
+                    timestamp=buckets[0],
+                    width=bucket_size,
+                    histograms=all_histograms,
+                )
+        return result
 
     def get_lpq_projects(self) -> Set[int]:
         """
@@ -205,8 +205,10 @@ class Quota(Service):
         "get_organization_quota",
         "get_project_quota",
         "is_rate_limited",
+        "is_rate_limited_many",
         "validate",
         "refund",
+        "refund_many",
         "get_event_retention",
         "get_quotas",
     )
@@ -261,6 +263,24 @@ class Quota(Service):
         """
         return NotRateLimited()
 
+    def is_rate_limited_many(self, items, timestamp=None):
+        """
+        Checks and consumes quotas for a batch of items, see
+        ``is_rate_limited``.
+
+        Items are ``(project, key, category, quantity)`` tuples, where ``key``
+        may be ``None`` and ``category`` and ``quantity`` default to
+        ``DataCategory.ERROR`` and ``1`` if ``None``. Only quotas that apply
+        to an item's category are checked. Items are evaluated in order, and
+        every accepted item counts against the quotas of the ones after it.
+
+        Returns a list with one ``RateLimit`` per item.
+
+        :param items:     The items to check.
+        :param timestamp: The timestamp at which the items are ingested.
+        """
+        return [NotRateLimited() for _ in items]
+
     def refund(self, project, key=None, timestamp=None, category=None, quantity=None):
         """
         Signals event rejection after ``quotas.is_rate_limited`` has been called
@@ -282,6 +302,18 @@ class Quota(Service):
                           attachment in bytes.
         """
 
+    def refund_many(self, items, timestamp=None):
+        """
+        Refunds previously consumed quota for a batch of items, see
+        ``refund``.
+
+        :param items:     ``(project, key, category, quantity)`` tuples, as
+                          passed to ``is_rate_limited_many``.
+        :param timestamp: The timestamp at which data was ingested.
+        """
+        for project, key, category, quantity in items:
+            self.refund(project, key=key, timestamp=timestamp, category=category, quantity=quantity)
+
     def get_event_retention(self, organization):
         """
         Returns the retention for events in the given organization in days.
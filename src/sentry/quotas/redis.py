@@ -1,4 +1,5 @@
 import functools
+from collections import defaultdict
 from time import time
 
 import sentry_sdk
@@ -13,6 +14,7 @@ from sentry.utils.redis import (
 )
 
 is_rate_limited = load_script("quotas/is_rate_limited.lua")
+is_rate_limited_many = load_script("quotas/is_rate_limited_many.lua")
 
 
 class RedisQuota(Quota):
@@ -149,42 +151,66 @@ class RedisQuota(Quota):
         return f"r:{key}"
 
     def refund(self, project, key=None, timestamp=None, category=None, quantity=None):
+        self.refund_many([(project, key, category, quantity)], timestamp=timestamp)
+
+    def refund_many(self, items, timestamp=None):
         if timestamp is None:
             timestamp = time()
 
-        if category is None:
-            category = DataCategory.ERROR
+        quota_cache = {}
+        refunds = defaultdict(lambda: defaultdict(int))
+        for project, key, category, quantity in items:
+            if category is None:
+                category = DataCategory.ERROR
+
+            if quantity is None:
+                quantity = 1
+
+            # only refund quotas that can be tracked and that specify the given
+            # category. an empty categories list usually refers to all categories,
+            # but such quotas are invalid with counters.
+            quotas = [
+                quota
+                for quota in self.__get_item_quotas(project, key, quota_cache)
+                if quota.should_track and category in quota.categories
+            ]
+
+            organization_id = project.organization_id
+            for quota in quotas:
+                shift = organization_id % quota.window
+                # kind of arbitrary, but seems like we don't want this to expire til we're
+                # sure the window is over?
+                expiry = self.get_next_period_start(quota.window, shift, timestamp) + self.grace
+                return_key = self.get_refunded_quota_key(
+                    self.__get_redis_key(quota, timestamp, shift, organization_id)
+                )
+                refunds[organization_id][(return_key, int(expiry))] += quantity
 
-        if quantity is None:
-            quantity = 1
+        for organization_id, amounts in refunds.items():
+            client = self.__get_redis_client(str(organization_id))
+            pipe = client.pipeline()
 
-        # only refund quotas that can be tracked and that specify the given
-        # category. an empty categories list usually refers to all categories,
-        # but such quotas are invalid with counters.
-        quotas = [
-            quota
-            for quota in self.get_quotas(project, key=key)
-            if quota.should_track and category in quota.categories
-        ]
+            for (return_key, expiry), quantity in amounts.items():
+                pipe.incr(return_key, quantity)
+                pipe.expireat(return_key, expiry)
 
-        if not quotas:
-            return
+            pipe.execute()
 
-        client = self.__get_redis_client(str(project.organization_id))
-        pipe = client.pipeline()
+    def __get_item_quotas(self, project, key, cache):
+        cache_key = (project.id, key.id if key is not None else None)
+        if cache_key not in cache:
+            cache[cache_key] = self.get_quotas(project, key=key)
+        return cache[cache_key]
 
-        for quota in quotas:
-            shift = project.organization_id % quota.window
-            # kind of arbitrary, but seems like we don't want this to expire til we're
-            # sure the window is over?
-            expiry = self.get_next_period_start(quota.window, shift, timestamp) + self.grace
-            return_key = self.get_refunded_quota_key(
-                self.__get_redis_key(quota, timestamp, shift, project.organization_id)
-            )
-            pipe.incr(return_key, quantity)
-            pipe.expireat(return_key, int(expiry))
+    def __get_rate_limited(self, organization_id, rejected_quotas, timestamp):
+        worst_case = (0, None)
+        for quota in rejected_quotas:
+            shift = organization_id % quota.window
+            delay = self.get_next_period_start(quota.window, shift, timestamp) - timestamp
+            if delay > worst_case[0]:
+                worst_case = (delay, quota.reason_code)
 
-        pipe.execute()
+        return RateLimited(retry_after=worst_case[0], reason_code=worst_case[1])
 
     def get_next_period_start(self, interval, shift, timestamp):
         """Return the timestamp when the next rate limit period begins for an interval."""
@@ -246,14 +272,64 @@ class RedisQuota(Quota):
         if not any(rejections):
             return NotRateLimited()
 
-        worst_case = (0, None)
-        for quota, rejected in zip(quotas, rejections):
-            if not rejected:
-                continue
+        rejected_quotas = [quota for quota, rejected in zip(quotas, rejections) if rejected]
+        return self.__get_rate_limited(project.organization_id, rejected_quotas, timestamp)
 
-            shift = project.organization_id % quota.window
-            delay = self.get_next_period_start(quota.window, shift, timestamp) - timestamp
-            if delay > worst_case[0]:
-                worst_case = (delay, quota.reason_code)
+    def is_rate_limited_many(self, items, timestamp=None):
+        if timestamp is None:
+            timestamp = time()
 
-        return RateLimited(retry_after=worst_case[0], reason_code=worst_case[1])
+        results = [NotRateLimited() for _ in items]
+        quota_cache = {}
+        batches = defaultdict(list)
+        for index, (project, key, category, quantity) in enumerate(items):
+            if category is None:
+                category = DataCategory.ERROR
+
+            if quantity is None:
+                quantity = 1
+
+            quotas = [
+                q
+                for q in self.__get_item_quotas(project, key, quota_cache)
+                if not q.categories or category in q.categories
+            ]
+
+            # Zero-sized quotas reject the item without calling into Redis,
+            # just like in ``is_rate_limited``.
+            zero_quota = next((q for q in quotas if q.limit == 0), None)
+            if zero_quota is not None:
+                results[index] = RateLimited(retry_after=None, reason_code=zero_quota.reason_code)
+            elif quotas:
+                batches[project.organization_id].append((index, quotas, quantity))
+
+        # All counters of an organization share the same hash tag, so every
+        # organization is evaluated with a single script call.
+        for organization_id, batch in batches.items():
+            keys = []
+            args = []
+            for _, quotas, quantity in batch:
+                args.extend((len(quotas), quantity))
+                for quota in quotas:
+                    assert quota.should_track
+
+                    shift = organization_id % quota.window
+                    key = self.__get_redis_key(quota, timestamp, shift, organization_id)
+                    keys.extend((key, self.get_refunded_quota_key(key)))
+                    expiry = self.get_next_period_start(quota.window, shift, timestamp) + self.grace
+
+                    # limit=None is represented as limit=-1 in lua
+                    lua_quota = quota.limit if quota.limit is not None else -1
+                    args.extend((lua_quota, int(expiry)))
+
+            client = self.__get_redis_client(str(organization_id))
+            rejections = iter(is_rate_limited_many(client, keys, args))
+
+            for index, quotas, _ in batch:
+                rejected_quotas = [quota for quota in quotas if next(rejections)]
+                if rejected_quotas:
+                    results[index] = self.__get_rate_limited(
+                        organization_id, rejected_quotas, timestamp
+                    )
+
+        return results
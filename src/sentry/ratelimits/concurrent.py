@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import zlib
 from dataclasses import dataclass
 from time import time
 
@@ -26,10 +27,29 @@ class ConcurrentLimitInfo:
 
 
 class ConcurrentRateLimiter:
-    def __init__(self, max_tll_seconds: int = DEFAULT_MAX_TTL_SECONDS) -> None:
+    """
+    Limits the number of concurrently executing requests per key.
+
+    Requests of a key can be spread over ``num_shards`` sorted sets (by
+    default ``SENTRY_CONCURRENT_RATE_LIMIT_SHARDS``) to avoid a single hot
+    set in Redis. Every shard then enforces its share of the limit, and the
+    shares add up to ``limit``. Requests may be rejected early if they are not
+    evenly distributed. Limits lower than the number of shards are not
+    sharded, as some shards would not admit any request at all.
+
+    With sharding, the returned ``ConcurrentLimitInfo`` describes the shard
+    the request was counted in: its share of the limit and its executions.
+    """
+
+    def __init__(
+        self, max_tll_seconds: int = DEFAULT_MAX_TTL_SECONDS, num_shards: int | None = None
+    ) -> None:
         cluster_key = getattr(settings, "SENTRY_RATE_LIMIT_REDIS_CLUSTER", "default")
         self.client = redis.redis_clusters.get(cluster_key)
         self.max_ttl_seconds = max_tll_seconds
+        if num_shards is None:
+            num_shards = getattr(settings, "SENTRY_CONCURRENT_RATE_LIMIT_SHARDS", 1)
+        self.num_shards = max(num_shards, 1)
 
     def validate(self) -> None:
         try:
@@ -40,12 +60,27 @@ class ConcurrentRateLimiter:
     def namespaced_key(self, key: str) -> str:
         return f"concurrent_limit:{key}"
 
+    def _shard_key(self, key: str, shard: int) -> str:
+        if self.num_shards == 1:
+            return self.namespaced_key(key)
+        return f"{self.namespaced_key(key)}:{shard}"
+
+    def _request_shard(self, request_uid: str) -> int:
+        return zlib.crc32(request_uid.encode("utf-8")) % self.num_shards
+
     def start_request(self, key: str, limit: int, request_uid: str) -> ConcurrentLimitInfo:
-        redis_key = self.namespaced_key(key)
+        if self.num_shards > 1 and limit >= self.num_shards:
+            shard = self._request_shard(request_uid)
+            redis_key = self._shard_key(key, shard)
+            # The remainder goes to the first shards so the shares add up to the limit.
+            shard_limit = limit // self.num_shards + (1 if shard < limit % self.num_shards else 0)
+        else:
+            redis_key = self.namespaced_key(key)
+            shard_limit = limit
         current_executions, request_allowed, cleaned_up_requests = (-1, True, 0)
         try:
             current_executions, request_allowed, cleaned_up_requests = rate_limit_info(
-                self.client, [redis_key], [limit, request_uid, time(), self.max_ttl_seconds]
+                self.client, [redis_key], [shard_limit, request_uid, time(), self.max_ttl_seconds]
             )
         except Exception:
             logger.exception(
@@ -63,16 +98,34 @@ class ConcurrentRateLimiter:
                     "request_uid": request_uid,
                 },
             )
-        return ConcurrentLimitInfo(limit, int(current_executions), not bool(request_allowed))
+        return ConcurrentLimitInfo(shard_limit, int(current_executions), not bool(request_allowed))
 
     def get_concurrent_requests(self, key: str) -> int:
-        redis_key = self.namespaced_key(key)
         # this can fail loudly as it is only meant for observability
-        num_elements = self.client.zcard(redis_key)
-        return int(num_elements) if num_elements is not None else -1
+        if self.num_shards == 1:
+            num_elements = self.client.zcard(self.namespaced_key(key))
+            return int(num_elements) if num_elements is not None else -1
+
+        # Shards are spread over the cluster, so a pipeline is used rather than
+        # a transaction. Keys with a limit below the number of shards use the
+        # unsharded set.
+        p = self.client.pipeline(transaction=False)
+        p.zcard(self.namespaced_key(key))
+        for shard in range(self.num_shards):
+            p.zcard(self._shard_key(key, shard))
+        return sum(int(n or 0) for n in p.execute())
 
     def finish_request(self, key: str, request_uid: str) -> None:
         try:
-            self.client.zrem(self.namespaced_key(key), request_uid)
+            if self.num_shards == 1:
+                self.client.zrem(self.namespaced_key(key), request_uid)
+                return
+
+            # The limit is not known here, so the request is removed from both
+            # the unsharded set and its shard.
+            p = self.client.pipeline(transaction=False)
+            p.zrem(self.namespaced_key(key), request_uid)
+            p.zrem(self._shard_key(key, self._request_shard(request_uid)), request_uid)
+            p.execute()
         except Exception:
             logger.exception("Could not finish request", dict(key=key, request_uid=request_uid))
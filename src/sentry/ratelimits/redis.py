@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from time import time
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +18,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+lease_script = redis.load_script("ratelimits/lease.lua")
+
+# Upper bound of keys a process keeps leases for, to bound memory usage with
+# many distinct keys (e.g. rate limits by IP address).
+MAX_LEASES = 10000
+
 
 def _time_bucket(request_time: float, window: int) -> int:
     """Bucket number lookup for given UTC time since epoch"""
@@ -29,9 +36,32 @@ def _bucket_start_time(bucket_number: int, window: int) -> int:
 
 
 class RedisRateLimiter(RateLimiter):
+    """
+    Fixed window rate limiter backed by Redis counters.
+
+    With the ``lease_size`` option set above ``1``, every process reserves up
+    to that many requests of a window at once and admits them locally without
+    calling Redis. Requests reserved and not used within the window count
+    against the limit, so every process can cause up to one lease worth of
+    requests to be rejected early.
+
+    To bound this globally, ``lease_processes`` is set to the number of
+    processes sharing the limits. Leases are then capped so that all of them
+    together hold at most ``max_lease_ratio`` of the limit, and limits too
+    small for that are checked against Redis on every request.
+
+    The reported count is the Redis counter without the requests this process
+    has reserved but not admitted yet.
+    """
+
     def __init__(self, **options: Any) -> None:
         cluster_key = getattr(settings, "SENTRY_RATE_LIMIT_REDIS_CLUSTER", "default")
         self.client = redis.redis_clusters.get(cluster_key)
+        self.lease_size = options.get("lease_size", 1)
+        self.max_lease_ratio = options.get("max_lease_ratio", 0.1)
+        self.lease_processes = max(options.get("lease_processes", 1), 1)
+        self._leases: dict[str, list[int]] = {}
+        self._leases_lock = threading.Lock()
 
     def _construct_redis_key(
         self,
@@ -104,6 +134,11 @@ class RedisRateLimiter(RateLimiter):
         expiration = window - int(request_time % window)
         # Reset Time = next time bucket's start time
         reset_time = _bucket_start_time(_time_bucket(request_time, window) + 1, window)
+
+        lease_size = min(self.lease_size, int(limit * self.max_lease_ratio / self.lease_processes))
+        if lease_size > 1:
+            return self._is_limited_with_lease(redis_key, limit, lease_size, expiration, reset_time)
+
         try:
             result = self.client.incr(redis_key)
             self.client.expire(redis_key, expiration)
@@ -114,3 +149,33 @@ class RedisRateLimiter(RateLimiter):
             return False, 0, reset_time
 
         return result > limit, result, reset_time
+
+    def _is_limited_with_lease(
+        self, redis_key: str, limit: int, lease_size: int, expiration: int, reset_time: int
+    ) -> tuple[bool, int, int]:
+        with self._leases_lock:
+            lease = self._leases.get(redis_key)
+            if lease is not None and lease[0] > 0:
+                lease[0] -= 1
+                lease[1] += 1
+                return False, lease[1], reset_time
+
+        try:
+            value, reserved = lease_script(
+                self.client, [redis_key], [limit, lease_size, expiration]
+            )
+        except RedisError:
+            logger.exception("Failed to retrieve current value from redis")
+            return False, 0, reset_time
+
+        # The counter includes all requests reserved by this lease, the first
+        # of which is the current request. Reservations never go past the
+        # limit, so only a request that got nothing but itself can be limited.
+        # The rest is only reported as it is admitted.
+        count = value - reserved + 1
+        with self._leases_lock:
+            if len(self._leases) >= MAX_LEASES:
+                self._leases.clear()
+            self._leases[redis_key] = [reserved - 1, count]
+
+        return value > limit, count, reset_time
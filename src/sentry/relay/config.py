@@ -34,12 +34,45 @@ EXPOSABLE_FEATURES = [
 logger = logging.getLogger(__name__)
 
 
-def get_exposed_features(project: Project) -> List[str]:
+class OrganizationConfigContext:
+    """
+    Organization level inputs of project configs.
+
+    When configs for many projects of the same organization are generated at
+    once, these are computed a single time and shared by all of them instead
+    of being looked up again for every project.
+    """
+
+    def __init__(self, organization):
+        self.organization = organization
+        self.trusted_relays = [
+            r["public_key"] for r in organization.get_option("sentry:trusted-relays", []) if r
+        ]
+        self.event_retention = quotas.get_event_retention(organization)
+        self._features = {}
+
+    def has_feature(self, feature: str) -> bool:
+        if feature not in self._features:
+            self._features[feature] = features.has(feature, self.organization)
+        return self._features[feature]
+
+
+def _has_organization_feature(
+    feature: str, project: Project, org_context: Optional[OrganizationConfigContext] = None
+) -> bool:
+    if org_context is not None:
+        return org_context.has_feature(feature)
+    return features.has(feature, project.organization)
+
+
+def get_exposed_features(
+    project: Project, org_context: Optional[OrganizationConfigContext] = None
+) -> List[str]:
 
     active_features = []
     for feature in EXPOSABLE_FEATURES:
         if feature.startswith("organizations:"):
-            has_feature = features.has(feature, project.organization)
+            has_feature = _has_organization_feature(feature, project, org_context)
         elif feature.startswith("projects:"):
             has_feature = features.has(feature, project)
         else:
@@ -123,7 +156,43 @@ def get_quotas(project, keys=None):
     return [quota.to_json() for quota in quotas.get_quotas(project, keys=keys)]
 
 
-def get_project_config(project, full_config=True, project_keys=None):
+def get_project_configs(project_keys, full_config=True):
+    """
+    Constructs the ProjectConfig for each of the given project keys.
+
+    This is the bulk variant of `get_project_config`. Organization level
+    inputs are computed once per organization and the options of all projects
+    are loaded up front with a single query.
+
+    :param project_keys: The project keys to build configs for. Their project
+        and organization should be bound to avoid loading them one by one.
+    :param full_config: See `get_project_config`.
+
+    :return: a dict mapping the public key to the ProjectConfig of each key
+    """
+    from sentry.models import ProjectOption
+
+    projects = {key.project_id: key.project for key in project_keys}
+    ProjectOption.objects.get_all_values_bulk(list(projects.values()))
+
+    org_contexts = {}
+    configs = {}
+    for key in project_keys:
+        organization = key.project.organization
+        if organization.id not in org_contexts:
+            org_contexts[organization.id] = OrganizationConfigContext(organization)
+
+        configs[key.public_key] = get_project_config(
+            key.project,
+            full_config=full_config,
+            project_keys=[key],
+            org_context=org_contexts[organization.id],
+        )
+
+    return configs
+
+
+def get_project_config(project, full_config=True, project_keys=None, org_context=None):
     """
     Constructs the ProjectConfig information.
 
@@ -137,6 +206,9 @@ def get_project_config(project, full_config=True, project_keys=None):
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param org_context: Precomputed organization level inputs, used when
+        configs for many projects of one organization are generated together.
+        See `get_project_configs`.
 
     :return: a ProjectConfig object for the given project
     """
@@ -148,6 +220,15 @@ def get_project_config(project, full_config=True, project_keys=None):
 
     public_keys = get_public_key_configs(project, full_config, project_keys=project_keys)
 
+    if org_context is not None:
+        trusted_relays = org_context.trusted_relays
+    else:
+        trusted_relays = [
+            r["public_key"]
+            for r in project.organization.get_option("sentry:trusted-relays", [])
+            if r
+        ]
+
     with Hub.current.start_span(op="get_public_config"):
         now = datetime.utcnow().replace(tzinfo=utc)
         cfg = {
@@ -159,21 +240,16 @@ def get_project_config(project, full_config=True, project_keys=None):
             "publicKeys": public_keys,
             "config": {
                 "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
+                "trustedRelays": trusted_relays,
                 "piiConfig": get_pii_config(project),
                 "datascrubbingSettings": get_datascrubbing_settings(project),
-                "features": get_exposed_features(project),
+                "features": get_exposed_features(project, org_context),
             },
             "organizationId": project.organization_id,
             "projectId": project.id,  # XXX: Unused by Relay, required by Python store
         }
-    allow_dynamic_sampling = features.has(
-        "organizations:filters-and-sampling",
-        project.organization,
+    allow_dynamic_sampling = _has_organization_feature(
+        "organizations:filters-and-sampling", project, org_context
     )
     if allow_dynamic_sampling:
         dynamic_sampling = project.get_option("sentry:dynamic_sampling")
@@ -184,9 +260,11 @@ def get_project_config(project, full_config=True, project_keys=None):
         # This is all we need for external Relay processors
         return ProjectConfig(project, **cfg)
 
-    if features.has("organizations:performance-ops-breakdown", project.organization):
+    if _has_organization_feature("organizations:performance-ops-breakdown", project, org_context):
         cfg["config"]["breakdownsV2"] = project.get_option("sentry:breakdowns")
-    if features.has("organizations:transaction-metrics-extraction", project.organization):
+    if _has_organization_feature(
+        "organizations:transaction-metrics-extraction", project, org_context
+    ):
         cfg["config"]["transactionMetrics"] = get_transaction_metrics_settings(
             project, cfg["config"].get("breakdownsV2")
         )
@@ -197,7 +275,10 @@ def get_project_config(project, full_config=True, project_keys=None):
     with Hub.current.start_span(op="get_grouping_config_dict_for_project"):
         cfg["config"]["groupingConfig"] = get_grouping_config_dict_for_project(project)
     with Hub.current.start_span(op="get_event_retention"):
-        cfg["config"]["eventRetention"] = quotas.get_event_retention(project.organization)
+        if org_context is not None:
+            cfg["config"]["eventRetention"] = org_context.event_retention
+        else:
+            cfg["config"]["eventRetention"] = quotas.get_event_retention(project.organization)
     with Hub.current.start_span(op="get_all_quotas"):
         cfg["config"]["quotas"] = get_quotas(project, keys=project_keys)
 
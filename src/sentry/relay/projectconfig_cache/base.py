@@ -1,8 +1,24 @@
+from hashlib import sha1
+
+from sentry.utils import json
 from sentry.utils.services import Service
 
+#: Top level fields of a project config that change on every generation
+#: without changing its effect, and are therefore not part of its revision.
+VOLATILE_CONFIG_FIELDS = frozenset(["lastFetch", "lastChange", "rev"])
+
+
+def get_config_revision(config):
+    """
+    Returns a content hash of a project config, which is the same for two
+    configs that only differ in fields that are regenerated every time.
+    """
+    content = {k: v for k, v in config.items() if k not in VOLATILE_CONFIG_FIELDS}
+    return sha1(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
 
 class ProjectConfigCache(Service):
-    __all__ = ("set_many", "delete_many", "get")
+    __all__ = ("set_many", "delete_many", "get", "get_revisions")
 
     def __init__(self, **options):
         pass
@@ -15,3 +31,11 @@ class ProjectConfigCache(Service):
 
     def get(self, public_key):
         raise NotImplementedError()
+
+    def get_revisions(self, public_keys):
+        """
+        Returns the revision (see `get_config_revision`) of the cached config
+        of each of the given public keys. Keys without a cached config are
+        omitted.
+        """
+        return {}
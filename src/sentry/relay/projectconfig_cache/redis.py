@@ -1,5 +1,5 @@
-from sentry.relay.projectconfig_cache.base import ProjectConfigCache
-from sentry.utils import json, redis
+from sentry.relay.projectconfig_cache.base import ProjectConfigCache, get_config_revision
+from sentry.utils import json, metrics, redis
 from sentry.utils.redis import validate_dynamic_cluster
 
 REDIS_CACHE_TIMEOUT = 3600  # 1 hr
@@ -18,19 +18,41 @@ class RedisProjectConfigCache(ProjectConfigCache):
     def __get_redis_key(self, public_key):
         return f"relayconfig:{public_key}"
 
+    def __get_revision_key(self, public_key):
+        return f"relayconfig-rev:{public_key}"
+
     def set_many(self, configs):
+        revisions = {
+            public_key: get_config_revision(config) for public_key, config in configs.items()
+        }
+        cached_revisions = self.get_revisions(list(configs))
+
         # Note: Those are multiple pipelines, one per cluster node
         p = self.cluster.pipeline()
+        unchanged = 0
         for public_key, config in configs.items():
-            p.setex(self.__get_redis_key(public_key), REDIS_CACHE_TIMEOUT, json.dumps(config))
+            revision = revisions[public_key]
+            if cached_revisions.get(public_key) == revision:
+                # The effective config did not change and is still stored, only
+                # extend the lifetime of what is there instead of rewriting it.
+                unchanged += 1
+                p.expire(self.__get_redis_key(public_key), REDIS_CACHE_TIMEOUT)
+                p.expire(self.__get_revision_key(public_key), REDIS_CACHE_TIMEOUT)
+            else:
+                p.setex(self.__get_redis_key(public_key), REDIS_CACHE_TIMEOUT, json.dumps(config))
+                p.setex(self.__get_revision_key(public_key), REDIS_CACHE_TIMEOUT, revision)
 
         p.execute()
 
+        metrics.incr("relay.projectconfig_cache.unchanged", amount=unchanged)
+        metrics.incr("relay.projectconfig_cache.write", amount=len(configs) - unchanged)
+
     def delete_many(self, public_keys):
         # Note: Those are multiple pipelines, one per cluster node
         p = self.cluster.pipeline()
         for public_key in public_keys:
             p.delete(self.__get_redis_key(public_key))
+            p.delete(self.__get_revision_key(public_key))
 
         p.execute()
 
@@ -39,3 +61,22 @@ class RedisProjectConfigCache(ProjectConfigCache):
         if rv is not None:
             return json.loads(rv)
         return None
+
+    def get_revisions(self, public_keys):
+        public_keys = list(public_keys)
+        if not public_keys:
+            return {}
+
+        # A revision is only valid while the config itself is stored, which may
+        # have been evicted independently.
+        p = self.cluster.pipeline()
+        for public_key in public_keys:
+            p.get(self.__get_revision_key(public_key))
+            p.exists(self.__get_redis_key(public_key))
+
+        results = p.execute()
+        return {
+            public_key: revision
+            for public_key, revision, exists in zip(public_keys, results[::2], results[1::2])
+            if revision is not None and exists
+        }
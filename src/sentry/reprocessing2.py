@@ -180,45 +180,104 @@ class ReprocessableEvent:
 
 
 def pull_event_data(project_id, event_id) -> ReprocessableEvent:
-    from sentry.lang.native.processing import get_required_attachment_types
-
     with sentry_sdk.start_span(op="reprocess_events.eventstore.get"):
         event = eventstore.get_event_by_id(project_id, event_id)
 
     if event is None:
         raise CannotReprocess("event.not_found")
 
-    with sentry_sdk.start_span(op="reprocess_events.nodestore.get"):
-        node_id = Event.generate_node_id(project_id, event_id)
-        data = nodestore.get(node_id, subkey="unprocessed")
+    result = pull_event_data_multi(project_id, [event])[event_id]
+    if isinstance(result, CannotReprocess):
+        raise result
+
+    return result
+
+
+def pull_event_data_multi(
+    project_id, events: Sequence[Event]
+) -> Dict[str, Union[ReprocessableEvent, CannotReprocess]]:
+    """
+    Bulk version of `pull_event_data` for events that have already been
+    fetched from eventstore. Unprocessed payloads are read with nodestore
+    multi-gets and required attachments with a single query, instead of a
+    couple of roundtrips per event.
+
+    Returns a mapping from event ID to either the `ReprocessableEvent` or the
+    `CannotReprocess` error for that event.
+    """
+    from sentry.lang.native.processing import get_required_attachment_types
+
+    with sentry_sdk.start_span(op="reprocess_events.nodestore.get_multi"):
+        node_ids = {
+            event.event_id: Event.generate_node_id(project_id, event.event_id) for event in events
+        }
+        items = nodestore.get_multi(list(node_ids.values()), subkey="unprocessed")
+        payloads = {event_id: items.get(node_id) for event_id, node_id in node_ids.items()}
+
+        fallback_node_ids = {
+            event_id: _generate_unprocessed_event_node_id(project_id=project_id, event_id=event_id)
+            for event_id, data in payloads.items()
+            if data is None
+        }
+        if fallback_node_ids:
+            items = nodestore.get_multi(list(fallback_node_ids.values()))
+            for event_id, node_id in fallback_node_ids.items():
+                payloads[event_id] = items.get(node_id)
+
+    required_attachment_types = {
+        event_id: get_required_attachment_types(data)
+        for event_id, data in payloads.items()
+        if data is not None
+    }
+
+    attachments: Dict[str, List[models.EventAttachment]] = {}
+    queried_event_ids = [event_id for event_id, types in required_attachment_types.items() if types]
+    if queried_event_ids:
+        with sentry_sdk.start_span(op="reprocess_events.eventattachments.get"):
+            for attachment in models.EventAttachment.objects.filter(
+                project_id=project_id,
+                event_id__in=queried_event_ids,
+                type__in=list(set().union(*required_attachment_types.values())),
+            ):
+                if attachment.type in required_attachment_types[attachment.event_id]:
+                    attachments.setdefault(attachment.event_id, []).append(attachment)
+
+    results: Dict[str, Union[ReprocessableEvent, CannotReprocess]] = {}
+    for event in events:
+        data = payloads[event.event_id]
+
+        # Check data after checking presence of event to avoid too many instances.
         if data is None:
-            node_id = _generate_unprocessed_event_node_id(project_id=project_id, event_id=event_id)
-            data = nodestore.get(node_id)
+            results[event.event_id] = CannotReprocess("unprocessed_event.not_found")
+            continue
 
-    # Check data after checking presence of event to avoid too many instances.
-    if data is None:
-        raise CannotReprocess("unprocessed_event.not_found")
+        event_attachments = attachments.get(event.event_id, [])
+        missing_attachment_types = required_attachment_types[event.event_id] - {
+            ea.type for ea in event_attachments
+        }
 
-    required_attachment_types = get_required_attachment_types(data)
-    attachments = list(
-        models.EventAttachment.objects.filter(
-            project_id=project_id, event_id=event_id, type__in=list(required_attachment_types)
-        )
-    )
-    missing_attachment_types = required_attachment_types - {ea.type for ea in attachments}
+        if missing_attachment_types:
+            results[event.event_id] = CannotReprocess("attachment.not_found")
+            continue
 
-    if missing_attachment_types:
-        raise CannotReprocess("attachment.not_found")
+        results[event.event_id] = ReprocessableEvent(
+            event=event, data=data, attachments=event_attachments
+        )
 
-    return ReprocessableEvent(event=event, data=data, attachments=attachments)
+    return results
 
 
-def reprocess_event(project_id, event_id, start_time):
+def reprocess_event(project_id, event_id, start_time, reprocessable_event=None):
+    """
+    Enqueue a single event for reprocessing. `reprocessable_event` can be
+    passed if the event has already been pulled by `pull_event_data_multi`.
+    """
 
     from sentry.ingest.ingest_consumer import CACHE_TIMEOUT
     from sentry.tasks.store import preprocess_event_from_reprocessing
 
-    reprocessable_event = pull_event_data(project_id, event_id)
+    if reprocessable_event is None:
+        reprocessable_event = pull_event_data(project_id, event_id)
 
     data = reprocessable_event.data
     event = reprocessable_event.event
@@ -237,7 +296,11 @@ def reprocess_event(project_id, event_id, start_time):
     # (we simply update group_id on the EventAttachment models in post_process)
     attachment_objects = []
 
-    files = {f.id: f for f in models.File.objects.filter(id__in=[ea.file_id for ea in attachments])}
+    files = {}
+    if attachments:
+        files = {
+            f.id: f for f in models.File.objects.filter(id__in=[ea.file_id for ea in attachments])
+        }
 
     for attachment_id, attachment in enumerate(attachments):
         with sentry_sdk.start_span(op="reprocess_event._copy_attachment_into_cache") as span:
@@ -473,6 +536,10 @@ def _get_info_reprocessed_key(group_id):
     return f"re2:info:{group_id}"
 
 
+def _get_dispatched_counter_key(group_id):
+    return f"re2:dispatched:{group_id}"
+
+
 def buffered_handle_remaining_events(
     project_id: int,
     old_group_id: int,
@@ -666,6 +733,7 @@ def start_group_reprocessing(
 
     client = _get_sync_redis_client()
     client.setex(_get_sync_counter_key(group_id), settings.SENTRY_REPROCESSING_SYNC_TTL, sync_count)
+    client.setex(_get_dispatched_counter_key(group_id), settings.SENTRY_REPROCESSING_SYNC_TTL, 0)
     client.setex(
         _get_info_reprocessed_key(group_id),
         settings.SENTRY_REPROCESSING_SYNC_TTL,
@@ -686,9 +754,25 @@ def is_group_finished(group_id):
     return pending <= 0
 
 
+def mark_events_dispatched(group_id, num_events):
+    """
+    Track how many events of a group have been pulled and handed off to
+    preprocessing (or to `handle_remaining_events`), for `get_progress`.
+    """
+    key = _get_dispatched_counter_key(group_id)
+    with _get_sync_redis_client().pipeline(transaction=False) as pipeline:
+        pipeline.incrby(key, num_events)
+        pipeline.expire(key, settings.SENTRY_REPROCESSING_SYNC_TTL)
+        pipeline.execute()
+
+
 def get_progress(group_id):
-    pending = _get_sync_redis_client().get(_get_sync_counter_key(group_id))
-    info = _get_sync_redis_client().get(_get_info_reprocessed_key(group_id))
+    with _get_sync_redis_client().pipeline(transaction=False) as pipeline:
+        pipeline.get(_get_sync_counter_key(group_id))
+        pipeline.get(_get_info_reprocessed_key(group_id))
+        pipeline.get(_get_dispatched_counter_key(group_id))
+        pending, info, dispatched = pipeline.execute()
+
     if pending is None:
         logger.error("reprocessing2.missing_counter")
         return 0, None
@@ -700,5 +784,7 @@ def get_progress(group_id):
     # Our internal sync counters are counting over *all* events, but the
     # progressbar in the frontend goes until max_events. Advance progressbar
     # proportionally.
-    pending = int(int(pending) * info["totalEvents"] / float(info.get("syncCount") or 1))
+    ratio = info["totalEvents"] / float(info.get("syncCount") or 1)
+    pending = int(int(pending) * ratio)
+    info["dispatchedEvents"] = min(int(int(dispatched or 0) * ratio), info["totalEvents"])
     return pending, info
@@ -32,10 +32,26 @@ def get_project(value):
 # and child proc
 _STOP_WORKER = "91650ec271ae4b3e8a67cdc909d80f8c"
 
+# Marks a job that bulk deletes a primary key range of a table (as opposed to
+# a chunk of ids that is deleted through the deletions code path.)
+_BULK_DELETE_RANGE = "2a8e4e7b5d0c4f0f9d1b6e3c7a9f0b12"
+
+# Reported by a worker instead of the number of deleted rows when deleting a
+# primary key range failed.
+_BULK_DELETE_FAILED = "e5b4c1f0a3d24c6e8f7a2b9d0c1e3f45"
+
+# Number of primary key ranges per worker that bulk deletes are split into, so
+# that workers which finish their ranges early can pick up more work.
+BULK_DELETE_RANGES_PER_WORKER = 4
+
+# Per-query duration (in seconds) that the chunk size of ranged bulk deletes
+# is adjusted towards.
+BULK_DELETE_TARGET_DURATION = 1.0
+
 API_TOKEN_TTL_IN_DAYS = 30
 
 
-def multiprocess_worker(task_queue):
+def multiprocess_worker(task_queue, result_queue):
     # Configure within each Process
     import logging
 
@@ -73,6 +89,28 @@ def multiprocess_worker(task_queue):
                 similarity,
             ] + [b[0] for b in EXTRA_BULK_QUERY_DELETES]
 
+        if j[0] == _BULK_DELETE_RANGE:
+            from sentry.db.deletion import BulkDeleteQuery
+
+            _, model, dtfield, days, project_id, min_id, max_id, chunk_size = j
+            deleted = _BULK_DELETE_FAILED
+            try:
+                deleted = BulkDeleteQuery(
+                    model=import_string(model), dtfield=dtfield, days=days, project_id=project_id
+                ).execute_range(
+                    min_id,
+                    max_id,
+                    chunk_size=chunk_size,
+                    target_duration=BULK_DELETE_TARGET_DURATION,
+                )
+            except Exception as e:
+                logger.exception(e)
+            finally:
+                # Always report back, the parent waits for one result per range.
+                result_queue.put(deleted)
+                task_queue.task_done()
+            continue
+
         model, chunk = j
         model = import_string(model)
 
@@ -135,11 +173,14 @@ def cleanup(days, project, concurrency, silent, model, router, timed):
     # before we import or configure the app
     from multiprocessing import JoinableQueue as Queue
     from multiprocessing import Process
+    from multiprocessing import Queue as ResultQueue
 
     pool = []
+    failed_models = []
     task_queue = Queue(1000)
+    result_queue = ResultQueue()
     for _ in range(concurrency):
-        p = Process(target=multiprocess_worker, args=(task_queue,))
+        p = Process(target=multiprocess_worker, args=(task_queue, result_queue))
         p.daemon = True
         p.start()
         pool.append(p)
@@ -273,14 +314,21 @@ def cleanup(days, project, concurrency, silent, model, router, timed):
             if is_filtered(model):
                 if not silent:
                     click.echo(">> Skipping %s" % model.__name__)
-            else:
+            elif not bulk_query_delete(
+                task_queue,
+                result_queue,
                 BulkDeleteQuery(
                     model=model,
                     dtfield=dtfield,
                     days=days,
                     project_id=project_id,
                     order_by=order_by,
-                ).execute(chunk_size=chunk_size)
+                ),
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+                silent=silent,
+            ):
+                failed_models.append(model.__name__)
 
         for model, dtfield, order_by in DELETES:
             if not silent:
@@ -334,6 +382,70 @@ def cleanup(days, project, concurrency, silent, model, router, timed):
         metrics.timing("cleanup.duration", duration, instance=router, sample_rate=1.0)
         click.echo("Clean up took %s second(s)." % duration)
 
+    if failed_models:
+        raise click.ClickException("Failed to delete all rows of: %s" % ", ".join(failed_models))
+
+
+def bulk_query_delete(task_queue, result_queue, query, chunk_size, concurrency, silent):
+    """
+    Run a ``BulkDeleteQuery``. With more than one worker, the table is split
+    into primary key ranges which are deleted by the worker pool in parallel.
+    Ordered deletes cannot be split and run in this process. Returns whether
+    all rows were deleted successfully.
+    """
+    start = time.time()
+
+    def echo_progress(deleted, message=""):
+        if not silent:
+            duration = max(time.time() - start, 0.001)
+            click.echo(
+                ">> {}{} rows deleted in {:.1f}s ({:.0f} rows/s)".format(
+                    message, deleted, duration, deleted / duration
+                )
+            )
+
+    if concurrency == 1 or query.order_by:
+        echo_progress(query.execute(chunk_size=chunk_size))
+        return True
+
+    model = ".".join((query.model.__module__, query.model.__name__))
+    ranges = query.get_id_ranges(concurrency * BULK_DELETE_RANGES_PER_WORKER)
+    for min_id, max_id in ranges:
+        task_queue.put(
+            (
+                _BULK_DELETE_RANGE,
+                model,
+                query.dtfield,
+                query.days,
+                query.project_id,
+                min_id,
+                max_id,
+                chunk_size,
+            )
+        )
+
+    deleted = 0
+    failed = 0
+    for done in range(1, len(ranges) + 1):
+        result = result_queue.get()
+        if result == _BULK_DELETE_FAILED:
+            failed += 1
+        else:
+            deleted += result
+        echo_progress(
+            deleted, f"{done}/{len(ranges)} ranges done, {len(ranges) - done} remaining, "
+        )
+
+    task_queue.join()
+
+    if not ranges:
+        echo_progress(deleted)
+
+    if failed:
+        click.echo(f">> Failed to delete {failed}/{len(ranges)} ranges", err=True)
+
+    return failed == 0
+
 
 def cleanup_unused_files(quiet=False):
     """
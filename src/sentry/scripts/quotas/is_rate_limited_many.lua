@@ -0,0 +1,57 @@
+-- Check and consume quotas for a batch of items in a single call. This is the
+-- batched form of ``is_rate_limited.lua``: items are processed in order, and
+-- every accepted item is counted before the next one is checked.
+--
+-- ``KEYS`` contains the counter and refund counter key of every quota of every
+-- item, in order. ``ARGV`` contains, for every item, the number of quotas and
+-- the quantity of the item, followed by the limit and expiration timestamp of
+-- each of its quotas.
+--
+-- For example, two items with quantity 1 and 5 that are both checked against
+-- quota ``foo`` (limit 10, expires at ``100``), the second one also against
+-- quota ``bar`` (limit 20, expires at ``200``):
+--
+--   KEYS = {"foo", "r:foo", "foo", "r:foo", "bar", "r:bar"}
+--   ARGV = {1, 1, 10, 100, 2, 5, 10, 100, 20, 200}
+--
+-- A limit of ``-1`` means "no limit". The result is a flat array containing
+-- ``1`` for every quota that *rejected* its item and ``0`` otherwise. An item
+-- is only counted against its quotas if none of them rejected it.
+local results = {}
+local key_index = 1
+local arg_index = 1
+
+while arg_index <= #ARGV do
+    local count = tonumber(ARGV[arg_index])
+    local quantity = tonumber(ARGV[arg_index + 1])
+    arg_index = arg_index + 2
+
+    local failed = false
+    for i=0, count - 1 do
+        local key = KEYS[key_index + i * 2]
+        local refund_key = KEYS[key_index + i * 2 + 1]
+        local limit = tonumber(ARGV[arg_index + i * 2])
+        local rejected = 0
+        if limit >= 0 then
+            local used = (redis.call('GET', key) or 0) - (redis.call('GET', refund_key) or 0)
+            if used + quantity > limit then
+                rejected = 1
+                failed = true
+            end
+        end
+        table.insert(results, rejected)
+    end
+
+    if not failed then
+        for i=0, count - 1 do
+            local key = KEYS[key_index + i * 2]
+            redis.call('INCRBY', key, quantity)
+            redis.call('EXPIREAT', key, ARGV[arg_index + i * 2 + 1])
+        end
+    end
+
+    key_index = key_index + count * 2
+    arg_index = arg_index + count * 2
+end
+
+return results
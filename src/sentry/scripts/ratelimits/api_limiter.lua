@@ -31,22 +31,19 @@ local cur_time = tonumber(ARGV[3])
 -- or the server timed it out
 local max_tll_seconds = tonumber(ARGV[4])
 
--- NOTE (Volo): this is only for debug purposes and should be taken out by 2022-04-01
--- this is trying to figure out how many stale requests were cleaned up to make sure
--- that the rate limiter is working correctly
-local current_executions_pre_cleanup = redis.call("zcard", key)
-
 -- first we remove all the requests whose scores (i.e. their timestamps) are older than the now - max ttl
 -- this prevents us from overcounting concurrent requests
-redis.call("zremrangebyscore", key, "-inf", cur_time - max_tll_seconds)
+local cleaned_up_requests = redis.call("zremrangebyscore", key, "-inf", cur_time - max_tll_seconds)
 -- get the size of the set, which tells us how many requests are currently executing
 local current_executions = redis.call("zcard", key)
 local allowed = current_executions < concurrent_limit
-local cleaned_up_requests = current_executions_pre_cleanup - current_executions
 
 if allowed then
   -- if below the limit, add to the set
   redis.call("zadd", key, cur_time, request_uid)
+  -- every entry is stale after the max ttl, so a set that did not see new
+  -- requests for that long can be dropped entirely
+  redis.call("expire", key, math.ceil(max_tll_seconds))
   -- a lua script executes atomically and only one element was added to the set
   -- hence we can safely say that the amount of current executions is one higher
   -- than it was before
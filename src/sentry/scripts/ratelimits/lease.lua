@@ -0,0 +1,28 @@
+-- Reserves a batch of requests from a fixed window rate limit counter, so
+-- that a process can admit the following requests for the same key without
+-- another round trip.
+--
+-- Input:
+-- keys:
+--  redis_key
+-- args:
+--  limit, lease_size, expiration_seconds
+--
+-- Output:
+-- counter value after the reservation, reserved requests
+--
+-- At most ``lease_size`` requests are reserved, but never more than what is
+-- left below ``limit``. The request asking for the lease is always counted,
+-- even if the limit was already reached, which matches a plain INCR.
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local lease_size = tonumber(ARGV[2])
+local expiration = tonumber(ARGV[3])
+
+local current = tonumber(redis.call('GET', key) or 0)
+local reserved = math.max(math.min(lease_size, limit - current), 1)
+
+local value = redis.call('INCRBY', key, reserved)
+redis.call('EXPIRE', key, expiration)
+
+return {value, reserved}
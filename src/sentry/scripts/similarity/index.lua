@@ -603,6 +603,20 @@ local function search(configuration, parameters, limit)
     return results
 end
 
+local function record_signatures(configuration, key, signatures)
+    return table.imap(
+        signatures,
+        function (signature)
+            set_frequencies(configuration, signature.index, key, signature.frequencies)
+            for band, buckets in ipairs(signature.frequencies) do
+                for bucket in pairs(buckets) do
+                    get_bucket_membership_set(configuration, signature.index, band, bucket):add(key)
+                end
+            end
+        end
+    )
+end
+
 
 -- Command Parsing
 
@@ -618,15 +632,36 @@ local commands = {
             )
         )(cursor, arguments)
 
+        return record_signatures(configuration, key, signatures)
+    end,
+    RECORD_MANY = function (configuration, cursor, arguments)
+        --[[
+        Records signatures for several keys at once. Each record consists of
+        the key, the timestamp the record is made at, the number of signatures
+        for that key, and the signatures themselves (in the same format as
+        ``RECORD``.)
+        ]]--
+        local cursor, records = variadic_argument_parser(
+            object_argument_parser({
+                {"key", argument_parser(validate_value)},
+                {"timestamp", argument_parser(validate_number)},
+                {"signatures", repeated_argument_parser(
+                    object_argument_parser({
+                        {"index", argument_parser(validate_value)},
+                        {"frequencies", frequencies_argument_parser(configuration)},
+                    })
+                )},
+            })
+        )(cursor, arguments)
+
         return table.imap(
-            signatures,
-            function (signature)
-                set_frequencies(configuration, signature.index, key, signature.frequencies)
-                for band, buckets in ipairs(signature.frequencies) do
-                    for bucket in pairs(buckets) do
-                        get_bucket_membership_set(configuration, signature.index, band, bucket):add(key)
-                    end
-                end
+            records,
+            function (record)
+                local record_configuration = setmetatable(
+                    {timestamp = record.timestamp},
+                    {__index = configuration}
+                )
+                return record_signatures(record_configuration, record.key, record.signatures)
             end
         )
     end,
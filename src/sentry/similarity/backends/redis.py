@@ -36,8 +36,11 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
         if not features:
             return [0] * self.bands
 
+        return self._build_signature_arguments_from_signature(self.signature_builder(features))
+
+    def _build_signature_arguments_from_signature(self, signature):
         arguments = []
-        for bucket in band(self.bands, self.signature_builder(features)):
+        for bucket in band(self.bands, signature):
             arguments.extend([1, ",".join(map("{}".format, bucket)), 1])
         return arguments
 
@@ -143,6 +146,52 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
 
         return self.__index(scope, arguments)
 
+    def record_many(self, scope, records, timestamp=None):
+        """\
+        Record the features of several keys within a scope using a single
+        script invocation. ``records`` is a sequence of ``(key, items,
+        timestamp)`` tuples, where ``items`` has the same structure as for
+        ``record``. Records without a timestamp use ``timestamp``.
+        """
+        records = [record for record in records if record[1]]
+        if not records:
+            return  # nothing to do
+
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        signatures = iter(
+            self.signature_builder.build_many(
+                [features for _, items, _ in records for _, features in items if features]
+            )
+        )
+
+        arguments = [
+            "RECORD_MANY",
+            timestamp,
+            self.namespace,
+            self.bands,
+            self.interval,
+            self.retention,
+            self.candidate_set_limit,
+            scope,
+        ]
+
+        for key, items, record_timestamp in records:
+            arguments.extend(
+                [key, record_timestamp if record_timestamp is not None else timestamp, len(items)]
+            )
+            for idx, features in items:
+                arguments.append(idx)
+                if features:
+                    arguments.extend(
+                        self._build_signature_arguments_from_signature(next(signatures))
+                    )
+                else:
+                    arguments.extend([0] * self.bands)
+
+        return self.__index(scope, arguments)
+
     def merge(self, scope, destination, items, timestamp=None):
         if timestamp is None:
             timestamp = int(time.time())
@@ -96,31 +96,26 @@ class FeatureSet:
         return results
 
     def record(self, events):
+        """\
+        Record the features of the provided events. Events may belong to
+        several groups (and projects); the features are recorded with a single
+        index call for each project, each at the time of its event.
+        """
         if not events:
             return []
 
-        scope = None
-        key = None
+        # scope -> (key, timestamp) -> items
+        records = {}
 
-        items = []
         for event in events:
             if not event.group_id:
                 continue
-            for label, features in self.extract(event).items():
-                if scope is None:
-                    scope = self.__get_scope(event.project)
-                else:
-                    assert (
-                        self.__get_scope(event.project) == scope
-                    ), "all events must be associated with the same project"
 
-                if key is None:
-                    key = self.__get_key(event.group)
-                else:
-                    assert (
-                        self.__get_key(event.group) == key
-                    ), "all events must be associated with the same group"
+            scope = self.__get_scope(event.project)
+            key = self.__get_key(event.group)
+            timestamp = int(to_timestamp(event.datetime))
 
+            for label, features in self.extract(event).items():
                 try:
                     features = map(self.encoder.dumps, features)
                 except Exception as error:
@@ -137,9 +132,17 @@ class FeatureSet:
                     )
                 else:
                     if features:
-                        items.append((self.aliases[label], features))
-
-        return self.index.record(scope, key, items, timestamp=int(to_timestamp(event.datetime)))
+                        records.setdefault(scope, {}).setdefault((key, timestamp), []).append(
+                            (self.aliases[label], features)
+                        )
+
+        return [
+            self.index.record_many(
+                scope,
+                [(key, items, timestamp) for (key, timestamp), items in scope_records.items()],
+            )
+            for scope, scope_records in records.items()
+        ]
 
     def classify(self, events, limit=None, thresholds=None):
         if not events:
@@ -1,17 +1,32 @@
 import mmh3
 
-from sentry.utils.compat import map
-
 
 class MinHashSignatureBuilder:
     def __init__(self, columns, rows):
         self.columns = columns
         self.rows = rows
 
+    def __get_hashes(self, feature):
+        return [mmh3.hash(feature, column) % self.rows for column in range(self.columns)]
+
     def __call__(self, features):
-        return map(
-            lambda column: min(
-                map(lambda feature: mmh3.hash(feature, column) % self.rows, features)
-            ),
-            range(self.columns),
-        )
+        return self.build_many([features])[0]
+
+    def build_many(self, feature_sets):
+        """\
+        Build signatures for several feature sets at once. Each distinct
+        feature is only hashed once per batch, which avoids repeating work
+        for features that are shared between the events of a batch (common
+        for shingles taken from the same stack trace or message.)
+        """
+        cache = {}
+        signatures = []
+        for features in feature_sets:
+            hashes = []
+            for feature in features:
+                value = cache.get(feature)
+                if value is None:
+                    value = cache[feature] = self.__get_hashes(feature)
+                hashes.append(value)
+            signatures.append(list(map(min, zip(*hashes))))
+        return signatures
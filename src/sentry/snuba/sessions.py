@@ -8,10 +8,12 @@ from snuba_sdk.entity import Entity
 from snuba_sdk.function import Function
 from snuba_sdk.query import Query
 
-from sentry import release_health
+from sentry import options, release_health
 from sentry.snuba.dataset import Dataset
-from sentry.utils import snuba
+from sentry.utils import metrics, snuba
+from sentry.utils.cache import cache
 from sentry.utils.dates import to_datetime, to_timestamp
+from sentry.utils.hashlib import md5_text
 from sentry.utils.snuba import QueryOutsideRetentionError, parse_snuba_datetime, raw_query
 
 DATASET_BUCKET = 3600
@@ -380,6 +382,67 @@ def extract_duration_quantiles(raw_stats):
         }
 
 
+def _get_release_stats_rows(project_releases, environments, stat, rollup, start, now=None):
+    """Returns the per bucket `stat` of the given project releases since `start`.
+
+    Buckets that ended more than a grace period ago no longer receive data, so
+    the fully closed buckets are cached and only the partial bucket at the
+    start of the range and the still open buckets at the end are queried.
+    The cache key only changes when a bucket closes, so repeated loads of the
+    same page reuse the closed part.
+    """
+    if now is None:
+        now = datetime.now(pytz.utc)
+
+    conditions, filter_keys = _get_conditions_and_filter_keys(project_releases, environments)
+
+    def query(start, end=None, extra_conditions=()):
+        return raw_query(
+            dataset=Dataset.Sessions,
+            selected_columns=["release", "project_id", "bucketed_started", stat],
+            groupby=["release", "project_id", "bucketed_started"],
+            rollup=rollup,
+            start=start,
+            end=end,
+            conditions=conditions + list(extra_conditions),
+            filter_keys=filter_keys,
+            referrer="sessions.release-stats",
+        )["data"]
+
+    grace = options.get("release-health.closed-bucket-grace-seconds")
+    head_end = int(to_timestamp(start) // rollup + 1) * rollup
+    closed_end = int((to_timestamp(now) - grace) // rollup) * rollup
+    if closed_end <= head_end:
+        return query(start)
+
+    cache_key = "sessions.release-stats:{}".format(
+        md5_text(
+            repr(sorted(project_releases)),
+            repr(sorted(environments) if environments is not None else None),
+            stat,
+            rollup,
+            head_end,
+            closed_end,
+        ).hexdigest()
+    )
+    closed_rows = cache.get(cache_key)
+    metrics.incr("sessions.release-stats.closed-buckets", tags={"hit": closed_rows is not None})
+    if closed_rows is None:
+        closed_rows = query(to_datetime(head_end), to_datetime(closed_end))
+        cache.set(cache_key, closed_rows, rollup)
+
+    open_rows = query(
+        start,
+        extra_conditions=[
+            [
+                ["started", "<", to_datetime(head_end)],
+                ["started", ">=", to_datetime(closed_end)],
+            ]
+        ],
+    )
+    return closed_rows + open_rows
+
+
 def _get_release_health_data_overview(
     project_releases,
     environments=None,
@@ -484,16 +547,9 @@ def _get_release_health_data_overview(
         rv[key]["total_project_sessions_24h"] = adoption_info.get("project_sessions_24h")
 
     if health_stats_period:
-        for x in raw_query(
-            dataset=Dataset.Sessions,
-            selected_columns=["release", "project_id", "bucketed_started", stat],
-            groupby=["release", "project_id", "bucketed_started"],
-            rollup=stats_rollup,
-            start=stats_start,
-            conditions=conditions,
-            filter_keys=filter_keys,
-            referrer="sessions.release-stats",
-        )["data"]:
+        for x in _get_release_stats_rows(
+            project_releases, environments, stat, stats_rollup, stats_start, now=now
+        ):
             time_bucket = int(
                 (parse_snuba_datetime(x["bucketed_started"]) - stats_start).total_seconds()
                 / stats_rollup
@@ -289,6 +289,7 @@ class TagStorage(Service):
         environment_ids,
         keys=None,
         value_limit=TOP_VALUES_DEFAULT_LIMIT,
+        last_seen=None,
         **kwargs,
     ):
 
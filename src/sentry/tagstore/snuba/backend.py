@@ -1,4 +1,5 @@
 import functools
+import random
 import re
 from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
@@ -9,6 +10,7 @@ from django.core.cache import cache
 from pytz import UTC
 from sentry_relay.consts import SPAN_STATUS_CODE_TO_NAME
 
+from sentry import options
 from sentry.api.utils import default_start_end_dates
 from sentry.models import (
     Project,
@@ -237,6 +239,10 @@ class SnubaTagStorage(TagStorage):
         conditions = [DEFAULT_TYPE_CONDITION]
         conditions = []
 
+        # Callers that don't explicitly ask for the cache (eg. autocomplete
+        # across projects) can still be rolled onto it via sampling.
+        if not use_cache:
+            use_cache = random.random() < options.get("snuba.tagstore.cache-tagkeys-rate")
         should_cache = use_cache and group_id is None
         result = None
 
@@ -248,6 +254,11 @@ class SnubaTagStorage(TagStorage):
         if should_cache:
             filtering_strings = [f"{key}={value}" for key, value in filters.items()]
             filtering_strings.append(f"dataset={dataset.name}")
+            # The shape of the result depends on these as well, callers asking
+            # for different ones must not share an entry.
+            filtering_strings.append(f"include_values_seen={include_values_seen}")
+            filtering_strings.append(f"limit={limit}")
+            filtering_strings.extend(f"{key}={value}" for key, value in sorted(kwargs.items()))
             cache_key = "tagstore.__get_tag_keys:{}".format(
                 md5_text(*filtering_strings).hexdigest()
             )
@@ -487,6 +498,25 @@ class SnubaTagStorage(TagStorage):
         tag = self.__get_tag_key_and_top_values(project_id, group_id, environment_id, key, limit)
         return tag.top_values
 
+    def __get_group_tag_keys_and_top_values_cache_key(
+        self, project_id, group_id, environment_ids, keys, value_limit, last_seen
+    ):
+        """
+        The cache key includes the group's `last_seen`, so that a new event for
+        the group (which moves `last_seen` forward when buffers are flushed)
+        makes previously cached facets unreachable.
+        """
+        return "tagstore.__get_group_tag_keys_and_top_values:{}".format(
+            md5_text(
+                project_id,
+                group_id,
+                sorted(environment_ids or []),
+                sorted(keys) if keys is not None else None,
+                value_limit,
+                last_seen.isoformat(),
+            ).hexdigest()
+        )
+
     def get_group_tag_keys_and_top_values(
         self,
         project_id,
@@ -495,6 +525,74 @@ class SnubaTagStorage(TagStorage):
         user=None,
         keys=None,
         value_limit=TOP_VALUES_DEFAULT_LIMIT,
+        last_seen=None,
+        **kwargs,
+    ):
+        cache_ttl = options.get("snuba.tagstore.group-tag-values-cache-ttl")
+        # Only the default (retention wide) window is cached, custom conditions
+        # or time ranges always go to snuba. Callers pass the group's
+        # `last_seen` to opt in, as they already have the group at hand.
+        cache_key = None
+        if cache_ttl > 0 and group_id is not None and last_seen is not None and not kwargs:
+            cache_key = self.__get_group_tag_keys_and_top_values_cache_key(
+                project_id, group_id, environment_ids, keys, value_limit, last_seen
+            )
+
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                metrics.incr("tagstore.group_tag_keys_and_top_values.cache", tags={"hit": True})
+                return {
+                    GroupTagKey(
+                        group_id=group_id,
+                        key=key,
+                        count=count,
+                        top_values=[
+                            GroupTagValue(group_id=group_id, key=key, **value)
+                            for value in top_values
+                        ],
+                    )
+                    for key, count, top_values in cached
+                }
+            metrics.incr("tagstore.group_tag_keys_and_top_values.cache", tags={"hit": False})
+
+        keys_with_counts = self.__get_group_tag_keys_and_top_values(
+            project_id, group_id, environment_ids, keys=keys, value_limit=value_limit, **kwargs
+        )
+
+        if cache_key is not None:
+            # `count` and `top_values` are not part of the pickled state of
+            # tag types, so the result is cached as plain data.
+            cache.set(
+                cache_key,
+                [
+                    (
+                        keyobj.key,
+                        keyobj.count,
+                        [
+                            {
+                                "value": value.value,
+                                "times_seen": value.times_seen,
+                                "first_seen": value.first_seen,
+                                "last_seen": value.last_seen,
+                            }
+                            for value in keyobj.top_values
+                        ],
+                    )
+                    for keyobj in keys_with_counts
+                ],
+                cache_ttl,
+            )
+
+        return keys_with_counts
+
+    def __get_group_tag_keys_and_top_values(
+        self,
+        project_id,
+        group_id,
+        environment_ids,
+        keys=None,
+        value_limit=TOP_VALUES_DEFAULT_LIMIT,
         **kwargs,
     ):
         # Similar to __get_tag_key_and_top_values except we get the top values
@@ -3,14 +3,15 @@ Tasks that automate the job of moving projects in and out of symbolicator's low
 on symbolication metrics stored in Redis.
 
 This has three major tasks, executed in the following general order:
-1. Scan for new suspect projects in Redis that need to be checked for LPQ eligibility. Triggers 2 and 3.
-2. Determine a project's eligibility for the LPQ based on their recorded metrics.
+1. Scan for new suspect projects in Redis that need to be checked for LPQ eligibility, and
+   determine the eligibility of all of them in a single pass.
+2. Determine a single project's eligibility for the LPQ based on their recorded metrics.
 3. Remove some specified project from the LPQ.
 """
 
 import logging
 import time
-from typing import Literal
+from typing import Iterable, Literal
 
 import sentry_sdk
 
@@ -43,12 +44,11 @@ def scan_for_suspect_projects() -> None:
 
 
 def _scan_for_suspect_projects() -> None:
-    suspect_projects = set()
     now = int(time.time())
 
-    for project_id in realtime_metrics.projects():
-        suspect_projects.add(project_id)
-        update_lpq_eligibility.delay(project_id=project_id, cutoff=now)
+    suspect_projects = set(realtime_metrics.projects())
+    if suspect_projects:
+        _update_lpq_eligibilities(suspect_projects, now)
 
     # Prune projects we definitely know shouldn't be in the queue any more.
     # `update_lpq_eligibility` should handle removing suspect projects from the list if it turns
@@ -83,25 +83,47 @@ def update_lpq_eligibility(project_id: int, cutoff: int) -> None:
 
 
 def _update_lpq_eligibility(project_id: int, cutoff: int) -> None:
-    # TODO: It may be a good idea to figure out how to debounce especially if this is
-    # executing more than 10s after cutoff.
+    _update_lpq_eligibilities([project_id], cutoff)
 
-    event_counts = realtime_metrics.get_counts_for_project(project_id, cutoff)
-    durations = realtime_metrics.get_durations_for_project(project_id, cutoff)
 
-    excessive_rate = excessive_event_rate(project_id, event_counts)
-    excessive_duration = excessive_event_duration(project_id, durations)
+def _update_lpq_eligibilities(project_ids: Iterable[int], cutoff: int) -> None:
+    """
+    Determines the LPQ eligibility of all given projects at once.
 
-    if excessive_rate or excessive_duration:
-        was_added = realtime_metrics.add_project_to_lpq(project_id)
-        if was_added:
-            reason = "rate" if excessive_rate else "duration"
-            if excessive_rate and excessive_duration:
-                reason = "rate-duration"
-            _report_change(project_id=project_id, change="added", reason=reason)
-    else:
-        was_removed = realtime_metrics.remove_projects_from_lpq({project_id})
-        if was_removed:
+    The metrics of all projects are fetched in bulk, and only projects that are currently in the
+    LPQ are considered for removal, so that the number of calls to the store does not grow with
+    the number of projects that merely report metrics.
+    """
+    # TODO: It may be a good idea to figure out how to debounce especially if this is
+    # executing more than 10s after cutoff.
+    project_ids = list(project_ids)
+
+    event_counts = realtime_metrics.get_counts_for_projects(project_ids, cutoff)
+    durations = realtime_metrics.get_durations_for_projects(project_ids, cutoff)
+    current_lpq_projects = realtime_metrics.get_lpq_projects()
+
+    ineligible_projects = set()
+    for project_id in project_ids:
+        excessive_rate = excessive_event_rate(project_id, event_counts[project_id])
+        excessive_duration = excessive_event_duration(project_id, durations[project_id])
+
+        if excessive_rate or excessive_duration:
+            was_added = realtime_metrics.add_project_to_lpq(project_id)
+            if was_added:
+                reason = "rate" if excessive_rate else "duration"
+                if excessive_rate and excessive_duration:
+                    reason = "rate-duration"
+                _report_change(project_id=project_id, change="added", reason=reason)
+        elif project_id in current_lpq_projects:
+            ineligible_projects.add(project_id)
+
+    if not ineligible_projects:
+        return
+
+    if realtime_metrics.remove_projects_from_lpq(ineligible_projects):
+        # Projects which are backing off stay in the queue, only report the ones that left it.
+        removed_projects = ineligible_projects.difference(realtime_metrics.get_lpq_projects())
+        for project_id in removed_projects:
             _report_change(project_id=project_id, change="removed", reason="ineligible")
 
 
@@ -30,7 +30,7 @@ def update_config_cache(
 
     from sentry.models import Project, ProjectKey, ProjectKeyStatus
     from sentry.relay import projectconfig_cache
-    from sentry.relay.config import get_project_config
+    from sentry.relay.config import get_project_configs
 
     if project_id:
         set_current_event_project(project_id)
@@ -56,13 +56,21 @@ def update_config_cache(
 
     if organization_id:
         projects = list(Project.objects.filter(organization_id=organization_id))
-        keys = list(ProjectKey.objects.filter(project__in=projects))
+        keys = list(
+            ProjectKey.objects.filter(project__in=projects).select_related("project__organization")
+        )
     elif project_id:
         projects = [Project.objects.get(id=project_id)]
-        keys = list(ProjectKey.objects.filter(project__in=projects))
+        keys = list(
+            ProjectKey.objects.filter(project__in=projects).select_related("project__organization")
+        )
     elif public_key:
         try:
-            keys = [ProjectKey.objects.get(public_key=public_key)]
+            keys = [
+                ProjectKey.objects.select_related("project__organization").get(
+                    public_key=public_key
+                )
+            ]
         except ProjectKey.DoesNotExist:
             # In this particular case, where a project key got deleted and
             # triggered an update, we at least know the public key that needs
@@ -78,14 +86,15 @@ def update_config_cache(
         assert False
 
     if generate:
+        active_keys = [key for key in keys if key.status == ProjectKeyStatus.ACTIVE]
+        project_configs = get_project_configs(active_keys, full_config=True)
+
         config_cache = {}
         for key in keys:
             if key.status != ProjectKeyStatus.ACTIVE:
                 project_config = {"disabled": True}
             else:
-                project_config = get_project_config(
-                    key.project, project_keys=[key], full_config=True
-                ).to_dict()
+                project_config = project_configs[key.public_key].to_dict()
             config_cache[key.public_key] = project_config
 
         projectconfig_cache.set_many(config_cache)
@@ -35,6 +35,8 @@ def reprocess_group(
         CannotReprocess,
         buffered_handle_remaining_events,
         logger,
+        mark_events_dispatched,
+        pull_event_data_multi,
         reprocess_event,
         start_group_reprocessing,
     )
@@ -79,14 +81,29 @@ def reprocess_group(
 
     remaining_event_ids = []
 
+    # Pull nodestore payloads and attachments for the entire page at once. If
+    # that fails, every event is pulled individually by `reprocess_event`.
+    pulled_events = {}
+    if max_events is None or max_events > 0:
+        with sentry_sdk.start_span(op="reprocess_events.pull_event_data_multi"):
+            try:
+                pulled_events = pull_event_data_multi(project_id, events)
+            except Exception:
+                sentry_sdk.capture_exception()
+
     for event in events:
         if max_events is None or max_events > 0:
             with sentry_sdk.start_span(op="reprocess_event"):
                 try:
+                    reprocessable_event = pulled_events.get(event.event_id)
+                    if isinstance(reprocessable_event, CannotReprocess):
+                        raise reprocessable_event
+
                     reprocess_event(
                         project_id=project_id,
                         event_id=event.event_id,
                         start_time=start_time,
+                        reprocessable_event=reprocessable_event,
                     )
                 except CannotReprocess as e:
                     logger.error(f"reprocessing2.{e}")
@@ -113,6 +130,8 @@ def reprocess_group(
             remaining_events=remaining_events,
         )
 
+    mark_events_dispatched(group_id, len(events))
+
     reprocess_group.delay(
         project_id=project_id,
         group_id=group_id,
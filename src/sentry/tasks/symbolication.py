@@ -91,6 +91,8 @@ def submit_symbolicate(
     start_time: Optional[int],
     data: Optional[Event],
     queue_switches: int = 0,
+    symbolication_start_time: Optional[float] = None,
+    submit_realtime_metrics: Optional[bool] = None,
 ) -> None:
     if is_low_priority:
         task = (
@@ -107,6 +109,8 @@ def submit_symbolicate(
         event_id=event_id,
         data=data,
         queue_switches=queue_switches,
+        symbolication_start_time=symbolication_start_time,
+        submit_realtime_metrics=submit_realtime_metrics,
     )
 
 
@@ -117,9 +121,14 @@ def _do_symbolicate_event(
     symbolicate_task: Callable[[Optional[str], Optional[int], Optional[str]], None],
     data: Optional[Event] = None,
     queue_switches: int = 0,
+    symbolication_start_time: Optional[float] = None,
+    submit_realtime_metrics: Optional[bool] = None,
 ) -> None:
     from sentry.lang.native.processing import get_symbolication_function
 
+    # Kept around to hand to the task again when symbolication is deferred.
+    original_data = data
+
     if data is None:
         data = processing.event_processing_store.get(cache_key)
 
@@ -163,6 +172,8 @@ def _do_symbolicate_event(
                 start_time,
                 data,
                 queue_switches + 1,
+                symbolication_start_time=symbolication_start_time,
+                submit_realtime_metrics=submit_realtime_metrics,
             )
             return
 
@@ -196,13 +207,18 @@ def _do_symbolicate_event(
 
     has_changed = False
 
-    symbolication_start_time = time()
+    # Symbolication that was deferred while waiting on symbolicator resumes with the original
+    # start time and sampling decision, so that timeouts and durations cover all attempts.
+    is_resumed = symbolication_start_time is not None
+    if symbolication_start_time is None:
+        symbolication_start_time = time()
 
-    submission_ratio = options.get("symbolicate-event.low-priority.metrics.submission-rate")
-    submit_realtime_metrics = not from_reprocessing and random.random() < submission_ratio
+    if submit_realtime_metrics is None:
+        submission_ratio = options.get("symbolicate-event.low-priority.metrics.submission-rate")
+        submit_realtime_metrics = not from_reprocessing and random.random() < submission_ratio
     timestamp = int(symbolication_start_time)
 
-    if submit_realtime_metrics:
+    if submit_realtime_metrics and not is_resumed:
         with sentry_sdk.start_span(op="tasks.store.symbolicate_event.low_priority.metrics.counter"):
             try:
                 realtime_metrics.increment_project_event_counter(project_id, timestamp)
@@ -267,6 +283,29 @@ def _do_symbolicate_event(
                             if e.retry_after is None
                             else min(e.retry_after, SYMBOLICATOR_MAX_RETRY_AFTER)
                         )
+
+                        if options.get("symbolicate-event.defer-retries"):
+                            # Free up the worker while symbolicator is busy.  The id of the
+                            # symbolicator request is cached, so the deferred task picks up
+                            # polling where this one left off.
+                            metrics.incr(
+                                "tasks.store.symbolicate_event.deferred",
+                                tags={"symbolication_function": symbolication_function_name},
+                            )
+                            symbolicate_task.apply_async(  # type: ignore
+                                kwargs={
+                                    "cache_key": cache_key,
+                                    "start_time": start_time,
+                                    "event_id": event_id,
+                                    "data": original_data,
+                                    "queue_switches": queue_switches,
+                                    "symbolication_start_time": symbolication_start_time,
+                                    "submit_realtime_metrics": submit_realtime_metrics,
+                                },
+                                countdown=sleep_time,
+                            )
+                            return
+
                         sleep(sleep_time)
                         continue
                 except Exception:
@@ -319,6 +358,8 @@ def symbolicate_event(
     event_id: Optional[str] = None,
     data: Optional[Event] = None,
     queue_switches: int = 0,
+    symbolication_start_time: Optional[float] = None,
+    submit_realtime_metrics: Optional[bool] = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -335,6 +376,8 @@ def symbolicate_event(
         symbolicate_task=symbolicate_event,
         data=data,
         queue_switches=queue_switches,
+        symbolication_start_time=symbolication_start_time,
+        submit_realtime_metrics=submit_realtime_metrics,
     )
 
 
@@ -351,6 +394,8 @@ def symbolicate_event_low_priority(
     event_id: Optional[str] = None,
     data: Optional[Event] = None,
     queue_switches: int = 0,
+    symbolication_start_time: Optional[float] = None,
+    submit_realtime_metrics: Optional[bool] = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -370,6 +415,8 @@ def symbolicate_event_low_priority(
         symbolicate_task=symbolicate_event_low_priority,
         data=data,
         queue_switches=queue_switches,
+        symbolication_start_time=symbolication_start_time,
+        submit_realtime_metrics=submit_realtime_metrics,
     )
 
 
@@ -386,6 +433,8 @@ def symbolicate_event_from_reprocessing(
     event_id: Optional[str] = None,
     data: Optional[Event] = None,
     queue_switches: int = 0,
+    symbolication_start_time: Optional[float] = None,
+    submit_realtime_metrics: Optional[bool] = None,
     **kwargs: Any,
 ) -> None:
     return _do_symbolicate_event(
@@ -395,6 +444,8 @@ def symbolicate_event_from_reprocessing(
         symbolicate_task=symbolicate_event_from_reprocessing,
         data=data,
         queue_switches=queue_switches,
+        symbolication_start_time=symbolication_start_time,
+        submit_realtime_metrics=submit_realtime_metrics,
     )
 
 
@@ -411,6 +462,8 @@ def symbolicate_event_from_reprocessing_low_priority(
     event_id: Optional[str] = None,
     data: Optional[Event] = None,
     queue_switches: int = 0,
+    symbolication_start_time: Optional[float] = None,
+    submit_realtime_metrics: Optional[bool] = None,
     **kwargs: Any,
 ) -> None:
     return _do_symbolicate_event(
@@ -420,4 +473,6 @@ def symbolicate_event_from_reprocessing_low_priority(
         symbolicate_task=symbolicate_event_from_reprocessing_low_priority,
         data=data,
         queue_switches=queue_switches,
+        symbolication_start_time=symbolication_start_time,
+        submit_realtime_metrics=submit_realtime_metrics,
     )
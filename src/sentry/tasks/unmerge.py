@@ -1,4 +1,5 @@
 import logging
+import math
 from collections import OrderedDict, defaultdict
 from functools import reduce
 from typing import Any, Mapping, Optional, Tuple
@@ -24,6 +25,7 @@ from sentry.models import (
 )
 from sentry.tasks.base import instrumented_task
 from sentry.unmerge import InitialUnmergeArgs, SuccessiveUnmergeArgs, UnmergeArgs, UnmergeArgsBase
+from sentry.utils.dates import to_datetime
 from sentry.utils.query import celery_run_batch_query
 from sentry.utils.safe import get_path
 
@@ -47,6 +49,11 @@ def cache(function):
         else:
             raise result
 
+    def prime(key, value):
+        results[key] = (True, value)
+
+    fetch.prime = prime
+
     return fetch
 
 
@@ -71,6 +78,25 @@ def get_caches():
     }
 
 
+def prime_caches(caches, project, events):
+    """\
+    Fetch the environments and releases referenced by a batch of events with a
+    single query each, rather than a query per distinct value.
+    """
+    environment_names = {get_environment_name(event) for event in events}
+    for environment in Environment.objects.filter(
+        organization_id=project.organization_id, name__in=environment_names
+    ):
+        caches["Environment"].prime((project.organization_id, environment.name), environment)
+
+    versions = {event.get_tag("sentry:release") for event in events} - {None, ""}
+    if versions:
+        for release in Release.objects.filter(
+            organization_id=project.organization_id, version__in=versions
+        ):
+            caches["Release"].prime((project.organization_id, release.version), release)
+
+
 def merge_mappings(values):
     result = {}
     for value in values:
@@ -347,19 +373,40 @@ def collect_release_data(caches, project, events):
 
 
 def repair_group_release_data(caches, project, events):
-    attributes = collect_release_data(caches, project, events).items()
-    for (group_id, environment, release_id), (first_seen, last_seen) in attributes:
-        instance, created = GroupRelease.objects.get_or_create(
-            project_id=project.id,
-            group_id=group_id,
-            environment=environment,
-            release_id=release_id,
-            defaults={"first_seen": first_seen, "last_seen": last_seen},
+    attributes = collect_release_data(caches, project, events)
+    if not attributes:
+        return
+
+    # Look up all existing instances at once, only falling back to
+    # ``get_or_create`` for those that do not exist yet.
+    instances = {
+        (instance.group_id, instance.environment, instance.release_id): instance
+        for instance in GroupRelease.objects.filter(
+            group_id__in={group_id for group_id, _, _ in attributes},
+            release_id__in={release_id for _, _, release_id in attributes},
         )
+    }
+
+    for key, (first_seen, last_seen) in attributes.items():
+        group_id, environment, release_id = key
+        instance = instances.get(key)
+        if instance is None:
+            instance, created = GroupRelease.objects.get_or_create(
+                project_id=project.id,
+                group_id=group_id,
+                environment=environment,
+                release_id=release_id,
+                defaults={"first_seen": first_seen, "last_seen": last_seen},
+            )
+        else:
+            created = False
 
         if not created:
             instance.update(first_seen=first_seen)
 
+        # Avoid fetching the instance again when collecting TSDB data.
+        caches["GroupRelease"].prime(key, instance)
+
 
 def get_event_user_from_interface(value):
     return EventUser(
@@ -370,7 +417,18 @@ def get_event_user_from_interface(value):
     )
 
 
+def get_tsdb_resolution():
+    """\
+    Returns the largest interval that all TSDB rollups are a multiple of.
+    Events that fall into the same interval always share the same bucket in
+    every rollup, so their writes can be combined.
+    """
+    return reduce(math.gcd, tsdb.get_rollups())
+
+
 def collect_tsdb_data(caches, project, events):
+    resolution = get_tsdb_resolution()
+
     counters = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
 
     sets = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
@@ -378,17 +436,19 @@ def collect_tsdb_data(caches, project, events):
     frequencies = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(int))))
 
     for event in events:
+        timestamp = to_datetime(tsdb.normalize_to_epoch(event.datetime, resolution))
+
         environment = caches["Environment"](project.organization_id, get_environment_name(event))
 
-        counters[event.datetime][tsdb.models.group][(event.group_id, environment.id)] += 1
+        counters[timestamp][tsdb.models.group][(event.group_id, environment.id)] += 1
 
         user = event.data.get("user")
         if user:
-            sets[event.datetime][tsdb.models.users_affected_by_group][
+            sets[timestamp][tsdb.models.users_affected_by_group][
                 (event.group_id, environment.id)
             ].add(get_event_user_from_interface(user).tag_value)
 
-        frequencies[event.datetime][tsdb.models.frequent_environments_by_group][event.group_id][
+        frequencies[timestamp][tsdb.models.frequent_environments_by_group][event.group_id][
             environment.id
         ] += 1
 
@@ -402,7 +462,7 @@ def collect_tsdb_data(caches, project, events):
                 caches["Release"](project.organization_id, release).id,
             )
 
-            frequencies[event.datetime][tsdb.models.frequent_releases_by_group][event.group_id][
+            frequencies[timestamp][tsdb.models.frequent_releases_by_group][event.group_id][
                 grouprelease.id
             ] += 1
 
@@ -413,15 +473,22 @@ def repair_tsdb_data(caches, project, events):
     counters, sets, frequencies = collect_tsdb_data(caches, project, events)
 
     for timestamp, data in counters.items():
+        items = defaultdict(list)
         for model, keys in data.items():
             for (key, environment_id), value in keys.items():
-                tsdb.incr(model, key, timestamp, value, environment_id=environment_id)
+                items[environment_id].append((model, key, {"count": value}))
+
+        for environment_id, _items in items.items():
+            tsdb.incr_multi(_items, timestamp, environment_id=environment_id)
 
     for timestamp, data in sets.items():
+        items = defaultdict(list)
         for model, keys in data.items():
             for (key, environment_id), values in keys.items():
-                # TODO: This should use `record_multi` rather than `record`.
-                tsdb.record(model, key, values, timestamp, environment_id=environment_id)
+                items[environment_id].append((model, key, values))
+
+        for environment_id, _items in items.items():
+            tsdb.record_multi(_items, timestamp, environment_id=environment_id)
 
     for timestamp, data in frequencies.items():
         tsdb.record_frequency_multi(data.items(), timestamp)
@@ -432,8 +499,7 @@ def repair_denormalizations(caches, project, events):
     repair_group_release_data(caches, project, events)
     repair_tsdb_data(caches, project, events)
 
-    for event in events:
-        similarity.record(project, [event])
+    similarity.record(project, events)
 
 
 def lock_hashes(project_id, source_id, fingerprints):
@@ -500,6 +566,8 @@ def unmerge(*posargs, **kwargs):
                 args.replacement.stop_snuba_replacement(eventstream_state)
         return
 
+    prime_caches(caches, project, events)
+
     source_events = []
     destination_events = {}
 
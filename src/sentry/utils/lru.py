@@ -0,0 +1,64 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+
+
+class LRUCache:
+    """
+    A small, bounded, thread-safe in-process cache with per-entry expiry.
+
+    Entries are evicted least recently used first once ``max_size`` is
+    exceeded, and expire ``ttl`` seconds after they were set. With ``jitter``,
+    every entry lives up to that fraction of ``ttl`` shorter, so that entries
+    filled at the same time in many processes do not all expire together.
+    """
+
+    def __init__(self, max_size: int, ttl: float, jitter: float = 0.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.jitter = jitter
+        self.__entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        ttl = self.ttl
+        if self.jitter:
+            ttl -= ttl * self.jitter * random.random()
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def delete_many(self, keys: Iterable[Hashable]) -> None:
+        with self.__lock:
+            for key in keys:
+                self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -254,11 +254,23 @@ def pytest_runtest_teardown(item):
 
     discard_all()
 
-    from sentry.models import OrganizationOption, ProjectOption, UserOption
+    from sentry.models import (
+        Environment,
+        Organization,
+        OrganizationOption,
+        Project,
+        ProjectKey,
+        ProjectOption,
+        UserOption,
+    )
 
     for model in (OrganizationOption, ProjectOption, UserOption):
         model.objects.clear_local_cache()
 
+    for model in (Organization, Project, ProjectKey):
+        model.objects.clear_process_cache()
+    Environment.clear_process_cache()
+
     Hub.main.bind_client(None)
 
 
@@ -1,4 +1,7 @@
+import operator
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import progressbar
 from django.db import connections, router
@@ -67,8 +70,20 @@ class RangeQuerySetWrapper:
     and LESS THAN queries on the primary key.
 
     Very efficient, but ORDER BY statements will not work.
+
+    Optionally:
+
+    - ``fields`` only fetches the given columns (which must include ``order_by``),
+      yielding tuples as with ``values_list``.
+    - ``prefetch`` fetches the next chunk in a background thread while the current
+      one is being processed. The background thread uses its own database
+      connection, so it does not see uncommitted changes of the caller.
+    - ``target_duration`` adapts the step size after each query so that queries
+      take roughly that many seconds.
     """
 
+    MIN_ADAPTIVE_STEP = 10
+
     def __init__(
         self,
         queryset,
@@ -78,6 +93,9 @@ class RangeQuerySetWrapper:
         order_by="pk",
         callbacks=(),
         result_value_getter=None,
+        fields=None,
+        prefetch=False,
+        target_duration=None,
     ):
         # Support for slicing
         if queryset.query.low_mark == 0 and not (
@@ -89,6 +107,13 @@ class RangeQuerySetWrapper:
         else:
             raise InvalidQuerySetError
 
+        if fields is not None:
+            if order_by not in fields:
+                raise InvalidQuerySetError(f"fields must include {order_by!r}")
+            queryset = queryset.values_list(*fields)
+            if result_value_getter is None:
+                result_value_getter = operator.itemgetter(fields.index(order_by))
+
         self.limit = limit
         if limit:
             self.step = min(limit, abs(step))
@@ -101,8 +126,47 @@ class RangeQuerySetWrapper:
         self.order_by = order_by
         self.callbacks = callbacks
         self.result_value_getter = result_value_getter
+        self.prefetch = prefetch
+        self.target_duration = target_duration
+
+    def _get_value(self, result):
+        if self.result_value_getter:
+            return self.result_value_getter(result)
+        return getattr(result, self.order_by)
+
+    def _fetch(self, queryset, cur_value, step):
+        if cur_value is None:
+            results = queryset
+        elif self.desc:
+            results = queryset.filter(**{"%s__lte" % self.order_by: cur_value})
+        else:
+            results = queryset.filter(**{"%s__gte" % self.order_by: cur_value})
+
+        start = time.time()
+        results = list(results[0:step])
+        return results, time.time() - start
+
+    def _adapt_step(self, step, duration):
+        min_step = min(self.step, self.MIN_ADAPTIVE_STEP)
+        max_step = self.limit or self.step * 10
+        if duration > self.target_duration:
+            return max(step // 2, min_step)
+        elif duration < self.target_duration / 2:
+            return min(step * 2, max_step)
+        return step
 
     def __iter__(self):
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            yield from self._iter(executor)
+        finally:
+            if executor is not None:
+                # Connections are per thread, close the one the prefetching
+                # thread kept open across chunks.
+                executor.submit(connections.close_all)
+                executor.shutdown(wait=True)
+
+    def _iter(self, executor):
         max_value = None
         if self.min_value is not None:
             cur_value = self.min_value
@@ -111,6 +175,7 @@ class RangeQuerySetWrapper:
 
         num = 0
         limit = self.limit
+        step = self.step
 
         queryset = self.queryset
         if self.desc:
@@ -121,20 +186,30 @@ class RangeQuerySetWrapper:
         # we implement basic cursor pagination for columns that are not unique
         last_object_pk = None
         has_results = True
+        pending = None
         while has_results:
             if (max_value and cur_value >= max_value) or (limit and num >= limit):
                 break
 
             start = num
 
-            if cur_value is None:
-                results = queryset
-            elif self.desc:
-                results = queryset.filter(**{"%s__lte" % self.order_by: cur_value})
+            if pending is not None:
+                results, duration = pending.result()
+                pending = None
             else:
-                results = queryset.filter(**{"%s__gte" % self.order_by: cur_value})
+                results, duration = self._fetch(queryset, cur_value, step)
+
+            if self.target_duration:
+                step = self._adapt_step(step, duration)
 
-            results = list(results[0 : self.step])
+            # The next chunk starts at the last value of this one, so it can be
+            # fetched while this one is being processed.
+            if (
+                executor is not None
+                and len(results) > 1
+                and not (limit and num + len(results) >= limit)
+            ):
+                pending = executor.submit(self._fetch, queryset, self._get_value(results[-1]), step)
 
             for cb in self.callbacks:
                 cb(results)
@@ -151,11 +226,7 @@ class RangeQuerySetWrapper:
                 # to `None` causing the loop to exit early.
                 num += 1
                 last_object_pk = pk
-                cur_value = (
-                    self.result_value_getter(result)
-                    if self.result_value_getter
-                    else getattr(result, self.order_by)
-                )
+                cur_value = self._get_value(result)
 
                 yield result
 
@@ -1,6 +1,6 @@
 import threading
 
-from celery.signals import task_failure, task_success
+from celery.signals import task_failure, task_postrun, task_prerun, task_success
 from django.core.signals import request_finished
 
 from sentry import app
@@ -33,10 +33,86 @@ def request_cache(func):
     return wrapped
 
 
+class ModelLoader:
+    """
+    Coalesces lookups of model instances by a unique field (the primary key by
+    default) into a single bulk query.
+
+    Results, including misses, are kept for the lifetime of the loader, which
+    is the current request when obtained via `get_loader`. Loaded instances
+    are meant to be read-only.
+    """
+
+    def __init__(self, model, field="id", **filters):
+        self.model = model
+        self.field = field
+        self.filters = filters
+        self.results = {}
+
+    def load_many(self, keys):
+        keys = {k for k in keys if k is not None}
+        missing = keys - self.results.keys()
+        if missing:
+            queryset = self.model.objects.filter(**{f"{self.field}__in": missing}, **self.filters)
+            found = {getattr(instance, self.field): instance for instance in queryset}
+            for key in missing:
+                self.results[key] = found.get(key)
+        return {k: self.results[k] for k in keys if self.results[k] is not None}
+
+    def load(self, key):
+        return self.load_many([key]).get(key)
+
+
+def get_loader(model, field="id", **filters):
+    """
+    Returns the `ModelLoader` for `model` shared by everything that runs as
+    part of the current request, so that serializers requesting the same
+    objects do not query for them more than once.
+
+    Outside of a request a fresh loader is returned on every call.
+    """
+    if app.env.request is None:
+        return ModelLoader(model, field, **filters)
+
+    if not hasattr(_cache, "loaders"):
+        _cache.loaders = {}
+    cache_key = (model, field, tuple(sorted(filters.items())))
+    if cache_key not in _cache.loaders:
+        _cache.loaders[cache_key] = ModelLoader(model, field, **filters)
+    return _cache.loaders[cache_key]
+
+
+def get_scoped_cache(namespace):
+    """
+    Returns a dict for `namespace` that is shared by everything that runs as
+    part of the current request or task, or None outside of both.
+    """
+    if app.env.request is None and not getattr(_cache, "task_depth", 0):
+        return None
+
+    if not hasattr(_cache, "scoped"):
+        _cache.scoped = {}
+    return _cache.scoped.setdefault(namespace, {})
+
+
 def clear_cache(**kwargs):
     _cache.items = {}
+    _cache.loaders = {}
+    _cache.scoped = {}
+
+
+def enter_task(**kwargs):
+    _cache.task_depth = getattr(_cache, "task_depth", 0) + 1
+
+
+def exit_task(**kwargs):
+    _cache.task_depth = max(getattr(_cache, "task_depth", 0) - 1, 0)
+    if not _cache.task_depth:
+        clear_cache()
 
 
 request_finished.connect(clear_cache)
 task_failure.connect(clear_cache)
 task_success.connect(clear_cache)
+task_prerun.connect(enter_task)
+task_postrun.connect(exit_task)
@@ -39,6 +39,8 @@ class OrganizationAuditLogsTest(APITestCase):
         assert len(response.data) == 2
         assert response.data[0]["id"] == str(entry2.id)
         assert response.data[1]["id"] == str(entry1.id)
+        # Hits are a planner estimate, only their presence is checked.
+        assert int(response["X-Hits"]) >= 0
 
     def test_filter_by_event(self):
         now = timezone.now()
@@ -55,18 +55,19 @@ def setup_relay(default_project):
 
 @pytest.fixture
 def call_endpoint(client, relay, private_key, default_projectkey):
-    def inner(full_config, public_keys=None):
+    def inner(full_config, public_keys=None, revisions=None):
         path = reverse("sentry-api-0-relay-projectconfigs") + "?version=2"
 
         if public_keys is None:
             public_keys = [str(default_projectkey.public_key)]
 
-        if full_config is None:
-            raw_json, signature = private_key.pack({"publicKeys": public_keys})
-        else:
-            raw_json, signature = private_key.pack(
-                {"publicKeys": public_keys, "fullConfig": full_config}
-            )
+        data = {"publicKeys": public_keys}
+        if full_config is not None:
+            data["fullConfig"] = full_config
+        if revisions is not None:
+            data["revisions"] = revisions
+
+        raw_json, signature = private_key.pack(data)
 
         resp = client.post(
             path,
@@ -377,3 +378,44 @@ def test_exposes_features(call_endpoint, task_runner):
             config = config["config"]
             assert "features" in config
             assert config["features"] == ["organizations:metrics-extraction"]
+
+
+@pytest.mark.django_db
+def test_unchanged_revisions(call_endpoint, default_projectkey):
+    public_key = default_projectkey.public_key
+
+    result, status_code = call_endpoint(full_config=False)
+    assert status_code < 400
+    assert "revisions" not in result
+
+    result, status_code = call_endpoint(full_config=False, revisions={public_key: "def"})
+    assert status_code < 400
+    assert result["unchanged"] == []
+    assert result["configs"][public_key]["disabled"] is False
+    revision = result["revisions"][public_key]
+
+    # The revision is computed from the restricted config an external relay receives.
+    result, status_code = call_endpoint(full_config=False, revisions={public_key: revision})
+    assert status_code < 400
+    assert result["configs"] == {}
+    assert result["unchanged"] == [public_key]
+
+
+@pytest.mark.django_db
+def test_unchanged_revisions_full_config(call_endpoint, default_projectkey, monkeypatch):
+    public_key = default_projectkey.public_key
+    monkeypatch.setattr(
+        "sentry.relay.projectconfig_cache.get_revisions", lambda keys: {public_key: "abc"}
+    )
+
+    # Full configs are skipped based on the revision of the cached config.
+    result, status_code = call_endpoint(full_config=True, revisions={public_key: "abc"})
+    assert status_code < 400
+    assert result["configs"] == {}
+    assert result["unchanged"] == [public_key]
+
+
+@pytest.mark.django_db
+def test_invalid_revisions(call_endpoint, default_projectkey):
+    result, status_code = call_endpoint(full_config=False, revisions=["abc"])
+    assert status_code == 400
@@ -334,6 +334,7 @@ class GroupSerializerTest(TestCase):
             "info": {
                 "syncCount": 0,
                 "totalEvents": 0,
+                "dispatchedEvents": 0,
                 "dateCreated": result["statusDetails"]["info"]["dateCreated"],
             },
         }
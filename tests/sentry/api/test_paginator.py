@@ -10,6 +10,7 @@ from sentry.api.paginator import (
     CombinedQuerysetPaginator,
     DateTimePaginator,
     GenericOffsetPaginator,
+    KeysetPaginator,
     OffsetPaginator,
     Paginator,
     SequencePaginator,
@@ -175,6 +176,91 @@ class OffsetPaginatorTest(TestCase):
             paginator.get_result()
 
 
+class KeysetPaginatorTest(TestCase):
+    def test_simple(self):
+        res1 = self.create_user("foo@example.com")
+        res2 = self.create_user("bar@example.com")
+        res3 = self.create_user("baz@example.com")
+
+        paginator = KeysetPaginator(User.objects.all(), "id")
+        result1 = paginator.get_result(limit=2, cursor=None)
+        assert list(result1) == [res1, res2]
+        assert result1.next
+        assert not result1.prev
+
+        result2 = paginator.get_result(limit=2, cursor=result1.next)
+        assert list(result2) == [res3]
+        assert not result2.next
+        assert result2.prev
+
+        result3 = paginator.get_result(limit=2, cursor=result2.prev)
+        assert list(result3) == [res1, res2]
+        assert result3.next
+        assert not result3.prev
+
+    def test_descending_datetime_with_ties(self):
+        joined = timezone.now()
+        res1 = self.create_user("foo@example.com", date_joined=joined)
+        res2 = self.create_user("bar@example.com", date_joined=joined)
+        res3 = self.create_user("baz@example.com", date_joined=joined - timedelta(seconds=1))
+
+        paginator = KeysetPaginator(User.objects.all(), "-date_joined")
+        result1 = paginator.get_result(limit=1, cursor=None)
+        assert list(result1) == [res2]
+        assert result1.next
+
+        result2 = paginator.get_result(limit=1, cursor=result1.next)
+        assert list(result2) == [res1]
+        assert result2.next
+        assert result2.prev
+
+        result3 = paginator.get_result(limit=1, cursor=result2.next)
+        assert list(result3) == [res3]
+        assert not result3.next
+
+        result4 = paginator.get_result(limit=1, cursor=result3.prev)
+        assert list(result4) == [res1]
+        assert result4.prev
+        assert result4.next
+
+    def test_cursor_roundtrip(self):
+        self.create_user("foo@example.com")
+        self.create_user("bar@example.com")
+
+        paginator = KeysetPaginator(User.objects.all(), "-date_joined")
+        result1 = paginator.get_result(limit=1, cursor=None)
+        result2 = paginator.get_result(limit=1, cursor=Cursor.from_string(str(result1.next)))
+        assert result2[0] != result1[0]
+
+    def test_legacy_datetime_cursor(self):
+        joined = timezone.now()
+        res1 = self.create_user("foo@example.com", date_joined=joined)
+        res2 = self.create_user("bar@example.com", date_joined=joined - timedelta(seconds=1))
+        res3 = self.create_user("baz@example.com", date_joined=joined - timedelta(seconds=2))
+
+        # Cursors issued by DateTimePaginator keep working.
+        legacy = DateTimePaginator(User.objects.all(), "-date_joined")
+        cursor = legacy.get_result(limit=1).next
+
+        paginator = KeysetPaginator(User.objects.all(), "-date_joined")
+        result = paginator.get_result(limit=1, cursor=Cursor.from_string(str(cursor)))
+        assert list(result) == [res2]
+        result = paginator.get_result(limit=1, cursor=result.next)
+        assert list(result) == [res3]
+
+        assert list(paginator.get_result(limit=1)) == [res1]
+
+    def test_count_hits(self):
+        self.create_user("foo@example.com")
+        paginator = KeysetPaginator(User.objects.all(), "id")
+        result = paginator.get_result(limit=1, count_hits=True)
+        assert result.hits is not None
+        assert paginator.get_result(limit=1).hits is None
+
+        paginator = KeysetPaginator(User.objects.none(), "id")
+        assert paginator.get_result(limit=1, count_hits=True).hits == 0
+
+
 class DateTimePaginatorTest(TestCase):
     def test_ascending(self):
         joined = timezone.now()
@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+from sentry.attachments import MissingAttachmentChunks
 from sentry.cache.redis import RbCache, RedisClusterCache
 from sentry.utils.imports import import_string
 
@@ -12,10 +13,42 @@ KEY_FMT = "c:1:%s"
 class FakeClient:
     def __init__(self):
         self.data = {}
+        self.requests = 0
 
     def get(self, key):
         return self.data[key]
 
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def map(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.promises = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.promises:
+            self.execute()
+
+    def get(self, key):
+        promise = mock.Mock(key=key)
+        self.promises.append(promise)
+        return promise
+
+    def execute(self):
+        self.client.requests += 1
+        for promise in self.promises:
+            promise.value = self.client.data[promise.key]
+        promises, self.promises = self.promises, []
+        return [promise.value for promise in promises]
+
 
 @pytest.fixture
 def mock_client():
@@ -84,3 +117,22 @@ def test_chunked(mocked_attachment_cache, mock_client):
         "content_type": "text/plain",
     }
     assert attachment.data == b"Hello World! This attachment is chunked up."
+    # One request for the metadata, one for all chunks
+    assert mock_client.requests == 2
+
+
+def test_chunked_open(mocked_attachment_cache, mock_client):
+    mock_client.data[KEY_FMT % "foo:a"] = '[{"name":"foo.txt","chunks":3}]'
+    mock_client.data[KEY_FMT % "foo:a:0:0"] = zlib.compress(b"Hello World!")
+    mock_client.data[KEY_FMT % "foo:a:0:1"] = zlib.compress(b" This attachment is ")
+    mock_client.data[KEY_FMT % "foo:a:0:2"] = None
+
+    (attachment,) = mocked_attachment_cache.get("foo")
+    fileobj = attachment.open()
+
+    # Chunks are only decompressed as they are read
+    assert fileobj.read(5) == b"Hello"
+    assert fileobj.read(20) == b" World! This attachm"
+
+    with pytest.raises(MissingAttachmentChunks):
+        fileobj.read()
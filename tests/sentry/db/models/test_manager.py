@@ -0,0 +1,75 @@
+from unittest import mock
+
+import pytest
+
+from sentry.models import Environment, Organization
+from sentry.testutils import TestCase
+from sentry.testutils.helpers.options import override_options
+from sentry.utils.cache import cache
+
+
+class GetFromCacheTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.organization = self.create_organization(slug="cached")
+        Organization.objects.clear_process_cache()
+        cache.clear()
+
+    def test_process_cache_disabled(self):
+        org = Organization.objects.get_from_cache(id=self.organization.id)
+
+        # Without the option every lookup goes to the shared cache.
+        with mock.patch.object(cache, "get", return_value=org) as get:
+            Organization.objects.get_from_cache(id=self.organization.id)
+            assert get.called
+
+        # An update made elsewhere is visible as soon as the shared cache is
+        # invalidated, nothing is kept in process memory.
+        Organization.objects.filter(id=org.id).update(name="Renamed")
+        self.invalidate_shared_cache(org)
+        assert Organization.objects.get_from_cache(id=org.id).name == "Renamed"
+
+    def test_environment_process_cache_disabled(self):
+        env = self.create_environment(organization=self.organization, name="prod")
+        assert Environment.get_for_organization_id(self.organization.id, "prod") == env
+
+        Environment.objects.filter(id=env.id).delete()
+        cache.clear()
+        with pytest.raises(Environment.DoesNotExist):
+            Environment.get_for_organization_id(self.organization.id, "prod")
+
+    def invalidate_shared_cache(self, org):
+        cache.delete(
+            Organization.objects._BaseManager__get_lookup_cache_key(id=org.id),
+            version=Organization.objects.cache_version,
+        )
+
+    @override_options({"model-cache.process-cache-enabled": True})
+    def test_process_cache(self):
+        org = Organization.objects.get_from_cache(id=self.organization.id)
+        assert org == self.organization
+        assert Organization.objects.get_from_cache(slug="cached") == org
+
+        # Served from process memory without touching the shared cache, and
+        # every caller gets its own copy.
+        with mock.patch.object(cache, "get", side_effect=AssertionError):
+            other = Organization.objects.get_from_cache(id=self.organization.id)
+            assert other == org
+            assert other is not org
+            assert Organization.objects.get_from_cache(slug="cached") == org
+
+        # Saving in this process invalidates the cached instance right away.
+        org.name = "Renamed"
+        org.save()
+        assert Organization.objects.get_from_cache(id=org.id).name == "Renamed"
+
+    @override_options({"model-cache.process-cache-enabled": True})
+    def test_waits_for_concurrent_fill(self):
+        cache_key = "%s:fill" % Organization.objects._BaseManager__get_lookup_cache_key(
+            id=self.organization.id
+        )
+        cache.add(cache_key, 1, version=Organization.objects.cache_version)
+
+        with mock.patch("sentry.db.models.manager.base.time.sleep") as sleep:
+            assert Organization.objects.get_from_cache(id=self.organization.id)
+            assert sleep.called
@@ -34,6 +34,53 @@ class BulkDeleteQueryTest(TestCase):
         assert not Group.objects.filter(id=group1_2.id).exists()
         assert Group.objects.filter(id=group1_3.id).exists()
 
+    def test_id_ranges(self):
+        groups = [self.create_group() for _ in range(5)]
+        min_id, max_id = groups[0].id, groups[-1].id
+
+        ranges = BulkDeleteQuery(model=Group).get_id_ranges(2)
+        assert ranges[0][0] == min_id
+        assert ranges[-1][1] == max_id + 1
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert len(ranges) <= 2
+
+        Group.objects.all().delete()
+        assert BulkDeleteQuery(model=Group).get_id_ranges(4) == []
+
+    def test_id_ranges_matching_rows(self):
+        now = timezone.now()
+        project = self.create_project()
+        self.create_group(project, last_seen=now)
+        old_groups = [
+            self.create_group(project, last_seen=now - timedelta(days=2)) for _ in range(3)
+        ]
+        self.create_group(project, last_seen=now)
+
+        ranges = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1).get_id_ranges(2)
+        assert ranges[0][0] == old_groups[0].id
+        assert ranges[-1][1] == old_groups[-1].id + 1
+
+        other_project = self.create_project()
+        assert BulkDeleteQuery(model=Group, project_id=other_project.id).get_id_ranges(2) == []
+
+    def test_execute_range(self):
+        now = timezone.now()
+        project = self.create_project()
+        old_groups = [
+            self.create_group(project, last_seen=now - timedelta(days=2)) for _ in range(4)
+        ]
+        new_group = self.create_group(project, last_seen=now)
+
+        query = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1)
+        deleted = query.execute_range(
+            old_groups[0].id, old_groups[2].id, chunk_size=1, target_duration=1.0
+        )
+
+        assert deleted == 2
+        assert not Group.objects.filter(id__in=[g.id for g in old_groups[:2]]).exists()
+        assert Group.objects.filter(id__in=[g.id for g in old_groups[2:]]).count() == 2
+        assert Group.objects.filter(id=new_group.id).exists()
+
 
 class BulkDeleteQueryIteratorTestCase(TransactionTestCase):
     def test_iteration(self):
@@ -0,0 +1,109 @@
+from django.core.cache import cache
+
+from sentry import deletions
+from sentry.deletions import BulkModelDeletionTask, ModelDeletionTask
+from sentry.deletions.base import _group_concurrent_tasks
+from sentry.models import (
+    Activity,
+    Group,
+    Project,
+    ProjectCodeOwners,
+    ProjectKey,
+    RepositoryProjectPathConfig,
+    ScheduledDeletion,
+    ServiceHook,
+    ServiceHookProject,
+)
+from sentry.tasks.deletion import run_deletion
+from sentry.testutils import TestCase, TransactionTestCase
+from sentry.testutils.helpers.options import override_options
+
+
+class BulkModelDeletionTaskTest(TestCase):
+    def get_task(self, **kwargs):
+        return deletions.get(
+            model=Activity,
+            query={"project_id": self.project.id},
+            task=BulkModelDeletionTask,
+            **kwargs,
+        )
+
+    @override_options({"deletions.bulk-chunk-target-duration": 1.0})
+    def test_chunk_size_tuning(self):
+        task = self.get_task()
+        cache.delete(task.get_chunk_size_cache_key())
+        task = self.get_task()
+        assert task.chunk_size == BulkModelDeletionTask.DEFAULT_CHUNK_SIZE
+
+        task.update_chunk_size(duration=0.1, target_duration=1.0)
+        assert task.chunk_size == BulkModelDeletionTask.DEFAULT_CHUNK_SIZE * 2
+
+        # Within the target range, the chunk size is kept.
+        task.update_chunk_size(duration=0.8, target_duration=1.0)
+        assert task.chunk_size == BulkModelDeletionTask.DEFAULT_CHUNK_SIZE * 2
+
+        # New tasks for the same table start with the tuned chunk size.
+        assert self.get_task().chunk_size == BulkModelDeletionTask.DEFAULT_CHUNK_SIZE * 2
+
+        for _ in range(10):
+            task.update_chunk_size(duration=5.0, target_duration=1.0)
+        assert task.chunk_size == BulkModelDeletionTask.MIN_CHUNK_SIZE
+
+        # Explicit chunk sizes are not tuned.
+        assert self.get_task(chunk_size=500).chunk_size == 500
+
+    def test_chunk_size_tuning_disabled(self):
+        task = self.get_task()
+        cache.set(task.get_chunk_size_cache_key(), 500)
+
+        assert self.get_task().chunk_size == BulkModelDeletionTask.DEFAULT_CHUNK_SIZE
+
+
+class GroupConcurrentTasksTest(TestCase):
+    def get_task(self, model, task=BulkModelDeletionTask):
+        return deletions.get(model=model, query={"project_id": self.project.id}, task=task)
+
+    def test_keeps_related_models_apart(self):
+        tasks = [
+            self.get_task(ProjectKey),
+            self.get_task(ProjectCodeOwners),
+            self.get_task(RepositoryProjectPathConfig),
+            self.get_task(ServiceHookProject),
+            self.get_task(ServiceHook),
+            self.get_task(Activity),
+            self.get_task(Group, ModelDeletionTask),
+            self.get_task(ProjectKey),
+        ]
+
+        groups = _group_concurrent_tasks(tasks)
+        assert [[task.model for task in group] for group in groups] == [
+            [ProjectKey, ProjectCodeOwners],
+            [RepositoryProjectPathConfig, ServiceHookProject],
+            [ServiceHook, Activity],
+            [Group],
+            [ProjectKey],
+        ]
+
+
+class ConcurrentDeletionTest(TransactionTestCase):
+    @override_options({"deletions.bulk-concurrency": 4})
+    def test_delete_project(self):
+        project = self.create_project(name="test")
+        hook = self.create_service_hook(
+            actor=self.user,
+            org=project.organization,
+            project=project,
+            url="https://example.com/webhook",
+        )
+        Activity.objects.create(project=project, type=Activity.NOTE, user=self.user)
+
+        deletion = ScheduledDeletion.schedule(project, days=0)
+        deletion.update(in_progress=True)
+
+        with self.tasks():
+            run_deletion(deletion.id)
+
+        assert not Project.objects.filter(id=project.id).exists()
+        assert not ServiceHookProject.objects.filter(service_hook_id=hook.id).exists()
+        assert not ServiceHook.objects.filter(id=hook.id).exists()
+        assert not Activity.objects.filter(project_id=project.id).exists()
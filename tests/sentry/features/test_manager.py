@@ -2,11 +2,13 @@ from typing import Any, Mapping, Optional, Union
 from unittest import mock
 
 from django.conf import settings
+from django.http import HttpRequest
 
-from sentry import features
+from sentry import app, features
 from sentry.features import Feature
 from sentry.models import User
 from sentry.testutils import TestCase
+from sentry.utils.request_cache import clear_cache
 
 
 class MockBatchHandler(features.BatchFeatureHandler):
@@ -209,3 +211,62 @@ class FeatureManagerTest(TestCase):
         assert manager.has("organizations:feature", actor=self.user, organization=self.organization)
         assert manager.has("projects:feature", actor=self.user, project=self.project)
         assert manager.has("auth:register", actor=self.user)
+
+    def test_has_memoized_within_request(self):
+        handler = mock.Mock(return_value=True)
+        handler.features = ["organizations:feature"]
+        manager = features.FeatureManager()
+        manager.add("organizations:feature", features.OrganizationFeature)
+        manager.add_handler(handler)
+
+        # Outside of a request every check runs the handlers.
+        assert manager.has("organizations:feature", self.organization, actor=self.user)
+        assert manager.has("organizations:feature", self.organization, actor=self.user)
+        assert len(handler.mock_calls) == 2
+
+        app.env.request = HttpRequest()
+        try:
+            assert manager.has("organizations:feature", self.organization, actor=self.user)
+            assert manager.has("organizations:feature", self.organization, actor=self.user)
+            assert len(handler.mock_calls) == 3
+
+            other_org = self.create_organization()
+            assert manager.has("organizations:feature", other_org, actor=self.user)
+            assert len(handler.mock_calls) == 4
+        finally:
+            app.env.request = None
+            clear_cache()
+
+    def test_has_many(self):
+        org_handler = mock.Mock(return_value=False)
+        org_handler.features = ["organizations:feature"]
+        manager = features.FeatureManager()
+        manager.add("organizations:feature", features.OrganizationFeature)
+        manager.add("projects:feature", features.ProjectFeature)
+        manager.add("projects:other", features.ProjectFeature)
+        manager.add_handler(org_handler)
+        manager.add_handler(MockBatchHandler())
+
+        entity_handler = mock.Mock()
+        entity_handler.has.return_value = True
+        manager.add_entity_handler(entity_handler)
+
+        other_project = self.create_project(organization=self.organization)
+        result = manager.has_many(
+            [
+                ("organizations:feature", self.organization),
+                ("projects:feature", self.project),
+                ("projects:feature", other_project),
+                ("projects:other", self.project),
+            ],
+            actor=self.user,
+        )
+        assert result == {
+            ("organizations:feature", self.organization): False,
+            ("projects:feature", self.project): True,
+            ("projects:feature", other_project): True,
+            ("projects:other", self.project): True,
+        }
+        # Only the project feature without a registered handler falls
+        # through to the entity handler.
+        assert len(entity_handler.has.mock_calls) == 1
@@ -370,3 +370,4 @@ def test_individual_attachments_missing_chunks(default_project, factories, monke
     attachments = list(EventAttachment.objects.filter(project_id=project_id, event_id=event_id))
 
     assert not attachments
+    assert not File.objects.filter(name="foo.txt").exists()
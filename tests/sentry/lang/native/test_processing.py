@@ -10,6 +10,8 @@ import pytest
 
 from sentry.lang.native.processing import _merge_image, process_payload
 from sentry.models.eventerror import EventError
+from sentry.reprocessing import bump_reprocessing_revision
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.safe import get_path
 
 
@@ -152,3 +154,135 @@ def test_cocoa_function_name(mock_symbolicator, default_project):
 
     function_name = get_path(data, "exception", "values", 0, "stacktrace", "frames", 0, "function")
     assert function_name == "thunk for closure"
+
+
+def make_frame_cache_data(project, image_addr, registers=None):
+    stacktrace = {"frames": [{"instruction_addr": hex(image_addr + 16)}]}
+    if registers is not None:
+        stacktrace["registers"] = registers
+
+    return {
+        "platform": "native",
+        "project": project.id,
+        "event_id": "1",
+        "debug_meta": {
+            "images": [
+                {
+                    "type": "macho",
+                    "debug_id": "502fc0a5-1ec1-3e47-9998-684fa139dca7",
+                    "image_addr": hex(image_addr),
+                    "image_size": 0x1000,
+                }
+            ]
+        },
+        "exception": {"values": [{"stacktrace": stacktrace}]},
+    }
+
+
+def make_frame_cache_response(debug_status="found", frame_status="symbolicated"):
+    return {
+        "status": "completed",
+        "stacktraces": [
+            {
+                "frames": [
+                    {
+                        "status": frame_status,
+                        "original_index": 0,
+                        "instruction_addr": "0x1010",
+                        "function": "inlined",
+                    },
+                    {
+                        "status": frame_status,
+                        "original_index": 0,
+                        "instruction_addr": "0x1010",
+                        "function": "main",
+                    },
+                ],
+            }
+        ],
+        "modules": [
+            {
+                "type": "macho",
+                "debug_id": "502fc0a5-1ec1-3e47-9998-684fa139dca7",
+                "image_addr": "0x1000",
+                "debug_status": debug_status,
+                "unwind_status": "unused",
+                "code_file": "/private/var/containers/Bundle/Application/Foo.app/Foo",
+            }
+        ],
+    }
+
+
+@pytest.mark.django_db
+@mock.patch("sentry.lang.native.processing.Symbolicator")
+def test_frame_cache(mock_symbolicator, default_project):
+    mock_symbolicator.return_value = mock_symbolicator
+    mock_symbolicator.config_hash = "config"
+    mock_symbolicator.process_payload.return_value = make_frame_cache_response()
+
+    with override_options({"symbolicator.frame-cache-ttl": 60}):
+        process_payload(make_frame_cache_data(default_project, 0x1000))
+        data = process_payload(make_frame_cache_data(default_project, 0x2000))
+
+    assert mock_symbolicator.process_payload.call_count == 1
+
+    frames = get_path(data, "exception", "values", 0, "stacktrace", "frames")
+    assert [frame["function"] for frame in frames] == ["main", "inlined"]
+    assert {frame["instruction_addr"] for frame in frames} == {"0x2010"}
+
+    image = get_path(data, "debug_meta", "images", 0)
+    assert image["image_addr"] == "0x2000"
+    assert image["debug_status"] == "found"
+    assert "code_file" not in image
+
+    # Uploading debug files bumps the reprocessing revision, which invalidates the cache.
+    bump_reprocessing_revision(default_project)
+    with override_options({"symbolicator.frame-cache-ttl": 60}):
+        process_payload(make_frame_cache_data(default_project, 0x1000))
+
+    assert mock_symbolicator.process_payload.call_count == 2
+
+
+@pytest.mark.django_db
+@mock.patch("sentry.lang.native.processing.Symbolicator")
+def test_frame_cache_registers(mock_symbolicator, default_project):
+    mock_symbolicator.return_value = mock_symbolicator
+    mock_symbolicator.config_hash = "config"
+    mock_symbolicator.process_payload.return_value = make_frame_cache_response()
+
+    # Only the instruction pointer matters for the first frame, the stack pointer differs per crash.
+    with override_options({"symbolicator.frame-cache-ttl": 60}):
+        process_payload(
+            make_frame_cache_data(default_project, 0x1000, {"rip": "0x1010", "rsp": "0x7ff0"})
+        )
+        process_payload(
+            make_frame_cache_data(default_project, 0x1000, {"rip": "0x1010", "rsp": "0x7fa0"})
+        )
+
+    assert mock_symbolicator.process_payload.call_count == 1
+
+    # A first frame which is not the crashing instruction is symbolicated differently.
+    with override_options({"symbolicator.frame-cache-ttl": 60}):
+        process_payload(
+            make_frame_cache_data(default_project, 0x1000, {"rip": "0x1020", "rsp": "0x7ff0"})
+        )
+
+    assert mock_symbolicator.process_payload.call_count == 2
+
+
+@pytest.mark.django_db
+@mock.patch("sentry.lang.native.processing.Symbolicator")
+def test_frame_cache_failed(mock_symbolicator, default_project):
+    mock_symbolicator.return_value = mock_symbolicator
+    mock_symbolicator.config_hash = "config"
+    mock_symbolicator.process_payload.return_value = make_frame_cache_response(
+        debug_status="fetching_failed", frame_status="missing"
+    )
+
+    with override_options({"symbolicator.frame-cache-ttl": 60}):
+        process_payload(make_frame_cache_data(default_project, 0x1000))
+        data = process_payload(make_frame_cache_data(default_project, 0x1000))
+
+    # Failed lookups may succeed on the next attempt, so they are not cached.
+    assert mock_symbolicator.process_payload.call_count == 2
+    assert get_path(data, "errors", 0, "type") == EventError.FETCH_GENERIC_ERROR
@@ -149,3 +149,34 @@ class OptionsStoreTest(TestCase):
         mocked_time.return_value = 26
         store.clean_local_cache()
         assert not store._local_cache
+
+    @patch("sentry.options.store.time")
+    def test_snapshot(self, mocked_time):
+        store, key = self.store, self.key
+        other = OptionsStore(cache=store.cache, snapshot_interval=10)
+
+        mocked_time.return_value = 0
+        store.set(key, "bar")
+        assert other.get(key) == "bar"
+
+        # Reads are served from the snapshot without hitting the database.
+        with patch.object(Option.objects, "get_queryset", side_effect=RuntimeError()):
+            with patch.object(store.cache, "get", side_effect=RuntimeError()):
+                assert other.get(key) == "bar"
+                assert other.get(self.make_key()) is None
+
+        store.set(key, "baz")
+        # Changes are picked up once the version is checked again.
+        mocked_time.return_value = 5
+        assert other.get(key) == "bar"
+        mocked_time.return_value = 11
+        assert other.get(key) == "baz"
+
+        # An unchanged version does not reload the snapshot.
+        mocked_time.return_value = 22
+        with patch.object(Option.objects, "get_queryset", side_effect=RuntimeError()):
+            assert other.get(key) == "baz"
+
+        store.delete(key)
+        mocked_time.return_value = 33
+        assert other.get(key) is None
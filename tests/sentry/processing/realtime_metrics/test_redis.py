@@ -1,3 +1,4 @@
+import time
 from typing import TYPE_CHECKING, Any, Dict
 
 import pytest
@@ -111,6 +112,38 @@ def test_increment_project_duration_counter_different_buckets(
     assert redis_cluster.hget("symbolicate_event_low_priority:duration:10:17:1150", "40") == "1"
 
 
+def test_buffered_increments(config: Dict[str, Any], redis_cluster: redis._RedisCluster) -> None:
+    store = RedisRealtimeMetricsStore(buffer_size=3, **config)
+
+    store.increment_project_event_counter(17, 1147)
+    store.increment_project_event_counter(17, 1149)
+    assert redis_cluster.get("symbolicate_event_low_priority:counter:10:17:1140") is None
+
+    store.increment_project_duration_counter(17, 1147, 15)
+    assert redis_cluster.get("symbolicate_event_low_priority:counter:10:17:1140") == "2"
+    assert redis_cluster.hget("symbolicate_event_low_priority:duration:10:17:1140", "10") == "1"
+
+    store.increment_project_event_counter(17, 1152)
+    assert redis_cluster.get("symbolicate_event_low_priority:counter:10:17:1150") is None
+
+    store.flush()
+    assert redis_cluster.get("symbolicate_event_low_priority:counter:10:17:1150") == "1"
+
+
+def test_buffered_increments_flush_interval(
+    config: Dict[str, Any], redis_cluster: redis._RedisCluster
+) -> None:
+    store = RedisRealtimeMetricsStore(buffer_size=100, flush_interval=0.01, **config)
+
+    store.increment_project_event_counter(17, 1147)
+
+    for _ in range(100):
+        if redis_cluster.get("symbolicate_event_low_priority:counter:10:17:1140") is not None:
+            break
+        time.sleep(0.01)
+    assert redis_cluster.get("symbolicate_event_low_priority:counter:10:17:1140") == "1"
+
+
 #
 # get_lpq_projects()
 #
@@ -397,6 +430,29 @@ def test_projects_mixed_buckets(
     assert list(candidates) == [42]
 
 
+def test_projects_index(config: Dict[str, Any], redis_cluster: redis._RedisCluster) -> None:
+    store = RedisRealtimeMetricsStore(buffer_size=1, **config)
+    store.increment_project_event_counter(42, 111)
+    store.increment_project_duration_counter(53, 111, 20)
+
+    assert sorted(store.projects()) == [42, 53]
+
+    # Once a project has not reported metrics for longer than the time windows it is dropped
+    store.increment_project_event_counter(53, 111 + 130)
+
+    assert list(store.projects()) == [53]
+
+
+def test_projects_index_unbuffered(
+    store: RedisRealtimeMetricsStore, redis_cluster: redis._RedisCluster
+) -> None:
+    store.increment_project_event_counter(42, 111)
+
+    # Unbuffered increments do not write to the shared index
+    assert not redis_cluster.exists(store._projects_key())
+    assert list(store.projects()) == [42]
+
+
 #
 # get_counts_for_project()
 #
@@ -505,3 +561,29 @@ def test_get_durations_for_projects_with_gap(
     assert durations.histograms[-3].total_count() == 0
     assert durations.histograms[-4].total_count() == 0
     assert durations.histograms[-5].total_count() == 3
+
+
+#
+# get_counts_for_projects() and get_durations_for_projects()
+#
+
+
+def test_get_metrics_for_projects(
+    store: RedisRealtimeMetricsStore, redis_cluster: redis._RedisCluster
+) -> None:
+    redis_cluster.set("symbolicate_event_low_priority:counter:10:42:110", 3)
+    redis_cluster.set("symbolicate_event_low_priority:counter:10:53:100", 5)
+    redis_cluster.hset("symbolicate_event_low_priority:duration:10:53:110", 30, 17)
+
+    counts = store.get_counts_for_projects([42, 53, 64], 113)
+
+    assert counts[42] == store.get_counts_for_project(42, 113)
+    assert counts[42].counts[-1] == 3
+    assert counts[53].counts[-2] == 5
+    assert counts[64].total_count() == 0
+
+    durations = store.get_durations_for_projects([42, 53], 113)
+
+    assert [h.total_count() for h in durations[42].histograms] == [0] * 13
+    assert durations[53].histograms[-1].total_count() == 17
+    assert durations[53].timestamp == counts[53].timestamp == -10
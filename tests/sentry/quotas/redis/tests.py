@@ -318,3 +318,73 @@ class RedisQuotaTest(TestCase):
         # count for these quotas and None for the others.
         # The ``- 1`` is because we refunded once.
         assert usage == [n - 1 if q.id else None for q in quotas] + [0, 0]
+
+    @mock.patch.object(RedisQuota, "get_quotas")
+    def test_is_rate_limited_many(self, mock_get_quotas):
+        timestamp = time.time()
+
+        mock_get_quotas.return_value = (
+            QuotaConfig(
+                id="p",
+                scope=QuotaScope.PROJECT,
+                scope_id=self.project.id,
+                limit=3,
+                window=60,
+                reason_code="project_quota",
+                categories=[DataCategory.ERROR],
+            ),
+            QuotaConfig(
+                id="a",
+                scope=QuotaScope.PROJECT,
+                scope_id=self.project.id,
+                limit=100,
+                window=60,
+                reason_code="attachment_quota",
+                categories=[DataCategory.ATTACHMENT],
+            ),
+        )
+
+        results = self.quota.is_rate_limited_many(
+            [
+                (self.project, None, None, None),
+                (self.project, None, DataCategory.ERROR, 2),
+                (self.project, None, DataCategory.ERROR, 1),
+                (self.project, None, DataCategory.ATTACHMENT, 60),
+                (self.project, None, DataCategory.ATTACHMENT, 60),
+                (self.project, None, DataCategory.ATTACHMENT, 40),
+            ],
+            timestamp=timestamp,
+        )
+        assert [r.is_limited for r in results] == [False, False, True, False, True, False]
+        assert results[2].reason_code == "project_quota"
+        assert results[4].reason_code == "attachment_quota"
+        # All items were resolved with a single call for the organization.
+        assert mock_get_quotas.call_count == 1
+
+        quotas = mock_get_quotas.return_value
+        assert self.quota.get_usage(self.project.organization_id, quotas, timestamp=timestamp) == [
+            3,
+            100,
+        ]
+
+        self.quota.refund_many(
+            [
+                (self.project, None, DataCategory.ERROR, 1),
+                (self.project, None, DataCategory.ATTACHMENT, 50),
+            ],
+            timestamp=timestamp,
+        )
+        assert self.quota.get_usage(self.project.organization_id, quotas, timestamp=timestamp) == [
+            2,
+            50,
+        ]
+
+    @mock.patch("sentry.quotas.redis.is_rate_limited_many")
+    @mock.patch.object(
+        RedisQuota, "get_quotas", return_value=[QuotaConfig(limit=0, reason_code="disabled")]
+    )
+    def test_is_rate_limited_many_zero_quota(self, mock_get_quotas, mock_is_rate_limited_many):
+        results = self.quota.is_rate_limited_many([(self.project, None, None, None)])
+        assert results[0].is_limited
+        assert results[0].reason_code == "disabled"
+        assert not mock_is_rate_limited_many.called
@@ -65,3 +65,52 @@ class RedisRateLimiterTest(TestCase):
             assert not limited
             assert value == 1
             assert reset_time == expected_reset_time + 5
+
+    def test_lease(self):
+        backend = RedisRateLimiter(lease_size=5, max_lease_ratio=0.5)
+        other = RedisRateLimiter(lease_size=5, max_lease_ratio=0.5)
+
+        with freeze_time("2000-01-01"):
+            # The first request reserves 5 requests of the window at once, the
+            # reported count only includes those admitted so far.
+            assert backend.is_limited_with_value("foo", 12)[:2] == (False, 1)
+            assert backend.current_value("foo") == 5
+            for count in range(2, 6):
+                assert backend.is_limited_with_value("foo", 12)[:2] == (False, count)
+            assert backend.current_value("foo") == 5
+
+            # Other processes reserve what is left below the limit.
+            assert other.is_limited_with_value("foo", 12)[:2] == (False, 6)
+            assert other.current_value("foo") == 10
+            assert backend.is_limited_with_value("foo", 12)[:2] == (False, 11)
+            assert backend.current_value("foo") == 12
+
+            assert backend.is_limited_with_value("foo", 12)[:2] == (False, 12)
+            assert backend.is_limited_with_value("foo", 12)[:2] == (True, 13)
+
+            # Requests reserved by other processes count against the limit
+            # even if they are never used.
+            assert other.is_limited_with_value("foo", 12)[:2] == (False, 7)
+            assert backend.is_limited_with_value("foo", 12)[:2] == (True, 14)
+
+    def test_lease_processes(self):
+        backend = RedisRateLimiter(lease_size=5, max_lease_ratio=0.5, lease_processes=2)
+
+        with freeze_time("2000-01-01"):
+            # Both processes together may only hold half of the limit.
+            assert backend.is_limited_with_value("foo", 12)[:2] == (False, 1)
+            assert backend.current_value("foo") == 3
+
+            # Too small to be shared, every request goes to Redis.
+            assert not backend.is_limited("bar", 3)
+            assert backend.current_value("bar") == 1
+
+    def test_lease_small_limit(self):
+        backend = RedisRateLimiter(lease_size=5)
+
+        with freeze_time("2000-01-01"):
+            # Leases are capped to a share of the limit, so small limits are
+            # checked against Redis on every request.
+            assert not backend.is_limited("foo", 1)
+            assert backend.current_value("foo") == 1
+            assert backend.is_limited("foo", 1)
@@ -96,3 +96,42 @@ class ConcurrentLimiterTest(TestCase):
             assert len([r for r in results if r.limit_exceeded]) == 1
             time.sleep(0.3)
             assert not do_request().limit_exceeded
+
+    def test_sharded(self):
+        backend = ConcurrentRateLimiter(num_shards=4)
+        limit = 8
+        with freeze_time("2000-01-01"):
+            request_uids = [f"request_id{i}" for i in range(40)]
+            allowed = [
+                uid
+                for uid in request_uids
+                if not backend.start_request("foo", limit, uid).limit_exceeded
+            ]
+            # Every shard admits its share of the limit.
+            assert len(allowed) == limit
+            assert backend.get_concurrent_requests("foo") == limit
+
+            backend.finish_request("foo", allowed[0])
+            assert backend.get_concurrent_requests("foo") == limit - 1
+
+    def test_sharded_uneven_limit(self):
+        backend = ConcurrentRateLimiter(num_shards=4)
+        with freeze_time("2000-01-01"):
+            request_uids = [f"request_id{i}" for i in range(60)]
+            infos = [backend.start_request("foo", 10, uid) for uid in request_uids]
+            # The shares of the limit add up to the limit.
+            assert len([info for info in infos if not info.limit_exceeded]) == 10
+            assert {info.limit for info in infos} == {2, 3}
+            assert all(info.current_executions <= info.limit for info in infos)
+
+    def test_sharded_small_limit(self):
+        backend = ConcurrentRateLimiter(num_shards=4)
+        with freeze_time("2000-01-01"):
+            # Below the number of shards the limit is not split up.
+            infos = [backend.start_request("foo", 2, f"request_id{i}") for i in range(4)]
+            assert [info.limit_exceeded for info in infos] == [False, False, True, True]
+            assert [info.current_executions for info in infos] == [1, 2, 2, 2]
+            assert backend.get_concurrent_requests("foo") == 2
+
+            backend.finish_request("foo", "request_id0")
+            assert backend.get_concurrent_requests("foo") == 1
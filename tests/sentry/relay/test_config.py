@@ -2,7 +2,7 @@ import pytest
 
 from sentry.models import ProjectKey
 from sentry.models.transaction_threshold import TransactionMetric
-from sentry.relay.config import get_project_config
+from sentry.relay.config import get_project_config, get_project_configs
 from sentry.testutils.helpers import Feature
 from sentry.utils.safe import get_path
 
@@ -52,6 +52,26 @@ def test_get_project_config(default_project, insta_snapshot, full):
     insta_snapshot(cfg)
 
 
+@pytest.mark.django_db
+def test_get_project_configs(default_project, factories):
+    default_project.update_option("sentry:relay_pii_config", PII_CONFIG)
+    project2 = factories.create_project(organization=default_project.organization)
+    keys = list(ProjectKey.objects.filter(project__in=[default_project, project2]))
+    assert {key.project_id for key in keys} == {default_project.id, project2.id}
+
+    configs = get_project_configs(keys)
+    assert set(configs) == {key.public_key for key in keys}
+
+    for key in keys:
+        cfg = configs[key.public_key].to_dict()
+        expected = get_project_config(key.project, project_keys=[key]).to_dict()
+        for cfg_ in (cfg, expected):
+            cfg_.pop("lastFetch")
+            cfg_.pop("lastChange")
+            cfg_.pop("rev")
+        assert cfg == expected
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize("has_custom_filters", [False, True])
 def test_project_config_uses_filter_features(default_project, has_custom_filters):
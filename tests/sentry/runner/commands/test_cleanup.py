@@ -0,0 +1,27 @@
+from queue import Queue
+from unittest import mock
+
+from sentry.runner.commands.cleanup import _BULK_DELETE_FAILED, bulk_query_delete
+
+
+def test_bulk_query_delete_failed_range():
+    query = mock.Mock(order_by=None)
+    query.model.__module__ = "sentry.models"
+    query.model.__name__ = "Group"
+    query.get_id_ranges.return_value = [(1, 5), (5, 10)]
+
+    task_queue = mock.Mock()
+    result_queue = Queue()
+    result_queue.put(3)
+    result_queue.put(_BULK_DELETE_FAILED)
+
+    assert not bulk_query_delete(
+        task_queue, result_queue, query, chunk_size=100, concurrency=2, silent=True
+    )
+    assert task_queue.put.call_count == 2
+
+    result_queue.put(3)
+    result_queue.put(4)
+    assert bulk_query_delete(
+        task_queue, result_queue, query, chunk_size=100, concurrency=2, silent=True
+    )
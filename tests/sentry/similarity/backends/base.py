@@ -1,4 +1,5 @@
 import abc
+import time
 
 
 class MinHashIndexBackendTestMixin:
@@ -160,6 +161,26 @@ class MinHashIndexBackendTestMixin:
             == [("4", [1.0, None]), ("1", [1.0, 0.0]), ("2", [1.0, 0.0]), ("3", [1.0, 0.0])]
         )
 
+    def test_record_many(self):
+        self.index.record_many(
+            "example",
+            [
+                ("1", [("index:a", "hello world"), ("index:b", "hello world")], None),
+                ("2", [("index:a", "hello world"), ("index:b", "pizza world")], None),
+                ("3", [("index:a", "hello world")], None),
+                # Recorded at its own timestamp, which is past the retention period.
+                ("5", [("index:a", "hello world")], int(time.time()) - 60 * 60 * 24 * 30),
+            ],
+        )
+        self.index.record("example", "4", [("index:a", "hello world"), ("index:b", "hello world")])
+
+        results = self.index.compare("example", "4", [("index:a", 0), ("index:b", 0)])
+        assert len(results) == 4
+        assert results[:2] == [("1", [1.0, 1.0]), ("4", [1.0, 1.0])]
+        assert results[2][0] == "2"
+        assert results[2][1][0] == 1.0
+        assert results[3] == ("3", [1.0, 0.0])
+
     def test_merge(self):
         self.index.record("example", "1", [("index", ["foo", "bar"])])
         self.index.record("example", "2", [("index", ["baz"])])
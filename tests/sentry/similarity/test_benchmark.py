@@ -0,0 +1,32 @@
+import pytest
+
+from sentry.similarity.signatures import MinHashSignatureBuilder
+from sentry.utils.iterators import shingle
+
+get_signature = MinHashSignatureBuilder(16, 0xFFFF)
+
+# Events within a batch tend to share most of their features (e.g. messages
+# and stack traces from the same group), which is what batching benefits from.
+FEATURE_SETS = [
+    ["".join(s) for s in shingle(5, f"TypeError: unable to process item {i} in queue")]
+    for i in range(100)
+]
+
+
+def benchmark_available():
+    try:
+        import pytest_benchmark  # NOQA
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_signatures(benchmark):
+    benchmark(lambda: [get_signature(features) for features in FEATURE_SETS])
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_signatures_batched(benchmark):
+    benchmark(get_signature.build_many, FEATURE_SETS)
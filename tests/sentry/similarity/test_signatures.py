@@ -28,3 +28,16 @@ class MinHashSignatureBuilderTestCase(TestCase):
         self.assertAlmostEqual(
             similarity, estimation, delta=0.1  # totally made up constant, seems reasonable
         )
+
+    def test_build_many(self):
+        get_signature = MinHashSignatureBuilder(32, 0xFFFF)
+
+        feature_sets = [
+            set("the quick brown fox jumps over the lazy dog".split()),
+            set("the quick grown box jumps over the hazy fog".split()),
+            set("the quick brown fox".split()),
+        ]
+
+        assert get_signature.build_many(feature_sets) == [
+            get_signature(features) for features in feature_sets
+        ]
@@ -89,14 +89,37 @@ class TestScanForSuspectProjects:
 
     @freeze_time(datetime.fromtimestamp(0))
     def test_has_metric(
+        self,
+        store: RealtimeMetricsStore,
+        mock_update_lpq_eligibility: mock.Mock,
+        monkeypatch: "pytest.MonkeyPatch",
+    ) -> None:
+        store.increment_project_event_counter(project_id=17, timestamp=0)
+        store.increment_project_event_counter(project_id=18, timestamp=0)
+
+        monkeypatch.setattr(
+            low_priority_symbolication, "excessive_event_rate", lambda proj, counts: proj == 17
+        )
+
+        with TaskRunner():
+            _scan_for_suspect_projects()
+
+        assert store.get_lpq_projects() == {17}
+        assert not mock_update_lpq_eligibility.delay.called
+
+    @freeze_time(datetime.fromtimestamp(0))
+    def test_has_metric_in_lpq(
         self, store: RealtimeMetricsStore, mock_update_lpq_eligibility: mock.Mock
     ) -> None:
+        store.add_project_to_lpq(17)
+        store.add_project_to_lpq(18)
         store.increment_project_event_counter(project_id=17, timestamp=0)
 
         with TaskRunner():
             _scan_for_suspect_projects()
 
-        assert mock_update_lpq_eligibility.delay.called
+        assert store.get_lpq_projects() == set()
+        assert not mock_update_lpq_eligibility.delay.called
 
 
 class TestUpdateLpqEligibility:
@@ -6,6 +6,7 @@ from sentry.models import ProjectKey, ProjectKeyStatus, ProjectOption
 from sentry.relay.projectconfig_cache.redis import RedisProjectConfigCache
 from sentry.relay.projectconfig_debounce_cache.redis import RedisProjectConfigDebounceCache
 from sentry.tasks.relay import schedule_update_config_cache
+from sentry.utils import json
 
 
 def _cache_keys_for_project(project):
@@ -24,6 +25,7 @@ def redis_cache(monkeypatch):
     monkeypatch.setattr("sentry.relay.projectconfig_cache.set_many", cache.set_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.delete_many", cache.delete_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.get", cache.get)
+    monkeypatch.setattr("sentry.relay.projectconfig_cache.get_revisions", cache.get_revisions)
 
     monkeypatch.setattr(
         "django.conf.settings.SENTRY_RELAY_PROJECTCONFIG_DEBOUNCE_CACHE",
@@ -222,3 +224,32 @@ def test_projectkeys(default_project, task_runner, redis_cache):
 
     for key in ProjectKey.objects.filter(project_id=default_project.id):
         assert not redis_cache.get(key.public_key)
+
+
+@pytest.mark.django_db
+def test_unchanged_config_is_not_rewritten(redis_cache):
+    cfg = {"disabled": False, "slug": "foo", "lastFetch": "2021-01-01T00:00:00Z"}
+    redis_cache.set_many({"abc": cfg})
+    revisions = redis_cache.get_revisions(["abc", "missing"])
+    assert set(revisions) == {"abc"}
+
+    # Tamper with the stored config to detect whether it gets rewritten.
+    redis_cache.cluster.set("relayconfig:abc", json.dumps({"marker": True}))
+
+    # Only volatile fields differ, the config is left as is.
+    redis_cache.set_many({"abc": {**cfg, "lastFetch": "2021-01-02T00:00:00Z"}})
+    assert redis_cache.get("abc") == {"marker": True}
+    assert redis_cache.get_revisions(["abc"]) == revisions
+
+    redis_cache.set_many({"abc": {**cfg, "slug": "bar"}})
+    assert redis_cache.get("abc")["slug"] == "bar"
+    assert redis_cache.get_revisions(["abc"]) != revisions
+
+    # A config that was evicted on its own is written again.
+    redis_cache.cluster.delete("relayconfig:abc")
+    assert redis_cache.get_revisions(["abc"]) == {}
+    redis_cache.set_many({"abc": {**cfg, "slug": "bar"}})
+    assert redis_cache.get("abc")["slug"] == "bar"
+
+    redis_cache.delete_many(["abc"])
+    assert redis_cache.get_revisions(["abc"]) == {}
@@ -22,7 +22,13 @@ from sentry.models import (
 )
 from sentry.plugins.base.v2 import Plugin2
 from sentry.projectoptions.defaults import DEFAULT_GROUPING_CONFIG
-from sentry.reprocessing2 import is_group_finished
+from sentry.reprocessing2 import (
+    CannotReprocess,
+    ReprocessableEvent,
+    get_progress,
+    is_group_finished,
+    pull_event_data_multi,
+)
 from sentry.tasks.reprocessing2 import reprocess_group
 from sentry.tasks.store import preprocess_event
 from sentry.testutils.helpers import Feature
@@ -340,6 +346,9 @@ def test_max_events(
 
     assert is_group_finished(group_id)
 
+    _, info = get_progress(group_id)
+    assert info["dispatchedEvents"] == info["totalEvents"] == (max_events or 5)
+
 
 @pytest.mark.django_db
 @pytest.mark.snuba
@@ -448,6 +457,33 @@ def test_nodestore_missing(
     assert logs == ["reprocessing2.unprocessed_event.not_found"]
 
 
+@pytest.mark.django_db
+@pytest.mark.snuba
+def test_pull_event_data_multi(default_project, reset_snuba, process_and_save, monkeypatch):
+    event_id = process_and_save({"message": "hello world"}, seconds_ago=2)
+    python_event_id = process_and_save({"message": "hello world", "platform": "python"})
+
+    events = [
+        eventstore.get_event_by_id(default_project.id, event_id)
+        for event_id in (event_id, python_event_id)
+    ]
+
+    def get_event_by_id(*args, **kwargs):
+        raise AssertionError("events must not be fetched individually")
+
+    monkeypatch.setattr("sentry.reprocessing2.eventstore.get_event_by_id", get_event_by_id)
+
+    results = pull_event_data_multi(default_project.id, events)
+
+    assert isinstance(results[event_id], ReprocessableEvent)
+    assert results[event_id].event.event_id == event_id
+    assert results[event_id].data["event_id"] == event_id
+    assert results[event_id].attachments == []
+
+    assert isinstance(results[python_event_id], CannotReprocess)
+    assert str(results[python_event_id]) == "unprocessed_event.not_found"
+
+
 @pytest.mark.django_db
 @pytest.mark.snuba
 def test_apply_new_fingerprinting_rules(
@@ -5,6 +5,7 @@ import pytest
 from sentry.plugins.base.v2 import Plugin2
 from sentry.tasks.store import preprocess_event
 from sentry.tasks.symbolication import (
+    RetrySymbolication,
     should_demote_symbolication,
     submit_symbolicate,
     symbolicate_event,
@@ -182,6 +183,72 @@ def test_symbolicate_event_call_process_inline(
     )
 
 
+@pytest.mark.django_db
+def test_symbolicate_event_defer_retry(
+    default_project,
+    mock_event_processing_store,
+    mock_get_symbolication_function,
+):
+    data = {
+        "project": default_project.id,
+        "platform": "native",
+        "event_id": EVENT_ID,
+    }
+    mock_event_processing_store.get.return_value = data
+
+    def symbolicate(data):
+        raise RetrySymbolication(retry_after=2)
+
+    mock_get_symbolication_function.return_value = symbolicate
+
+    with override_options({"symbolicate-event.defer-retries": True}), mock.patch(
+        "sentry.tasks.store.do_process_event"
+    ) as mock_do_process_event, mock.patch.object(
+        symbolicate_event, "apply_async"
+    ) as mock_apply_async:
+        symbolicate_event(cache_key="e:1", start_time=1)
+
+    assert mock_do_process_event.call_count == 0
+    ((_, _, kwargs),) = mock_apply_async.mock_calls
+    assert kwargs["countdown"] == 2
+    assert kwargs["kwargs"]["cache_key"] == "e:1"
+    assert kwargs["kwargs"]["data"] is None
+    assert kwargs["kwargs"]["submit_realtime_metrics"] is False
+
+    # The deferred task resumes with the original start time, and gives up once the hard
+    # timeout has passed since then.
+    with mock.patch("sentry.tasks.store.do_process_event") as mock_do_process_event:
+        symbolicate_event(cache_key="e:1", start_time=1, symbolication_start_time=1)
+
+    (call,) = mock_do_process_event.mock_calls
+    assert call.kwargs["data"]["_metrics"]["flag.processing.fatal"]
+
+
+@pytest.mark.django_db
+def test_symbolicate_event_queue_switch_keeps_start_time(
+    default_project, mock_event_processing_store
+):
+    mock_event_processing_store.get.return_value = {
+        "project": default_project.id,
+        "platform": "native",
+        "event_id": EVENT_ID,
+    }
+
+    with mock.patch(
+        "sentry.tasks.symbolication.should_demote_symbolication", return_value=True
+    ), mock.patch("sentry.tasks.symbolication.submit_symbolicate") as mock_submit:
+        symbolicate_event(
+            cache_key="e:1",
+            start_time=1,
+            symbolication_start_time=5,
+            submit_realtime_metrics=True,
+        )
+
+    ((_, _, kwargs),) = mock_submit.mock_calls
+    assert kwargs["symbolication_start_time"] == 5
+    assert kwargs["submit_realtime_metrics"] is True
+
+
 @pytest.fixture(params=["org", "project"])
 def options_model(request, default_organization, default_project):
     if request.param == "org":
@@ -1,5 +1,5 @@
 from sentry.models import User
-from sentry.testutils import TestCase
+from sentry.testutils import TestCase, TransactionTestCase
 from sentry.utils.query import RangeQuerySetWrapper
 
 
@@ -26,3 +26,42 @@ class RangeQuerySetWrapperTest(TestCase):
             user.delete()
 
         assert User.objects.all().count() == 0
+
+    def test_fields(self):
+        users = [self.create_user() for _ in range(10)]
+
+        qs = User.objects.all()
+
+        results = list(RangeQuerySetWrapper(qs, step=3, fields=("id", "username")))
+        assert results == [(user.id, user.username) for user in users]
+
+    def test_target_duration(self):
+        total = 50
+        for _ in range(total):
+            self.create_user()
+
+        qs = User.objects.all()
+
+        wrapper = RangeQuerySetWrapper(qs, step=2, target_duration=60)
+        assert len(list(wrapper)) == total
+        assert wrapper._adapt_step(2, 0) == 4
+        assert wrapper._adapt_step(20, 0) == 20
+        assert wrapper._adapt_step(8, 120) == 4
+        assert wrapper._adapt_step(2, 120) == 2
+
+
+class RangeQuerySetWrapperPrefetchTest(TransactionTestCase):
+    def test_prefetch(self):
+        total = 10
+        for _ in range(total):
+            self.create_user()
+
+        qs = User.objects.all()
+
+        assert len(list(RangeQuerySetWrapper(qs, step=3, prefetch=True))) == total
+        assert len(list(RangeQuerySetWrapper(qs, step=3, limit=5, prefetch=True))) == 5
+
+        for user in RangeQuerySetWrapper(qs, step=3, prefetch=True):
+            user.delete()
+
+        assert User.objects.all().count() == 0
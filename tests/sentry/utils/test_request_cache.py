@@ -6,8 +6,9 @@ from django.http import HttpRequest
 from django.utils import timezone
 
 from sentry import app
+from sentry.models import GroupSubscription, Project
 from sentry.testutils import TestCase
-from sentry.utils.request_cache import clear_cache, request_cache
+from sentry.utils.request_cache import ModelLoader, clear_cache, get_loader, request_cache
 
 
 @request_cache
@@ -77,3 +78,43 @@ class RequestCacheTest(TestCase):
         app.env.request = None
         assert cached_fn("cat") == "cat"
         assert mock_now.call_count == 2
+
+
+class ModelLoaderTest(TestCase):
+    def tearDown(self):
+        app.env.request = None
+        clear_cache()
+        super().tearDown()
+
+    def test_load_many(self):
+        projects = [self.create_project(), self.create_project()]
+        loader = ModelLoader(Project)
+        with self.assertNumQueries(1):
+            assert loader.load_many([p.id for p in projects] + [0]) == {p.id: p for p in projects}
+            assert loader.load(projects[0].id) == projects[0]
+            assert loader.load(0) is None
+
+    def test_field_and_filters(self):
+        group = self.create_group()
+        subscription = GroupSubscription.objects.create(
+            project=group.project, group=group, user=self.user
+        )
+        loader = ModelLoader(GroupSubscription, "group_id", user_id=self.user.id)
+        assert loader.load_many([group.id]) == {group.id: subscription}
+        loader = ModelLoader(GroupSubscription, "group_id", user_id=self.create_user().id)
+        assert loader.load_many([group.id]) == {}
+
+    def test_request_scope(self):
+        project = self.create_project()
+        assert get_loader(Project) is not get_loader(Project)
+
+        app.env.request = HttpRequest()
+        assert get_loader(Project) is get_loader(Project)
+        assert get_loader(Project) is not get_loader(Project, "slug")
+        get_loader(Project).load(project.id)
+        with self.assertNumQueries(0):
+            assert get_loader(Project).load(project.id) == project
+
+        clear_cache()
+        with self.assertNumQueries(1):
+            assert get_loader(Project).load(project.id) == project
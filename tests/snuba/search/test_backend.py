@@ -599,6 +599,28 @@ class EventsSnubaSearchTest(TestCase, SnubaTestCase):
                 assert results.prev.has_results
                 assert not results.next.has_results
 
+    def test_pagination_aggregate_sorts(self):
+        # Every page of a sort is ranked by the same aggregate, so paging
+        # neither skips nor repeats groups.
+        date_from = timezone.now() - timedelta(days=14)
+        for sort_by, expected in (
+            ("new", [self.group2, self.group1]),
+            ("freq", [self.group1, self.group2]),
+        ):
+            results = self.make_query(sort_by=sort_by, limit=1, date_from=date_from)
+            assert list(results) == expected[:1]
+            assert results.next.has_results
+
+            results = self.backend.query(
+                [self.project],
+                cursor=results.next,
+                limit=1,
+                sort_by=sort_by,
+                date_from=date_from,
+            )
+            assert list(results) == expected[1:]
+            assert not results.next.has_results
+
     def test_pagination_with_environment(self):
         for dt in [
             self.group1.first_seen + timedelta(days=1),
@@ -1,6 +1,7 @@
 import time
 from datetime import datetime, timedelta
 from datetime import timezone as dt_timezone
+from unittest import mock
 
 import pytz
 from django.utils import timezone
@@ -9,7 +10,11 @@ from sentry.release_health.base import OverviewStat
 from sentry.release_health.duplex import DuplexReleaseHealthBackend
 from sentry.release_health.metrics import MetricsReleaseHealthBackend
 from sentry.release_health.sessions import SessionsReleaseHealthBackend
-from sentry.snuba.sessions import _make_stats
+from sentry.snuba.sessions import (
+    _get_release_stats_rows,
+    _make_stats,
+    get_rollup_starts_and_buckets,
+)
 from sentry.testutils import SnubaTestCase, TestCase
 from sentry.testutils.cases import SessionMetricsTestCase
 from sentry.utils.dates import to_timestamp
@@ -902,6 +907,44 @@ class SnubaSessionsTest(TestCase, SnubaTestCase):
         )
 
 
+class GetReleaseStatsRowsTest(TestCase, SnubaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = datetime.now(pytz.utc)
+        for hours_ago in (5, 0):
+            started = to_timestamp(self.now - timedelta(hours=hours_ago)) // 60 * 60
+            self.store_session(
+                self.build_session(
+                    release="foo@1.0.0", environment="prod", started=started, received=started
+                )
+            )
+
+    def get_rows(self):
+        rollup, start, _ = get_rollup_starts_and_buckets("24h", now=self.now)
+        rows = _get_release_stats_rows(
+            [(self.project.id, "foo@1.0.0")], None, "sessions", rollup, start, now=self.now
+        )
+        return sorted((x["bucketed_started"], x["sessions"]) for x in rows)
+
+    def test_closed_buckets_are_cached(self):
+        with self.options({"release-health.closed-bucket-grace-seconds": 3600}):
+            rows = self.get_rows()
+            assert [sessions for _, sessions in rows] == [1, 1]
+
+            with mock.patch("sentry.snuba.sessions.raw_query", return_value={"data": []}) as query:
+                # Only the open buckets are queried again.
+                assert len(self.get_rows()) == 1
+                assert query.call_count == 1
+
+    def test_late_sessions_are_not_cached(self):
+        # By default buckets stay open for as long as sessions may still be updated.
+        assert [sessions for _, sessions in self.get_rows()] == [1, 1]
+
+        with mock.patch("sentry.snuba.sessions.raw_query", return_value={"data": []}) as query:
+            assert self.get_rows() == []
+            assert query.call_count == 1
+
+
 @parametrize_backend
 class GetCrashFreeRateTestCase(TestCase, SnubaTestCase):
     """
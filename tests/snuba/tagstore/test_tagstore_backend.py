@@ -1,9 +1,17 @@
 from datetime import timedelta
+from unittest import mock
 
 import pytest
 from django.utils import timezone
 
-from sentry.models import Environment, EventUser, Release, ReleaseProjectEnvironment, ReleaseStages
+from sentry.models import (
+    Environment,
+    EventUser,
+    Group,
+    Release,
+    ReleaseProjectEnvironment,
+    ReleaseStages,
+)
 from sentry.search.events.constants import (
     RELEASE_STAGE_ALIAS,
     SEMVER_ALIAS,
@@ -169,6 +177,38 @@ class TagStorageTest(TestCase, SnubaTestCase):
         assert {v.value for v in top_release_values} == {"100", "200"}
         assert all(v.times_seen == 1 for v in top_release_values)
 
+    def test_get_group_tag_keys_and_top_values_cache(self):
+        def get_keys():
+            group = Group.objects.get(id=self.proj1group1.id)
+            return {
+                r.key: r
+                for r in self.ts.get_group_tag_keys_and_top_values(
+                    self.proj1.id, group.id, [self.proj1env1.id], last_seen=group.last_seen
+                )
+            }
+
+        with self.options({"snuba.tagstore.group-tag-values-cache-ttl": 300}):
+            expected = get_keys()
+            with mock.patch("sentry.utils.snuba.query") as query:
+                result = get_keys()
+                assert not query.called
+            assert result == expected
+            assert result["baz"].count == expected["baz"].count == 2
+            assert result["baz"].top_values == expected["baz"].top_values
+
+            # Callers that don't pass last_seen are not cached.
+            with mock.patch("sentry.utils.snuba.query", return_value={}) as query:
+                self.ts.get_group_tag_keys_and_top_values(
+                    self.proj1.id, self.proj1group1.id, [self.proj1env1.id]
+                )
+                assert query.called
+
+            # A newer event moves the group's last_seen, which invalidates the cache.
+            Group.objects.filter(id=self.proj1group1.id).update(last_seen=timezone.now())
+            with mock.patch("sentry.utils.snuba.query", return_value={}) as query:
+                get_keys()
+                assert query.called
+
     def test_get_top_group_tag_values(self):
         resp = self.ts.get_top_group_tag_values(
             self.proj1.id, self.proj1group1.id, self.proj1env1.id, "foo", 1
@@ -212,6 +252,38 @@ class TagStorageTest(TestCase, SnubaTestCase):
         }
         assert set(keys) == expected_keys
 
+    def test_get_tag_keys_sampled_cache(self):
+        get_tag_keys_for_projects = self.ts._SnubaTagStorage__get_tag_keys_for_projects
+        with self.options({"snuba.tagstore.cache-tagkeys-rate": 1.0}):
+            keys = {
+                k.key: k
+                for k in self.ts.get_tag_keys(
+                    project_id=self.proj1.id,
+                    environment_id=self.proj1env1.id,
+                    include_values_seen=True,
+                )
+            }
+            # Queries without values_seen must not be served the cached entry above.
+            other = {
+                k.key: k
+                for k in self.ts.get_tag_keys_for_projects(
+                    [self.proj1.id], [self.proj1env1.id], start=None, end=None
+                )
+            }
+            limited = get_tag_keys_for_projects(
+                [self.proj1.id], None, [self.proj1env1.id], None, None, limit=1
+            )
+            unlimited = get_tag_keys_for_projects(
+                [self.proj1.id], None, [self.proj1env1.id], None, None, limit=1000
+            )
+
+        assert set(other) == set(keys)
+        assert keys["foo"].count == other["foo"].count == 2
+        assert keys["foo"].values_seen == 1
+        assert all(k.values_seen is None for k in other.values())
+        assert len(limited) == 1
+        assert {k.key for k in unlimited} == set(keys)
+
     def test_get_group_tag_key(self):
         with pytest.raises(GroupTagKeyNotFound):
             self.ts.get_group_tag_key(
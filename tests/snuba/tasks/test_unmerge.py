@@ -16,18 +16,20 @@ from sentry.models import Environment, Group, GroupHash, GroupRelease, Release,
 from sentry.similarity import _make_index_backend, features
 from sentry.tasks.merge import merge_groups
 from sentry.tasks.unmerge import (
+    collect_tsdb_data,
     get_caches,
     get_event_user_from_interface,
     get_fingerprint,
     get_group_backfill_attributes,
     get_group_creation_attributes,
+    get_tsdb_resolution,
     unmerge,
 )
 from sentry.testutils import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
 from sentry.testutils.helpers.features import with_feature
 from sentry.utils import redis
-from sentry.utils.dates import to_timestamp
+from sentry.utils.dates import to_datetime, to_timestamp
 
 # Use the default redis client as a cluster client in the similarity index
 index = _make_index_backend(redis.clusters.get("default").get_local_client(0))
@@ -165,6 +167,43 @@ class UnmergeTestCase(TestCase, SnubaTestCase):
             "first_release": None,
         }
 
+    def test_collect_tsdb_data(self):
+        resolution = get_tsdb_resolution()
+        now = to_datetime(
+            tsdb.normalize_to_epoch(before_now(minutes=5).replace(tzinfo=pytz.utc), resolution)
+        )
+
+        # Both events fall into the same bucket of every rollup.
+        events = [
+            self.store_event(
+                data={
+                    "message": "Hello world",
+                    "environment": "production",
+                    "user": {"id": i + 1},
+                    "timestamp": iso_format(now + timedelta(seconds=(resolution - 1) * i)),
+                },
+                project_id=self.project.id,
+            )
+            for i in range(2)
+        ]
+
+        (group_id,) = {event.group_id for event in events}
+        environment = Environment.objects.get(
+            organization_id=self.project.organization_id, name="production"
+        )
+
+        counters, sets, frequencies = collect_tsdb_data(get_caches(), self.project, events)
+
+        assert counters == {now: {tsdb.models.group: {(group_id, environment.id): 2}}}
+        assert sets == {
+            now: {
+                tsdb.models.users_affected_by_group: {(group_id, environment.id): {"id:1", "id:2"}}
+            }
+        }
+        assert frequencies == {
+            now: {tsdb.models.frequent_environments_by_group: {group_id: {environment.id: 2}}}
+        }
+
     @with_feature("projects:similarity-indexing")
     def test_unmerge(self):
         now = before_now(minutes=5).replace(microsecond=0, tzinfo=pytz.utc)